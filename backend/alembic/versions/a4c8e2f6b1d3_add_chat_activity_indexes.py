@@ -0,0 +1,30 @@
+"""add_chat_activity_indexes
+
+Revision ID: a4c8e2f6b1d3
+Revises: f7c3d1a9b2e6
+Create Date: 2026-10-17 15:12:08.437615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2f6b1d3'
+down_revision: Union[str, Sequence[str], None] = 'f7c3d1a9b2e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_chat_messages_session_id_created_at', 'chat_messages', ['session_id', 'created_at'], unique=False)
+    op.create_index('ix_chat_sessions_user_id', 'chat_sessions', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chat_sessions_user_id', table_name='chat_sessions')
+    op.drop_index('ix_chat_messages_session_id_created_at', table_name='chat_messages')
@@ -0,0 +1,40 @@
+"""add_user_activity_and_pick_source
+
+Revision ID: b8e4f2a6c9d1
+Revises: d4f9b3c7a2e8
+Create Date: 2026-10-18 10:24:13.402871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4f2a6c9d1'
+down_revision: Union[str, Sequence[str], None] = 'd4f9b3c7a2e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('last_active_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_users_last_active_at'), 'users', ['last_active_at'], unique=False)
+    op.add_column(
+        'todays_picks',
+        sa.Column('source', sa.String(), server_default='request', nullable=False),
+    )
+    # 배치 진행 기록이 가리키는 추천은 배치가 만든 것
+    op.execute(
+        "UPDATE todays_picks SET source = 'batch' "
+        "WHERE id IN (SELECT pick_id FROM todays_pick_batch_progress WHERE pick_id IS NOT NULL)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('todays_picks', 'source')
+    op.drop_index(op.f('ix_users_last_active_at'), table_name='users')
+    op.drop_column('users', 'last_active_at')
@@ -0,0 +1,28 @@
+"""add_chat_session_summary_until
+
+Revision ID: b9e3d7a1c5f2
+Revises: a4c8e2f6b1d3
+Create Date: 2026-10-17 15:48:31.902144
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e3d7a1c5f2'
+down_revision: Union[str, Sequence[str], None] = 'a4c8e2f6b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('chat_sessions', sa.Column('summary_until', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('chat_sessions', 'summary_until')
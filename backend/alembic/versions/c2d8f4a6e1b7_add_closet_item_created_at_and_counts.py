@@ -0,0 +1,47 @@
+"""add_closet_item_created_at_and_counts
+
+Revision ID: c2d8f4a6e1b7
+Revises: b9e3d7a1c5f2
+Create Date: 2026-10-17 16:22:09.531874
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d8f4a6e1b7'
+down_revision: Union[str, Sequence[str], None] = 'b9e3d7a1c5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows get the migration time; id breaks the tie in keyset order
+    op.add_column('closet_items', sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.create_index('ix_closet_items_user_id_created_at_id', 'closet_items', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_table(
+        'closet_category_counts',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('item_count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'category'),
+    )
+    op.execute(
+        """
+        INSERT INTO closet_category_counts (user_id, category, item_count)
+        SELECT user_id, category, COUNT(*) FROM closet_items GROUP BY user_id, category
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('closet_category_counts')
+    op.drop_index('ix_closet_items_user_id_created_at_id', table_name='closet_items')
+    op.drop_column('closet_items', 'created_at')
@@ -0,0 +1,102 @@
+"""add_closet_item_feature_vector
+
+Revision ID: d3e8a1f2b7c4
+Revises: c6f1f41c8389
+Create Date: 2026-10-17 10:12:31.502114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3e8a1f2b7c4'
+down_revision: Union[str, Sequence[str], None] = 'c6f1f41c8389'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of app.domains.wardrobe.features.encode_feature_vector as of this
+# revision, so later encoder changes don't alter what this migration writes.
+_SEASONS = ['spring', 'summer', 'fall', 'winter', 'all-season', 'transitional']
+_COLORS = [
+    'black', 'white', 'gray', 'navy', 'blue', 'skyblue', 'beige', 'brown',
+    'khaki', 'green', 'red', 'pink', 'purple', 'yellow', 'orange', 'cream',
+    'charcoal', 'ivory', 'camel', 'olive', 'wine', 'mint', 'silver', 'gold',
+    'lavender', 'mustard', 'denim', 'indigo', 'other', 'unknown',
+]
+_CATEGORIES = ['outer', 'top', 'bottom', 'onepiece', 'shoes', 'accessory']
+_BATCH_SIZE = 1000
+
+
+def _score(scores, key):
+    value = scores.get(key)
+    try:
+        return 0.5 if value is None else float(value)
+    except (TypeError, ValueError):
+        return 0.5
+
+
+def _encode_feature_vector(attributes, category):
+    attributes = attributes or {}
+    scores = attributes.get('scores') or {}
+
+    mask = 0
+    seasons = scores.get('season')
+    if isinstance(seasons, list):
+        for season in seasons:
+            if str(season).lower() in _SEASONS:
+                mask |= 1 << _SEASONS.index(str(season).lower())
+
+    color = attributes.get('color')
+    primary = str((color.get('primary') if isinstance(color, dict) else color) or '').lower()
+    color_code = _COLORS.index(primary) if primary in _COLORS else _COLORS.index('unknown')
+
+    category_raw = attributes.get('category')
+    main = category_raw.get('main') if isinstance(category_raw, dict) else category_raw
+    main = str(main or category or '').lower()
+    if main == 'outerwear':
+        main = 'outer'
+    category_code = _CATEGORIES.index(main) if main in _CATEGORIES else -1
+
+    return [
+        _score(scores, 'formality'),
+        _score(scores, 'warmth'),
+        _score(scores, 'versatility'),
+        float(mask),
+        float(color_code),
+        float(category_code),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'closet_items',
+        sa.Column('feature_vector', postgresql.ARRAY(sa.Float()), nullable=True),
+    )
+
+    # Backfill existing rows from the stored attribute tree (executemany per batch)
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text('SELECT id, category, features FROM closet_items')
+    ).fetchall()
+    update = sa.text(
+        'UPDATE closet_items SET feature_vector = :vector WHERE id = :id'
+    ).bindparams(sa.bindparam('vector', type_=postgresql.ARRAY(sa.Float())))
+    for start in range(0, len(rows), _BATCH_SIZE):
+        bind.execute(
+            update,
+            [
+                {'id': row.id, 'vector': _encode_feature_vector(row.features, row.category)}
+                for row in rows[start:start + _BATCH_SIZE]
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('closet_items', 'feature_vector')
@@ -0,0 +1,35 @@
+"""add_hot_path_composite_indexes
+
+Revision ID: d4f9b3c7a2e8
+Revises: c2d8f4a6e1b7
+Create Date: 2026-10-17 16:51:44.107392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f9b3c7a2e8'
+down_revision: Union[str, Sequence[str], None] = 'c2d8f4a6e1b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # todays_picks(user_id, created_at) 와 chat_messages(session_id, created_at) 는
+    # e5b2c9d4a6f1 / a4c8e2f6b1d3 에서 이미 생성됨
+    op.create_index('ix_closet_items_user_id_category', 'closet_items', ['user_id', 'category'], unique=False)
+    op.create_index('ix_chat_sessions_user_id_created_at', 'chat_sessions', ['user_id', 'created_at'], unique=False)
+    # (user_id, created_at) 의 접두사와 중복
+    op.drop_index('ix_chat_sessions_user_id', table_name='chat_sessions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_chat_sessions_user_id', 'chat_sessions', ['user_id'], unique=False)
+    op.drop_index('ix_chat_sessions_user_id_created_at', table_name='chat_sessions')
+    op.drop_index('ix_closet_items_user_id_category', table_name='closet_items')
@@ -0,0 +1,47 @@
+"""add_todays_pick_batch_progress
+
+Revision ID: e5b2c9d4a6f1
+Revises: d3e8a1f2b7c4
+Create Date: 2026-10-17 11:02:47.118235
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2c9d4a6f1'
+down_revision: Union[str, Sequence[str], None] = 'd3e8a1f2b7c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'todays_pick_batch_progress',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('run_date', sa.Date(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('region', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('pick_id', sa.UUID(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['pick_id'], ['todays_picks.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('run_date', 'user_id', name='uix_todays_pick_batch_user'),
+    )
+    op.create_index(op.f('ix_todays_pick_batch_progress_run_date'), 'todays_pick_batch_progress', ['run_date'], unique=False)
+    op.create_index('ix_todays_picks_user_id_created_at', 'todays_picks', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todays_picks_user_id_created_at', table_name='todays_picks')
+    op.drop_index(op.f('ix_todays_pick_batch_progress_run_date'), table_name='todays_pick_batch_progress')
+    op.drop_table('todays_pick_batch_progress')
@@ -0,0 +1,33 @@
+"""add_closet_item_image_hashes
+
+Revision ID: f7c3d1a9b2e6
+Revises: e5b2c9d4a6f1
+Create Date: 2026-10-17 14:05:47.218390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3d1a9b2e6'
+down_revision: Union[str, Sequence[str], None] = 'e5b2c9d4a6f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows stay NULL: their original upload bytes are not stored
+    op.add_column('closet_items', sa.Column('image_sha256', sa.String(length=64), nullable=True))
+    op.add_column('closet_items', sa.Column('image_dhash', sa.BigInteger(), nullable=True))
+    op.create_index('ix_closet_items_user_id_image_sha256', 'closet_items', ['user_id', 'image_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_closet_items_user_id_image_sha256', table_name='closet_items')
+    op.drop_column('closet_items', 'image_dhash')
+    op.drop_column('closet_items', 'image_sha256')
@@ -0,0 +1,3 @@
+"""
+LLM 호출 전에 쓰는 로컬 분류기 모듈
+"""
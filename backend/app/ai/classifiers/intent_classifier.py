@@ -0,0 +1,318 @@
+"""
+Local fast-path chat intent classifier (RECOMMEND vs GENERAL).
+
+``chat_intent_node`` asks this classifier first and only calls Gemini when
+the local confidence is below ``CHAT_INTENT_LOCAL_THRESHOLD``:
+
+1. Keyword / pattern rules for Korean and English.
+2. An optional character n-gram logistic regression model stored as JSON
+   (``CHAT_INTENT_MODEL_PATH``), trained offline with ``NgramIntentModel.fit``
+   on logged messages labelled by the LLM.
+
+Whenever both the local tier and the LLM have classified the same message
+(every low-confidence message, plus a ``CHAT_INTENT_AUDIT_RATE`` sample of
+confident ones) the agreement is counted per confidence bucket and logged, so
+the threshold can be tuned from production traffic.
+"""
+
+import json
+import logging
+import math
+import random
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+RECOMMEND = "RECOMMEND"
+GENERAL = "GENERAL"
+
+# 코디 추천 요청 패턴
+_RECOMMEND_PATTERNS = [
+    r"추천",
+    r"코디",
+    r"뭐\s*입",
+    r"뭘\s*입",
+    r"무엇을\s*입",
+    r"입을\s*까",
+    r"입으면\s*좋",
+    r"입고\s*갈",
+    r"어울리는\s*(옷|조합|룩)",
+    r"(오늘|내일|주말).{0,6}(옷|룩|착장|패션)",
+    r"(출근|데이트|하객|면접|여행|캠퍼스|오피스)\s*룩",
+    r"골라\s*(줘|주세요|줄래)",
+    r"\brecommend",
+    r"\bsuggest",
+    r"\boutfit",
+    r"what\s+(should|can|do)\s+i\s+wear",
+    r"what\s+to\s+wear",
+    r"\bwhat\s+should\s+i\s+put\s+on",
+    r"\bdress\s+for\b",
+    r"\bstyle\s+me\b",
+]
+
+# 일반 대화 패턴 (인사, 감사, 서비스 문의, 세탁/관리 질문 등)
+_GENERAL_PATTERNS = [
+    r"^(안녕|하이|헬로)",
+    r"고마워|감사합니다|감사해요|땡큐",
+    r"넌\s*누구|너는\s*누구|누구야",
+    r"(세탁|빨래|다림질|보관)\s*(법|방법|하는|어떻게)",
+    r"어떻게\s*(빨|세탁|보관)",
+    r"(앱|서비스)\s*(사용법|기능)",
+    r"^(hi|hello|hey)\b",
+    r"\bthank(s| you)\b",
+    r"\bwho\s+are\s+you\b",
+    r"\bhow\s+(do|should)\s+i\s+(wash|clean|store|iron)\b",
+]
+
+# 규칙 매칭 시 함께 추출하는 TPO 키워드
+_TPO_KEYWORDS = {
+    "출근": "출근",
+    "회사": "출근",
+    "오피스": "출근",
+    "데이트": "데이트",
+    "소개팅": "데이트",
+    "결혼식": "결혼식 하객",
+    "하객": "결혼식 하객",
+    "면접": "면접",
+    "여행": "여행",
+    "운동": "운동",
+    "등산": "등산",
+    "파티": "파티",
+    "work": "work",
+    "office": "work",
+    "date": "date",
+    "wedding": "wedding guest",
+    "interview": "interview",
+    "travel": "travel",
+    "party": "party",
+}
+
+_RECOMMEND_RE = [re.compile(p, re.IGNORECASE) for p in _RECOMMEND_PATTERNS]
+_GENERAL_RE = [re.compile(p, re.IGNORECASE) for p in _GENERAL_PATTERNS]
+# 영문 키워드는 단어 경계로만 매칭 ("update"/"candidate" -> date, "homework" -> work 방지),
+# 한글 키워드는 조사가 붙으므로 ("결혼식에") 부분 문자열로 매칭
+_TPO_RE = [
+    (re.compile(rf"\b{re.escape(k)}\b" if k.isascii() else re.escape(k)), tpo)
+    for k, tpo in _TPO_KEYWORDS.items()
+]
+
+
+@dataclass
+class IntentPrediction:
+    intent: str
+    confidence: float
+    source: str  # "rules" | "model" | "none"
+    tpo: Optional[str] = None
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", (text or "").strip().lower())
+
+
+def _extract_tpo(text: str) -> Optional[str]:
+    for pattern, tpo in _TPO_RE:
+        if pattern.search(text):
+            return tpo
+    return None
+
+
+def classify_by_rules(text: str) -> IntentPrediction:
+    """Pattern rules; confidence 0.5 means the rules could not decide."""
+    normalized = _normalize(text)
+    recommend_hits = sum(1 for p in _RECOMMEND_RE if p.search(normalized))
+    general_hits = sum(1 for p in _GENERAL_RE if p.search(normalized))
+    tpo = _extract_tpo(normalized)
+
+    if recommend_hits and not general_hits:
+        confidence = 0.95 if recommend_hits >= 2 or tpo else 0.9
+        return IntentPrediction(RECOMMEND, confidence, "rules", tpo)
+    if general_hits and not recommend_hits:
+        confidence = 0.9 if general_hits >= 2 else 0.85
+        return IntentPrediction(GENERAL, confidence, "rules")
+    if recommend_hits and general_hits:
+        # 예: "고마워, 내일 뭐 입을지 추천해줘" -> 추천 쪽이 우세하지만 애매함
+        intent = RECOMMEND if recommend_hits > general_hits else GENERAL
+        return IntentPrediction(intent, 0.6, "rules", tpo)
+    return IntentPrediction(GENERAL, 0.5, "none")
+
+
+class NgramIntentModel:
+    """Logistic regression over character n-grams, stored as plain JSON."""
+
+    def __init__(
+        self,
+        weights: Dict[str, float],
+        bias: float = 0.0,
+        ngram_range: Tuple[int, int] = (1, 3),
+    ):
+        self.weights = weights
+        self.bias = bias
+        self.ngram_range = ngram_range
+
+    def features(self, text: str) -> List[str]:
+        normalized = f" {_normalize(text)} "
+        low, high = self.ngram_range
+        return [
+            normalized[i : i + n]
+            for n in range(low, high + 1)
+            for i in range(len(normalized) - n + 1)
+        ]
+
+    def predict_proba(self, text: str) -> float:
+        """P(RECOMMEND | text)."""
+        return self._proba_from_features(self.features(text))
+
+    def predict(self, text: str) -> IntentPrediction:
+        p = self.predict_proba(text)
+        if p >= 0.5:
+            return IntentPrediction(RECOMMEND, p, "model", _extract_tpo(_normalize(text)))
+        return IntentPrediction(GENERAL, 1.0 - p, "model")
+
+    @classmethod
+    def fit(
+        cls,
+        samples: Iterable[Tuple[str, str]],
+        epochs: int = 20,
+        learning_rate: float = 0.1,
+        l2: float = 1e-4,
+        ngram_range: Tuple[int, int] = (1, 3),
+    ) -> "NgramIntentModel":
+        """Train with plain SGD on (text, intent) pairs."""
+        model = cls({}, 0.0, ngram_range)
+        data = [
+            (model.features(text), 1.0 if intent == RECOMMEND else 0.0)
+            for text, intent in samples
+        ]
+        weights: Dict[str, float] = defaultdict(float)
+        model.weights = weights
+        for _ in range(epochs):
+            random.shuffle(data)
+            for feats, label in data:
+                error = model._proba_from_features(feats) - label
+                model.bias -= learning_rate * error
+                for f in feats:
+                    weights[f] -= learning_rate * (error + l2 * weights[f])
+        model.weights = {f: round(w, 6) for f, w in weights.items() if abs(w) > 1e-4}
+        return model
+
+    def _proba_from_features(self, feats: List[str]) -> float:
+        score = self.bias + sum(self.weights.get(f, 0.0) for f in feats)
+        return 1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, score))))
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "ngram_range": list(self.ngram_range),
+                    "bias": self.bias,
+                    "weights": self.weights,
+                },
+                f,
+                ensure_ascii=False,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "NgramIntentModel":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            weights=data["weights"],
+            bias=data.get("bias", 0.0),
+            ngram_range=tuple(data.get("ngram_range", (1, 3))),
+        )
+
+
+class LocalIntentClassifier:
+    """Rules + optional model in front of the LLM, with agreement statistics."""
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        model_path: str = "",
+        audit_rate: float = 0.0,
+        log_every: int = 50,
+    ):
+        self.threshold = threshold
+        self.audit_rate = audit_rate
+        self.log_every = max(1, log_every)
+        self.model: Optional[NgramIntentModel] = None
+        if model_path:
+            try:
+                self.model = NgramIntentModel.load(model_path)
+                logger.info(f"Intent model loaded from {model_path}")
+            except Exception as e:
+                logger.warning(f"Intent model not loaded ({model_path}): {e}")
+
+        self._lock = threading.Lock()
+        self.local_decisions = 0
+        self.llm_calls = 0
+        # 신뢰도 구간(0.1 단위)별 [비교 수, 일치 수]
+        self._agreement: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+
+    def classify(self, text: str) -> IntentPrediction:
+        prediction = classify_by_rules(text)
+        if self.model is not None and prediction.confidence < self.threshold:
+            model_prediction = self.model.predict(text)
+            if model_prediction.confidence > prediction.confidence:
+                prediction = model_prediction
+        return prediction
+
+    def is_confident(self, prediction: IntentPrediction) -> bool:
+        return prediction.confidence >= self.threshold
+
+    def should_audit(self) -> bool:
+        return self.audit_rate > 0 and random.random() < self.audit_rate
+
+    def record_local_decision(self) -> None:
+        with self._lock:
+            self.local_decisions += 1
+
+    def record_agreement(self, prediction: IntentPrediction, llm_intent: str) -> None:
+        """Count whether the local tier agreed with the LLM for this message."""
+        bucket = f"{min(int(prediction.confidence * 10), 9) / 10:.1f}"
+        agreed = prediction.intent == llm_intent
+        with self._lock:
+            self.llm_calls += 1
+            counts = self._agreement[bucket]
+            counts[0] += 1
+            counts[1] += int(agreed)
+            compared = sum(c[0] for c in self._agreement.values())
+        if not agreed:
+            logger.info(
+                f"Intent disagreement: local={prediction.intent} "
+                f"({prediction.source}, {prediction.confidence:.2f}) llm={llm_intent}"
+            )
+        if compared % self.log_every == 0:
+            logger.info(f"Intent classifier agreement: {self.stats()}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = {
+                bucket: {
+                    "compared": compared,
+                    "agreement": round(agreed / compared, 4) if compared else 0.0,
+                }
+                for bucket, (compared, agreed) in sorted(self._agreement.items())
+            }
+            total = self.local_decisions + self.llm_calls
+            return {
+                "threshold": self.threshold,
+                "model_loaded": self.model is not None,
+                "local_decisions": self.local_decisions,
+                "llm_calls": self.llm_calls,
+                "local_rate": round(self.local_decisions / total, 4) if total else 0.0,
+                "agreement_by_confidence": buckets,
+            }
+
+
+local_intent_classifier = LocalIntentClassifier(
+    threshold=Config.CHAT_INTENT_LOCAL_THRESHOLD,
+    model_path=Config.CHAT_INTENT_MODEL_PATH,
+    audit_rate=Config.CHAT_INTENT_AUDIT_RATE,
+)
@@ -1,10 +1,16 @@
+import asyncio
 import logging
-from typing import List, Optional
+import weakref
+from typing import Any, AsyncIterator, Callable, List, Optional
 
+import httpx
 from google import genai
 from google.genai import types
 
 from app.core.config import Config
+from app.utils.image_preprocess import detect_mime_type
+
+from .response_cache import response_cache, response_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -14,85 +20,262 @@ class GeminiClient:
 
     def __init__(self):
         Config.check_api_key()
-        self.client = genai.Client(api_key=Config.GEMINI_API_KEY)
+        # 비동기 호출은 keep-alive 커넥션 풀을 공유하는 httpx 트랜스포트 사용
+        self.client = genai.Client(
+            api_key=Config.GEMINI_API_KEY,
+            http_options=types.HttpOptions(
+                async_client_args={
+                    "transport": httpx.AsyncHTTPTransport(
+                        limits=httpx.Limits(
+                            max_connections=Config.GEMINI_MAX_CONNECTIONS,
+                            max_keepalive_connections=Config.GEMINI_MAX_CONNECTIONS,
+                        )
+                    )
+                }
+            ),
+        )
+        # 이벤트 루프별 동시 호출 제한 세마포어
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         self.model_name = Config.GEMINI_MODEL
         self.vision_model = Config.GEMINI_VISION_MODEL
         logger.info(
             f"GeminiClient initialized. (Key exists: {bool(Config.GEMINI_API_KEY)})"
         )
 
-    def generate_content(
+    def _build_contents(
         self,
         prompt: str,
         images: Optional[List[bytes]] = None,
         image_bytes: Optional[bytes] = None,
-        model_override: Optional[str] = None,
+    ) -> List[types.Part | str]:
+        parts: List[types.Part | str] = []
+        if image_bytes:
+            parts.append(
+                types.Part.from_bytes(
+                    data=image_bytes, mime_type=detect_mime_type(image_bytes)
+                )
+            )
+
+        if images:
+            for img in images:
+                parts.append(
+                    types.Part.from_bytes(data=img, mime_type=detect_mime_type(img))
+                )
+
+        parts.append(prompt)
+        return parts
+
+    def _generation_params(self, **kwargs) -> dict:
+        return {
+            "temperature": kwargs.get("temperature", 0.4),
+            "max_output_tokens": kwargs.get("max_output_tokens", 2048),
+        }
+
+    def _cache_key(
+        self,
+        model: str,
+        prompt: str,
+        images: Optional[List[bytes]],
+        image_bytes: Optional[bytes],
         **kwargs,
     ) -> str:
+        attached = ([image_bytes] if image_bytes else []) + list(images or [])
+        return response_cache_key(
+            model, prompt, self._generation_params(**kwargs), attached
+        )
+
+    def _build_config(self, **kwargs) -> types.GenerateContentConfig:
+        # 안전 설정 해제 및 설정 강화
+        return types.GenerateContentConfig(
+            **self._generation_params(**kwargs),
+            # 옷 분석을 방해할 수 있는 안전 필터 최소화
+            safety_settings=[
+                types.SafetySetting(
+                    category="HARM_CATEGORY_HARASSMENT",
+                    threshold="BLOCK_NONE",
+                ),
+                types.SafetySetting(
+                    category="HARM_CATEGORY_HATE_SPEECH",
+                    threshold="BLOCK_NONE",
+                ),
+                types.SafetySetting(
+                    category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
+                    threshold="BLOCK_NONE",
+                ),
+                types.SafetySetting(
+                    category="HARM_CATEGORY_DANGEROUS_CONTENT",
+                    threshold="BLOCK_NONE",
+                ),
+            ],
+        )
+
+    def _extract_text(self, response: Any) -> str:
+        # 응답 텍스트 추출 시도
         try:
-            parts: List[types.Part | str] = []
-            if image_bytes:
-                parts.append(
-                    types.Part.from_bytes(data=image_bytes, mime_type="image/jpeg")
-                )
+            if response.text:
+                return response.text
 
-            if images:
-                for img in images:
-                    parts.append(
-                        types.Part.from_bytes(data=img, mime_type="image/jpeg")
-                    )
+            # 텍스트가 없으면 차단 사유 확인
+            if response.candidates and response.candidates[0].finish_reason:
+                reason = response.candidates[0].finish_reason
+                logger.warning(f"Gemini Finish Reason: {reason}")
 
-            parts.append(prompt)
+            return ""
+        except ValueError:
+            # 안전 필터 등에 의해 text 속성 접근 차단 시 발생
+            logger.error(
+                "Gemini context was blocked by safety filters or empty response."
+            )
+            return ""
 
-            target_model = model_override or self.model_name
+    def generate_content(
+        self,
+        prompt: str,
+        images: Optional[List[bytes]] = None,
+        image_bytes: Optional[bytes] = None,
+        model_override: Optional[str] = None,
+        cache: bool = True,
+        cache_if: Optional[Callable[[str], bool]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        동기 호출
 
-            # 안전 설정 해제 및 설정 강화
+        같은 모델/프롬프트/생성 설정/이미지 요청은 응답 캐시를 재사용합니다.
+        매번 다른 답이 필요한 창작성 호출은 cache=False로 호출하세요.
+        cache_if가 주어지면 이를 통과한 응답만 저장합니다 (검증에 실패한
+        응답이 캐시되어 재시도마다 같은 오답이 반환되지 않도록).
+        """
+        model = model_override or self.model_name
+        key = None
+        if cache and response_cache.enabled:
+            key = self._cache_key(model, prompt, images, image_bytes, **kwargs)
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached
+        try:
             response = self.client.models.generate_content(
-                model=target_model,
-                contents=parts,
-                config=types.GenerateContentConfig(
-                    temperature=kwargs.get("temperature", 0.4),
-                    max_output_tokens=kwargs.get("max_output_tokens", 2048),
-                    # 옷 분석을 방해할 수 있는 안전 필터 최소화
-                    safety_settings=[
-                        types.SafetySetting(
-                            category="HARM_CATEGORY_HARASSMENT",
-                            threshold="BLOCK_NONE",
-                        ),
-                        types.SafetySetting(
-                            category="HARM_CATEGORY_HATE_SPEECH",
-                            threshold="BLOCK_NONE",
-                        ),
-                        types.SafetySetting(
-                            category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                            threshold="BLOCK_NONE",
-                        ),
-                        types.SafetySetting(
-                            category="HARM_CATEGORY_DANGEROUS_CONTENT",
-                            threshold="BLOCK_NONE",
-                        ),
-                    ],
-                ),
+                model=model,
+                contents=self._build_contents(prompt, images, image_bytes),
+                config=self._build_config(**kwargs),
             )
+            text = self._extract_text(response)
+            if key and text and (cache_if is None or cache_if(text)):
+                response_cache.set(key, text)
+            return text
+
+        except Exception as e:
+            logger.error(f"Gemini API Error: {type(e).__name__}: {str(e)}")
+            raise
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # asyncio.Semaphore는 이벤트 루프에 묶이므로 루프별로 하나씩 유지
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(Config.GEMINI_MAX_CONCURRENCY)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def generate_content_async(
+        self,
+        prompt: str,
+        images: Optional[List[bytes]] = None,
+        image_bytes: Optional[bytes] = None,
+        model_override: Optional[str] = None,
+        timeout: Optional[float] = None,
+        cache: bool = True,
+        cache_if: Optional[Callable[[str], bool]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        이벤트 루프를 막지 않는 비동기 호출
 
-            # 응답 텍스트 추출 시도
-            try:
-                if response.text:
-                    return response.text
-
-                # 텍스트가 없으면 차단 사유 확인
-                if response.candidates and response.candidates[0].finish_reason:
-                    reason = response.candidates[0].finish_reason
-                    logger.warning(f"Gemini Finish Reason: {reason}")
-
-                return ""
-            except ValueError:
-                # 안전 필터 등에 의해 text 속성 접근 차단 시 발생
-                logger.error(
-                    "Gemini context was blocked by safety filters or empty response."
+        이벤트 루프별 동시 비동기 호출 수는 GEMINI_MAX_CONCURRENCY로 제한되며
+        (API 프로세스는 루프가 하나이므로 프로세스 단위 제한과 같음, 동기
+        generate_content 호출은 제한 대상이 아님),
+        대기 시간을 제외한 호출 시간이 timeout(기본 GEMINI_TIMEOUT_SECONDS)을
+        넘으면 asyncio.TimeoutError를 발생시킵니다.
+        응답 캐시와 cache_if 규칙은 generate_content와 공유합니다 (cache=False로 우회).
+        """
+        timeout = timeout if timeout is not None else Config.GEMINI_TIMEOUT_SECONDS
+        model = model_override or self.model_name
+        key = None
+        if cache and response_cache.enabled:
+            key = self._cache_key(model, prompt, images, image_bytes, **kwargs)
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached
+        try:
+            async with self._get_semaphore():
+                response = await asyncio.wait_for(
+                    self.client.aio.models.generate_content(
+                        model=model,
+                        contents=self._build_contents(prompt, images, image_bytes),
+                        config=self._build_config(**kwargs),
+                    ),
+                    timeout=timeout,
                 )
-                return ""
+            text = self._extract_text(response)
+            if key and text and (cache_if is None or cache_if(text)):
+                response_cache.set(key, text)
+            return text
 
+        except asyncio.TimeoutError:
+            logger.error(f"Gemini API Timeout after {timeout}s")
+            raise
+        except Exception as e:
+            logger.error(f"Gemini API Error: {type(e).__name__}: {str(e)}")
+            raise
+
+    async def stream_content_async(
+        self,
+        prompt: str,
+        images: Optional[List[bytes]] = None,
+        image_bytes: Optional[bytes] = None,
+        model_override: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        스트리밍 호출: 생성되는 텍스트 조각을 도착하는 즉시 yield
+
+        동시 호출 제한(GEMINI_MAX_CONCURRENCY)은 스트림이 끝날 때까지 유지되며,
+        timeout(기본 GEMINI_TIMEOUT_SECONDS)은 조각 사이의 최대 대기 시간입니다.
+        스트리밍 응답은 응답 캐시를 사용하지 않습니다.
+        """
+        timeout = timeout if timeout is not None else Config.GEMINI_TIMEOUT_SECONDS
+        model = model_override or self.model_name
+        try:
+            async with self._get_semaphore():
+                stream = await asyncio.wait_for(
+                    self.client.aio.models.generate_content_stream(
+                        model=model,
+                        contents=self._build_contents(prompt, images, image_bytes),
+                        config=self._build_config(**kwargs),
+                    ),
+                    timeout=timeout,
+                )
+                iterator = stream.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            iterator.__anext__(), timeout=timeout
+                        )
+                    except StopAsyncIteration:
+                        break
+                    try:
+                        text = chunk.text
+                    except ValueError:
+                        # 안전 필터로 차단된 조각
+                        logger.warning("Gemini stream chunk blocked by safety filters.")
+                        continue
+                    if text:
+                        yield text
+
+        except asyncio.TimeoutError:
+            logger.error(f"Gemini API stream timeout after {timeout}s")
+            raise
         except Exception as e:
             logger.error(f"Gemini API Error: {type(e).__name__}: {str(e)}")
             raise
@@ -103,5 +286,13 @@ class GeminiClient:
             prompt, image_bytes=image_bytes, model_override=self.vision_model, **kwargs
         )
 
+    async def generate_with_vision_async(
+        self, prompt: str, image_bytes: bytes, **kwargs
+    ) -> str:
+        """비전 전용 모델 비동기 요청"""
+        return await self.generate_content_async(
+            prompt, image_bytes=image_bytes, model_override=self.vision_model, **kwargs
+        )
+
 
 gemini_client = GeminiClient()
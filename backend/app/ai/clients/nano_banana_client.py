@@ -307,7 +307,7 @@ class NanoBananaClient:
 
             image_bytes, mime_type = extracted
 
-            from app.domains.wardrobe.service import wardrobe_manager
+            from app.core.storage import storage
             from datetime import datetime
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -321,8 +321,8 @@ class NanoBananaClient:
 
             file_path = f"todays-picks/{safe_user_id}_{timestamp}{ext}"
 
-            if not wardrobe_manager.supabase:
-                logger.error("Supabase client not available for upload")
+            if not storage.available:
+                logger.error("Storage backend not available for upload")
                 return None
 
             try:
@@ -330,15 +330,7 @@ class NanoBananaClient:
                     f"Uploading generated image to Supabase: {file_path} ({mime_type}), size: {len(image_bytes)} bytes"
                 )
 
-                upload_response = wardrobe_manager.supabase.storage.from_(
-                    wardrobe_manager.bucket_name
-                ).upload(
-                    path=file_path,
-                    file=image_bytes,
-                    file_options={"content-type": mime_type},
-                )
-
-                logger.info(f"Upload response: {upload_response}")
+                storage.upload(file_path, image_bytes, mime_type)
 
                 return file_path
 
@@ -0,0 +1,102 @@
+"""
+Content-addressed cache for Gemini text responses.
+
+Deterministic prompts (Today's Pick reasoning, intent classification) are
+often sent again with identical inputs after a regenerate or from chat. The
+key is a SHA-256 of the model, the prompt, the generation config and the
+digests of any attached images, so identical requests share one entry.
+Entries expire after a TTL and the cache is bounded with LRU eviction.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def response_cache_key(
+    model: str,
+    prompt: str,
+    config: Dict[str, Any],
+    images: Iterable[bytes] = (),
+) -> str:
+    digest = hashlib.sha256()
+    digest.update(model.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(prompt.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+    for image in images:
+        digest.update(b"\x00")
+        digest.update(hashlib.sha256(image).digest())
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """TTL + LRU cache of response texts (thread-safe)."""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+response_cache = ResponseCache(
+    max_entries=Config.GEMINI_RESPONSE_CACHE_SIZE,
+    ttl_seconds=Config.GEMINI_RESPONSE_CACHE_TTL_SECONDS,
+)
@@ -6,19 +6,23 @@ from langgraph.graph import StateGraph, END
 
 from app.ai.schemas.workflow_state import ChatState
 from app.ai.clients.gemini_client import gemini_client
+from app.ai.classifiers.intent_classifier import local_intent_classifier
 from app.utils.json_parser import parse_json_from_text
 from app.llm.todays_pick_service import recommend_todays_pick_v2
 from app.domains.weather.service import weather_service
 
 logger = logging.getLogger(__name__)
 
+CHAT_ERROR_RESPONSE = "二꾩넚?⑸땲?? ?좎떆 ???ㅼ떆 ?쒕룄??二쇱꽭??"
 
-def _format_recent_history(messages: List[Dict[str, Any]], limit: int = 8) -> str:
+
+def _format_recent_history(messages: List[Dict[str, Any]]) -> str:
+    # 메시지 수 제한은 _prepare_chat 에서 (요약되지 않은 메시지 전부, prompt_limit 이하)
     if not messages:
         return "(no prior conversation)"
 
     lines: List[str] = []
-    for msg in messages[-limit:]:
+    for msg in messages:
         role = str(msg.get("role") or msg.get("sender") or "user").lower()
         content = str(msg.get("content") or msg.get("text") or "").strip()
         if not content:
@@ -29,10 +33,40 @@ def _format_recent_history(messages: List[Dict[str, Any]], limit: int = 8) -> st
     return "\n".join(lines) if lines else "(no prior conversation)"
 
 
-def chat_intent_node(state: ChatState) -> ChatState:
-    """Analyze whether user asks for recommendation or general chat."""
+def _format_conversation(state: ChatState) -> str:
+    """Long-term session summary (if any) followed by every unsummarized message."""
+    history_text = _format_recent_history(state.get("messages", []))
+    summary = (state.get("context") or {}).get("session_summary")
+    if not summary:
+        return history_text
+    return f"Summary of earlier conversation:\n{summary}\n\nRecent messages:\n{history_text}"
+
+
+async def chat_intent_node(state: ChatState) -> ChatState:
+    """
+    Analyze whether user asks for recommendation or general chat.
+
+    The local classifier (rules / optional model) decides on its own when it
+    is confident enough; otherwise, or for a small audit sample, Gemini is
+    asked and its answer is compared with the local one.
+    """
     user_query = state.get("user_query", "")
-    history_text = _format_recent_history(state.get("messages", []), limit=6)
+    local = local_intent_classifier.classify(user_query)
+    if (
+        local_intent_classifier.is_confident(local)
+        and not local_intent_classifier.should_audit()
+    ):
+        local_intent_classifier.record_local_decision()
+        state["context"]["intent"] = local.intent
+        state["context"]["intent_source"] = local.source
+        state["context"]["tpo"] = local.tpo
+        state["context"]["special_request"] = (
+            user_query if local.intent == "RECOMMEND" else None
+        )
+        state["context"]["is_recommendation_request"] = local.intent == "RECOMMEND"
+        return state
+
+    history_text = _format_conversation(state)
 
     prompt = f"""
 You are a fashion assistant intent classifier.
@@ -55,12 +89,16 @@ Return only JSON in this schema:
 """
 
     try:
-        response_text = gemini_client.generate_content(
+        response_text = await gemini_client.generate_content_async(
             prompt, temperature=0, max_output_tokens=800
         )
         parsed, _ = parse_json_from_text(response_text)
 
+        state["context"]["intent_source"] = "llm"
         if parsed:
+            local_intent_classifier.record_agreement(
+                local, parsed.get("intent", "GENERAL")
+            )
             state["context"]["intent"] = parsed.get("intent", "GENERAL")
             state["context"]["tpo"] = parsed.get("tpo_context")
             state["context"]["special_request"] = parsed.get("special_request")
@@ -68,40 +106,45 @@ Return only JSON in this schema:
                 parsed.get("intent") == "RECOMMEND"
             )
         else:
-            state["context"]["intent"] = "GENERAL"
+            state["context"]["intent"] = local.intent
 
     except Exception as e:
         logger.error(f"Chat intent analysis error: {e}")
-        state["context"]["intent"] = "GENERAL"
+        # LLM 실패 시 확신이 낮더라도 로컬 판정을 사용 (판정 불가면 GENERAL)
+        state["context"]["intent"] = local.intent
 
     return state
 
 
-def generate_chat_response_node(state: ChatState) -> ChatState:
-    """Generate general chat response."""
+def build_chat_response_prompt(state: ChatState) -> str:
+    """Prompt for the general chat answer (shared by the node and the SSE stream)."""
     user_query = state.get("user_query", "")
-    messages = state.get("messages", [])
 
     system_prompt = (
         "You are MyClo, a practical fashion AI assistant. "
         "Keep replies concise, helpful, and context-aware."
     )
 
-    history_text = _format_recent_history(messages, limit=8)
-    prompt = (
+    history_text = _format_conversation(state)
+    return (
         f"{system_prompt}\n\n"
         f"Conversation so far:\n{history_text}\n\n"
         f"User: {user_query}\n"
         "Assistant:"
     )
 
+
+async def generate_chat_response_node(state: ChatState) -> ChatState:
+    """Generate general chat response."""
+    prompt = build_chat_response_prompt(state)
+
     try:
-        response = gemini_client.generate_content(
-            prompt, temperature=0.7, max_output_tokens=800
+        response = await gemini_client.generate_content_async(
+            prompt, temperature=0.7, max_output_tokens=800, cache=False
         )
         state["response"] = response
     except Exception:
-        state["response"] = "二꾩넚?⑸땲?? ?좎떆 ???ㅼ떆 ?쒕룄??二쇱꽭??"
+        state["response"] = CHAT_ERROR_RESPONSE
 
     return state
 
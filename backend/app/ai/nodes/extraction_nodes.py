@@ -15,6 +15,7 @@ from app.ai.prompts.extraction_prompts import (
 from app.utils.json_parser import parse_dict_from_text
 from app.utils.validators import validate_schema
 from app.utils.helpers import normalize
+from app.utils.image_preprocess import prepare_image_for_vision
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +25,15 @@ def _as_state(value: Dict[str, object]) -> ExtractionState:
 
 
 def preprocess_image_node(state: ExtractionState) -> ExtractionState:
-    """이미지 전처리 노드"""
-    # 이미지는 이미 bytes로 들어오므로 추가 전처리 없음
-    # 필요시 여기서 이미지 검증 등 수행
-    return state
+    """이미지 전처리 노드 (EXIF 회전 보정 / 축소 / 재인코딩)"""
+    prepared = prepare_image_for_vision(state["image_bytes"])
+    logger.info(
+        f"Image prepared: {prepared.original_bytes} -> {len(prepared.data)} bytes "
+        f"({prepared.mime_type}, {prepared.width}x{prepared.height})"
+    )
+    new_state = dict(state)
+    new_state["image_bytes"] = prepared.data
+    return _as_state(new_state)
 
 
 def call_gemini_vision_node(state: ExtractionState) -> ExtractionState:
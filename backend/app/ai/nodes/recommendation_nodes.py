@@ -21,28 +21,49 @@ logger = logging.getLogger(__name__)
 
 def generate_candidates_node(state: RecommendationState) -> RecommendationState:
     """후보 코디 조합 생성 노드 (규칙 기반)"""
-    # recommender 위치 변경(도메인 구조) 하위호환
-    from app.domains.recommendation.service import recommender
+    from app.domains.recommendation.outfit_search import (
+        outfit_temperature,
+        select_top_outfits,
+    )
 
     tops = state.get("tops", [])
     bottoms = state.get("bottoms", [])
+    if not tops or not bottoms:
+        state["candidates"] = []
+        return state
 
-    candidates = []
-    for top in tops:
-        for bottom in bottoms:
-            score, reasons = recommender.calculate_outfit_score(top, bottom)
-            candidates.append(
-                {"top": top, "bottom": bottom, "score": score, "reasons": reasons}
-            )
-
-    # 점수 순으로 정렬
-    candidates.sort(key=lambda x: x["score"], reverse=True)
+    # 격식/시즌 버킷 인덱스로 상위 후보만 선택 (LLM에 전달할 후보 수 제한)
+    # 기온이 낮으면 아우터까지 포함한 3피스 조합을 탐색
+    user_id = state.get("metadata", {}).get("user_id")
+    state["candidates"] = select_top_outfits(
+        tops,
+        bottoms,
+        state.get("outers") or [],
+        k=10,
+        temperature=outfit_temperature(state.get("weather_info")),
+        user_id=None if user_id in (None, "unknown") else user_id,
+    )
+    return state
 
-    # 상위 후보만 선택 (LLM에 전달할 후보 수 제한)
-    top_candidates = candidates[: min(10, len(candidates))]
 
-    state["candidates"] = top_candidates
-    return state
+def _summarize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """LLM 프롬프트용 아이템 요약"""
+    attrs = item.get("attributes", {})
+    if not isinstance(attrs, dict):
+        return {
+            "id": item.get("id"),
+            "cat": "unknown",
+            "col": "unknown",
+            "style": [],
+            "form": 0.5,
+        }
+    return {
+        "id": item.get("id"),
+        "cat": (attrs.get("category") or {}).get("sub", "unknown"),
+        "col": (attrs.get("color") or {}).get("primary", "unknown"),
+        "style": (attrs.get("style_tags") or [])[:3],
+        "form": round((attrs.get("scores") or {}).get("formality", 0.5), 2),
+    }
 
 
 def prepare_llm_input_node(state: RecommendationState) -> RecommendationState:
@@ -51,87 +72,26 @@ def prepare_llm_input_node(state: RecommendationState) -> RecommendationState:
     if not candidates:
         return state
 
-    # 후보에서 상의/하의 요약 정보 추출
-    tops_summary = []
-    bottoms_summary = []
-    candidate_tops = {}
-    candidate_bottoms = {}
+    # 후보에서 상의/하의/아우터 요약 정보 추출
+    summaries: Dict[str, List[Dict[str, Any]]] = {"top": [], "bottom": [], "outer": []}
+    seen: Dict[str, Dict[Any, Dict[str, Any]]] = {"top": {}, "bottom": {}, "outer": {}}
 
     for candidate in candidates:
-        top = candidate["top"]
-        bottom = candidate["bottom"]
-        top_id = top.get("id")
-        bottom_id = bottom.get("id")
-
-        if top_id not in candidate_tops:
-            attrs = top.get("attributes", {})
-            candidate_tops[top_id] = top
-            tops_summary.append(
-                {
-                    "id": top_id,
-                    "cat": (
-                        (attrs.get("category") or {}).get("sub", "unknown")
-                        if isinstance(attrs, dict)
-                        else "unknown"
-                    ),
-                    "col": (
-                        (attrs.get("color") or {}).get("primary", "unknown")
-                        if isinstance(attrs, dict)
-                        else "unknown"
-                    ),
-                    "style": (
-                        (attrs.get("style_tags") or [])[:3]
-                        if isinstance(attrs, dict)
-                        else []
-                    ),
-                    "form": round(
-                        (
-                            (attrs.get("scores") or {}).get("formality", 0.5)
-                            if isinstance(attrs, dict)
-                            else 0.5
-                        ),
-                        2,
-                    ),
-                }
-            )
-
-        if bottom_id not in candidate_bottoms:
-            attrs = bottom.get("attributes", {})
-            candidate_bottoms[bottom_id] = bottom
-            bottoms_summary.append(
-                {
-                    "id": bottom_id,
-                    "cat": (
-                        (attrs.get("category") or {}).get("sub", "unknown")
-                        if isinstance(attrs, dict)
-                        else "unknown"
-                    ),
-                    "col": (
-                        (attrs.get("color") or {}).get("primary", "unknown")
-                        if isinstance(attrs, dict)
-                        else "unknown"
-                    ),
-                    "style": (
-                        (attrs.get("style_tags") or [])[:3]
-                        if isinstance(attrs, dict)
-                        else []
-                    ),
-                    "form": round(
-                        (
-                            (attrs.get("scores") or {}).get("formality", 0.5)
-                            if isinstance(attrs, dict)
-                            else 0.5
-                        ),
-                        2,
-                    ),
-                }
-            )
+        for role in ("top", "bottom", "outer"):
+            item = candidate.get(role)
+            if not item or item.get("id") in seen[role]:
+                continue
+            seen[role][item.get("id")] = item
+            summaries[role].append(_summarize_item(item))
 
     state["metadata"] = {
-        "tops_summary": tops_summary,
-        "bottoms_summary": bottoms_summary,
-        "candidate_tops": candidate_tops,
-        "candidate_bottoms": candidate_bottoms,
+        **state.get("metadata", {}),
+        "tops_summary": summaries["top"],
+        "bottoms_summary": summaries["bottom"],
+        "outer_summary": summaries["outer"],
+        "candidate_tops": seen["top"],
+        "candidate_bottoms": seen["bottom"],
+        "candidate_outers": seen["outer"],
     }
 
     return state
@@ -142,6 +102,7 @@ def call_llm_node(state: RecommendationState) -> RecommendationState:
     metadata = state.get("metadata", {})
     tops_summary = metadata.get("tops_summary", [])
     bottoms_summary = metadata.get("bottoms_summary", [])
+    outer_summary = metadata.get("outer_summary", [])
     count = state.get("count", 1)
     user_request = state.get("user_request")
     weather_info = state.get("weather_info")
@@ -150,13 +111,14 @@ def call_llm_node(state: RecommendationState) -> RecommendationState:
         return state
 
     try:
-        # TPO/날씨 정보가 있으면 해당 프롬프트 사용
-        if user_request or weather_info:
+        # TPO/날씨 정보나 아우터 후보가 있으면 해당 프롬프트 사용
+        if user_request or weather_info or outer_summary:
             prompt = build_tpo_recommendation_prompt(
                 user_request=user_request or "",
                 weather_info=weather_info or {},
                 tops_summary=tops_summary,
                 bottoms_summary=bottoms_summary,
+                outer_summary=outer_summary,
                 count=count,
             )
         else:
@@ -164,8 +126,9 @@ def call_llm_node(state: RecommendationState) -> RecommendationState:
                 tops_summary=tops_summary, bottoms_summary=bottoms_summary, count=count
             )
 
+        # 다시 요청하면 다른 조합을 받아야 하므로 응답 캐시 미사용
         response_text = gemini_client.generate_content(
-            prompt, temperature=0.7, max_output_tokens=1000
+            prompt, temperature=0.7, max_output_tokens=1000, cache=False
         )
 
         # JSON 파싱
@@ -196,14 +159,19 @@ def process_llm_results_node(state: RecommendationState) -> RecommendationState:
     metadata = state.get("metadata", {})
     candidate_tops = metadata.get("candidate_tops", {})
     candidate_bottoms = metadata.get("candidate_bottoms", {})
+    candidate_outers = metadata.get("candidate_outers", {})
     tops = state.get("tops", [])
     bottoms = state.get("bottoms", [])
+    outers = state.get("outers", []) or []
 
     final_outfits = []
 
     for rec in llm_recommendations:
-        top_id = rec.get("top_id")
-        bottom_id = rec.get("bottom_id")
+        # TPO 프롬프트는 {"combination": {...}} 형태로 ID를 반환
+        ids = rec.get("combination") if isinstance(rec.get("combination"), dict) else rec
+        top_id = ids.get("top_id")
+        bottom_id = ids.get("bottom_id")
+        outer_id = ids.get("outer_id")
 
         # 후보에서 찾기
         top_item = candidate_tops.get(top_id) or next(
@@ -212,22 +180,29 @@ def process_llm_results_node(state: RecommendationState) -> RecommendationState:
         bottom_item = candidate_bottoms.get(bottom_id) or next(
             (b for b in bottoms if b.get("id") == bottom_id), None
         )
+        outer_item = (
+            candidate_outers.get(outer_id)
+            or next((o for o in outers if o.get("id") == outer_id), None)
+            if outer_id
+            else None
+        )
 
         if top_item and bottom_item:
-            final_outfits.append(
-                {
-                    "top": top_item,
-                    "bottom": bottom_item,
-                    "score": float(rec.get("score", 0.5)),
-                    "reasoning": rec.get("reasoning", ""),
-                    "style_description": rec.get("style_description", ""),
-                    "reasons": (
-                        [rec.get("reasoning", "AI 추천")]
-                        if rec.get("reasoning")
-                        else []
-                    ),
-                }
-            )
+            outfit = {
+                "top": top_item,
+                "bottom": bottom_item,
+                "score": float(rec.get("score", 0.5)),
+                "reasoning": rec.get("reasoning", ""),
+                "style_description": rec.get("style_description", ""),
+                "reasons": (
+                    [rec.get("reasoning", "AI 추천")]
+                    if rec.get("reasoning")
+                    else []
+                ),
+            }
+            if outer_item:
+                outfit["outer"] = outer_item
+            final_outfits.append(outfit)
 
     state["final_outfits"] = final_outfits
     return state
@@ -251,19 +226,29 @@ def fallback_recommendation_node(state: RecommendationState) -> RecommendationSt
                 if isinstance(bottom_attrs, dict)
                 else {}
             )
-            final_outfits.append(
-                {
-                    "top": candidate["top"],
-                    "bottom": candidate["bottom"],
-                    "score": candidate["score"],
-                    "reasoning": "규칙 기반 추천",
-                    "style_description": (
-                        f"{(top_cat.get('sub') or top_cat.get('main') or 'Top')} & "
-                        f"{(bottom_cat.get('sub') or bottom_cat.get('main') or 'Bottom')}"
-                    ),
-                    "reasons": candidate.get("reasons", []),
-                }
-            )
+            outfit = {
+                "top": candidate["top"],
+                "bottom": candidate["bottom"],
+                "score": candidate["score"],
+                "reasoning": "규칙 기반 추천",
+                "style_description": (
+                    f"{(top_cat.get('sub') or top_cat.get('main') or 'Top')} & "
+                    f"{(bottom_cat.get('sub') or bottom_cat.get('main') or 'Bottom')}"
+                ),
+                "reasons": candidate.get("reasons", []),
+            }
+            if candidate.get("outer"):
+                outer_attrs = candidate["outer"].get("attributes", {}) or {}
+                outer_cat = (
+                    (outer_attrs.get("category") or {})
+                    if isinstance(outer_attrs, dict)
+                    else {}
+                )
+                outfit["outer"] = candidate["outer"]
+                outfit["style_description"] += (
+                    f" + {(outer_cat.get('sub') or outer_cat.get('main') or 'Outer')}"
+                )
+            final_outfits.append(outfit)
         state["final_outfits"] = final_outfits
     else:
         state["final_outfits"] = []
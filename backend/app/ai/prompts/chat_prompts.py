@@ -0,0 +1,25 @@
+"""
+채팅 프롬프트 템플릿
+"""
+
+from typing import Optional
+
+
+def build_history_summary_prompt(previous_summary: Optional[str], transcript: str) -> str:
+    """이전 요약 + 새로 접을 대화 -> 갱신된 장기 기억 요약"""
+    previous = previous_summary or "(none)"
+    return f"""You maintain the long-term memory of a fashion assistant chat.
+Merge the previous summary and the new conversation turns into one updated summary.
+
+Keep: the user's preferences (styles, colors, fit, sizes), dislikes, wardrobe facts,
+upcoming events / TPO, recommendations already given and the user's reactions.
+Drop greetings and small talk. Write in the user's language, at most 150 words,
+as plain sentences (no JSON, no headings).
+
+Previous summary:
+{previous}
+
+New conversation turns:
+{transcript}
+
+Updated summary:"""
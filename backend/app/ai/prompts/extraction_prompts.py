@@ -354,12 +354,8 @@ SYSTEM_PROMPT = (
     "If uncertain, use 'unknown' or null and lower confidence."
 )
 
-# USER_PROMPT - 테스트로 검증된 버전
-USER_PROMPT = """당신은 패션 아이템 분석 전문가입니다.
-주어진 옷 사진을 보고 다음 정보를 JSON 형식으로 정확하게 추출해주세요.
-
-반드시 다음 JSON 형식으로 응답하세요 (JSON만 출력, 마크다운 코드블록 사용 금지):
-{
+# 속성 JSON 스키마 (단일/배치 프롬프트 공용)
+ATTRIBUTE_SCHEMA = """{
   "category": {
     "main": "상위 카테고리 (outer/top/bottom/onepiece/shoes/accessory 중 하나)",
     "sub": "하위 카테고리 (coat/jacket/hoodie/tshirt/shirt/sweater/jeans/slacks/skirt/dress 등)",
@@ -403,7 +399,9 @@ USER_PROMPT = """당신은 패션 아이템 분석 전문가입니다.
   },
   "confidence": 전체 분석 신뢰도 0.0~1.0
 }
+"""
 
+ATTRIBUTE_RULES = """
 중요 규칙:
 - JSON만 출력하세요. 마크다운(```), 주석, 다른 텍스트 절대 사용 금지
 - 모든 필드를 채워주세요. 확실하지 않으면 'unknown'을 사용하고 confidence를 낮게 설정
@@ -412,6 +410,17 @@ USER_PROMPT = """당신은 패션 아이템 분석 전문가입니다.
 - neckline, sleeve, length, closure는 반드시 최상위 키로 포함
 """
 
+# USER_PROMPT - 테스트로 검증된 버전
+USER_PROMPT = (
+    """당신은 패션 아이템 분석 전문가입니다.
+주어진 옷 사진을 보고 다음 정보를 JSON 형식으로 정확하게 추출해주세요.
+
+반드시 다음 JSON 형식으로 응답하세요 (JSON만 출력, 마크다운 코드블록 사용 금지):
+"""
+    + ATTRIBUTE_SCHEMA
+    + ATTRIBUTE_RULES
+)
+
 
 # build_retry_prompt
 def build_retry_prompt(errors: List[str]) -> str:
@@ -447,3 +456,39 @@ STRICT ENUM VALIDATION:
 Use "unknown" for any field if you are unsure or the attribute is not visible.
 Return corrected JSON ONLY.
 """
+
+
+def build_batch_prompt(count: int) -> str:
+    """여러 장의 옷 사진을 한 번에 분석하는 배치 프롬프트 (JSON 배열 응답)"""
+    return (
+        f"""당신은 패션 아이템 분석 전문가입니다.
+옷 사진 {count}장이 순서대로 주어집니다. 첫 번째 사진이 index 0, 마지막 사진이 index {count - 1}입니다.
+사진마다 서로 다른 옷입니다. 각 사진을 따로 분석해 아래 형식의 JSON 객체를 하나씩 만들고,
+각 객체에 해당 사진 번호를 "index" 키(정수)로 추가하세요.
+
+반드시 길이 {count}의 JSON 배열 하나만 출력하세요 (index 오름차순, 마크다운 코드블록 사용 금지).
+배열의 각 원소 형식:
+"""
+        + ATTRIBUTE_SCHEMA
+        + ATTRIBUTE_RULES
+        + '- 각 객체에는 위 키들과 "index"만 포함\n'
+    )
+
+
+def build_batch_retry_prompt(count: int, errors: Dict[int, List[str]]) -> str:
+    """배치 재시도 프롬프트: 실패한 사진들만 다시 보내고 사진별 오류를 전달"""
+    details = "\n".join(
+        f"- index {i}: {'; '.join(errs[:5])}" for i, errs in sorted(errors.items())
+    )
+    return (
+        build_batch_prompt(count)
+        + f"""
+Your previous answers for these images did not match the schema:
+{details}
+
+Fix them: 'closure' and 'scores.season' MUST be arrays, all confidence/score
+fields must be numbers in [0, 1], 'meta.layering_rank' must be 1, 2 or 3, and
+category.main must be one of {ENUMS["category_main"]}.
+Return the corrected JSON array ONLY.
+"""
+    )
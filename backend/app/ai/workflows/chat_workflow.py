@@ -2,7 +2,22 @@
 채팅 랭그래프 워크플로우 정의
 """
 
-from app.ai.nodes.chat_nodes import get_chat_workflow
+import logging
+from typing import Any, AsyncIterator, Dict, Tuple
+
+from app.ai.clients.gemini_client import gemini_client
+from app.ai.nodes.chat_nodes import (
+    CHAT_ERROR_RESPONSE,
+    build_chat_response_prompt,
+    chat_intent_node,
+    get_chat_workflow,
+    handle_recommendation_node,
+    route_intent,
+)
+from app.ai.nodes.generation_nodes import generate_todays_pick
+from app.ai.schemas.workflow_state import ChatState
+
+logger = logging.getLogger(__name__)
 
 
 # 래퍼 함수 (도메인 서비스에서 사용하기 편하도록)
@@ -19,3 +34,43 @@ async def process_chat(user_id: str, query: str):
     }
 
     return await workflow.ainvoke(initial_state)
+
+
+async def stream_chat(state: ChatState) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    채팅 그래프와 같은 흐름을 (event, data) 이벤트로 스트리밍
+
+    의도 분석 직후 ``intent`` / ``status`` 이벤트를 보내고, 일반 대화 답변은
+    Gemini 스트리밍 API의 텍스트 조각을 ``token`` 이벤트로 그대로 전달합니다.
+    추천 흐름은 결과가 준비되면 답변 전체를 한 번에 ``token``으로 보냅니다.
+    완료 시 최종 상태는 state에 채워져 있습니다 (response / todays_pick 등).
+    """
+    yield "status", {"stage": "analyzing_intent"}
+    state = await chat_intent_node(state)
+    route = route_intent(state)
+    yield "intent", {
+        "intent": state["context"].get("intent", "GENERAL"),
+        "tpo": state["context"].get("tpo"),
+    }
+
+    if route == "recommend":
+        yield "status", {"stage": "recommending"}
+        state = await handle_recommendation_node(state)
+        state = generate_todays_pick(state)
+        yield "token", {"text": state.get("response") or ""}
+        return
+
+    yield "status", {"stage": "generating"}
+    chunks = []
+    try:
+        async for text in gemini_client.stream_content_async(
+            build_chat_response_prompt(state), temperature=0.7, max_output_tokens=800
+        ):
+            chunks.append(text)
+            yield "token", {"text": text}
+    except Exception as e:
+        logger.error(f"Chat stream generation error: {e}")
+        if not chunks:
+            chunks.append(CHAT_ERROR_RESPONSE)
+            yield "token", {"text": CHAT_ERROR_RESPONSE}
+    state["response"] = "".join(chunks)
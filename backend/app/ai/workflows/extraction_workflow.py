@@ -1,20 +1,113 @@
+import asyncio
 import logging
 import json
 import copy
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, Generator, List, Optional
 from app.ai.clients.gemini_client import gemini_client
 from app.ai.prompts.extraction_prompts import (
     USER_PROMPT,
     DEFAULT_OBJ,
+    build_batch_prompt,
+    build_batch_retry_prompt,
     build_retry_prompt,
 )
-from app.utils.json_parser import parse_dict_from_text
+from app.core.config import Config
+from app.utils.json_parser import parse_dict_from_text, parse_json_from_text
 from app.utils.validators import validate_schema
 from app.utils.helpers import normalize
+from app.utils.image_preprocess import prepare_image_for_vision
 
 logger = logging.getLogger(__name__)
 
 
+def prepare_images(images: list[bytes]) -> list[bytes]:
+    """EXIF 회전 보정 / 축소 / 재인코딩 후 Gemini로 보낼 바이트 목록"""
+    prepared = [prepare_image_for_vision(img) for img in images]
+    before = sum(p.original_bytes for p in prepared)
+    after = sum(len(p.data) for p in prepared)
+    logger.info(f"Vision images prepared: {before} -> {after} bytes")
+    return [p.data for p in prepared]
+
+
+def _default_result(note: str) -> Dict[str, Any]:
+    out = copy.deepcopy(DEFAULT_OBJ)
+    out["meta"]["notes"] = note
+    return out
+
+
+def _is_valid_response(raw_response: str) -> bool:
+    """스키마 검증을 통과한 응답만 캐시 (오답이 캐시되면 재시도가 무의미)"""
+    parsed, _ = parse_dict_from_text(raw_response)
+    return parsed is not None and validate_schema(parsed)[0]
+
+
+def _is_valid_batch_response(raw_response: str, count: int) -> bool:
+    return all(
+        obj is not None and validate_schema(obj)[0]
+        for obj in _split_batch_response(raw_response, count)
+    )
+
+
+def _vision_request(prompt: str, images: list[bytes], temperature: float) -> Dict[str, Any]:
+    return {
+        "prompt": prompt,
+        "images": images,
+        "model_override": gemini_client.vision_model,
+        "temperature": temperature,
+        "max_output_tokens": 2000,
+        "cache_if": _is_valid_response,
+    }
+
+
+def _extraction_steps(
+    images: list[bytes], retry_on_schema_fail: bool
+) -> Generator[Dict[str, Any], Optional[str], Dict[str, Any]]:
+    """
+    단일 추출의 재시도/검증/정규화 규칙 (동기/비동기 공용)
+
+    Gemini 호출 인자를 yield 하고 응답 텍스트를 send 로 받습니다. 호출
+    방식만 다른 extract_attributes / extract_attributes_async 가 같은 규칙을
+    따르도록 이 제너레이터를 구동합니다.
+    """
+    # 1. 1차 시도
+    logger.info("Calling Gemini Vision API (Attempt 1)...")
+    raw_response = yield _vision_request(USER_PROMPT, images, 0.3)
+
+    if not raw_response:
+        raise ValueError("Empty response from Gemini")
+
+    # 2. JSON 파싱
+    parsed, _ = parse_dict_from_text(raw_response)
+
+    # 3. 검증 및 재시도
+    if parsed is not None:
+        ok, errors = validate_schema(parsed)
+        if ok:
+            logger.info("Extraction successful on first attempt")
+            return normalize(parsed)
+
+        logger.warning(f"Schema validation failed on first attempt: {errors[:2]}")
+        if retry_on_schema_fail:
+            logger.info("Retrying with correction prompt...")
+            raw_response = yield _vision_request(build_retry_prompt(errors), images, 0.2)
+            parsed, _ = parse_dict_from_text(raw_response)
+            if parsed:
+                logger.info("Extraction successful on retry")
+                return normalize(parsed)
+
+    # 4. 폴백: 부분적인 데이터라도 반환
+    if parsed:
+        logger.warning(
+            "Returning partially valid or normalized data after failed validation"
+        )
+        return normalize(parsed)
+
+    # 최종 폴백: 기본값 반환
+    logger.error("Returning default object due to total failure")
+    return _default_result("Extraction failed - default returned")
+
+
 def extract_attributes(
     images: list[bytes], retry_on_schema_fail: bool = True
 ) -> Dict[str, Any]:
@@ -31,57 +124,162 @@ def extract_attributes(
     logger.info(f"Starting direct attribute extraction (images count: {len(images)})")
 
     try:
-        # 1. 1차 시도
-        logger.info("Calling Gemini Vision API (Attempt 1)...")
-        raw_response = gemini_client.generate_content(
-            prompt=USER_PROMPT,
-            images=images,
-            model_override=gemini_client.vision_model,
-            temperature=0.3,
-            max_output_tokens=2000,
-        )
+        steps = _extraction_steps(prepare_images(images), retry_on_schema_fail)
+        request = next(steps)
+        while True:
+            request = steps.send(gemini_client.generate_content(**request))
+    except StopIteration as done:
+        return done.value
+    except Exception as e:
+        logger.error(f"Extraction failed: {str(e)}", exc_info=True)
 
-        if not raw_response:
-            raise ValueError("Empty response from Gemini")
+    logger.error("Returning default object due to total failure")
+    return _default_result("Extraction failed - default returned")
 
-        # 2. JSON 파싱
-        parsed, _ = parse_dict_from_text(raw_response)
 
-        # 3. 검증 및 재시도
-        if parsed is not None:
-            ok, errors = validate_schema(parsed)
-            if ok:
-                logger.info("Extraction successful on first attempt")
-                return normalize(parsed)
+async def extract_attributes_async(
+    images: list[bytes], retry_on_schema_fail: bool = True
+) -> Dict[str, Any]:
+    """
+    이미지 리스트(멀티) 속성 추출 - 비동기 버전
 
-            logger.warning(f"Schema validation failed on first attempt: {errors[:2]}")
-            if retry_on_schema_fail:
-                logger.info("Retrying with correction prompt...")
-                retry_prompt = build_retry_prompt(errors)
-                raw_response = gemini_client.generate_content(
-                    prompt=retry_prompt,
-                    images=images,
-                    model_override=gemini_client.vision_model,
-                    temperature=0.2,
-                    max_output_tokens=2000,
-                )
-                parsed, _ = parse_dict_from_text(raw_response)
-                if parsed:
-                    logger.info("Extraction successful on retry")
-                    return normalize(parsed)
-
-        # 4. 폴백: 부분적인 데이터라도 반환
-        if parsed:
-            logger.warning(
-                "Returning partially valid or normalized data after failed validation"
-            )
-            return normalize(parsed)
+    extract_attributes와 같은 규칙(_extraction_steps)을 따르며
+    Gemini 호출 중 이벤트 루프를 막지 않습니다.
+    """
+    logger.info(
+        f"Starting async attribute extraction (images count: {len(images)})"
+    )
 
+    try:
+        prepared = await asyncio.to_thread(prepare_images, images)
+        steps = _extraction_steps(prepared, retry_on_schema_fail)
+        request = next(steps)
+        while True:
+            request = steps.send(await gemini_client.generate_content_async(**request))
+    except StopIteration as done:
+        return done.value
     except Exception as e:
         logger.error(f"Extraction failed: {str(e)}", exc_info=True)
 
-    # 최종 폴백: 기본값 반환
     logger.error("Returning default object due to total failure")
-    out = copy.deepcopy(DEFAULT_OBJ)
-    out["meta"]["notes"] = "Extraction failed - default returned"
-    return out
+    return _default_result("Extraction failed - default returned")
+
+
+def _split_batch_response(
+    raw_response: str, count: int
+) -> List[Optional[Dict[str, Any]]]:
+    """배치 응답(JSON 배열)을 사진 순서대로 나눔 (index 키 우선, 없으면 배열 순서)"""
+    parsed, _ = parse_json_from_text(raw_response or "")
+    if isinstance(parsed, dict):
+        parsed = [parsed]
+    if not isinstance(parsed, list):
+        return [None] * count
+
+    slots: List[Optional[Dict[str, Any]]] = [None] * count
+    for position, obj in enumerate(parsed):
+        if not isinstance(obj, dict):
+            continue
+        obj = dict(obj)
+        index = obj.pop("index", position)
+        if not isinstance(index, int) or not 0 <= index < count:
+            index = position
+        if index < count and slots[index] is None:
+            slots[index] = obj
+    return slots
+
+
+async def _extract_batch_chunk(
+    images: List[bytes], retry_on_schema_fail: bool
+) -> List[Dict[str, Any]]:
+    """한 번의 Gemini 호출로 여러 장을 추출하고 실패한 사진만 재요청"""
+    results: List[Optional[Dict[str, Any]]] = [None] * len(images)
+    partial: Dict[int, Dict[str, Any]] = {}
+    errors: Dict[int, List[str]] = {}
+    pending = list(range(len(images)))
+    attempts = 2 if retry_on_schema_fail else 1
+
+    for attempt in range(attempts):
+        if attempt == 0:
+            prompt = build_batch_prompt(len(pending))
+        else:
+            # 재요청 사진은 0부터 다시 번호를 매기므로 오류도 새 번호로 전달
+            prompt = build_batch_retry_prompt(
+                len(pending),
+                {pos: errors.get(i, ["missing"]) for pos, i in enumerate(pending)},
+            )
+        logger.info(
+            f"Batch extraction attempt {attempt + 1}: {len(pending)} images in one call"
+        )
+        try:
+            raw_response = await gemini_client.generate_content_async(
+                prompt=prompt,
+                images=[images[i] for i in pending],
+                model_override=gemini_client.vision_model,
+                temperature=0.3 if attempt == 0 else 0.2,
+                max_output_tokens=2000 * len(pending),
+                cache_if=functools.partial(_is_valid_batch_response, count=len(pending)),
+            )
+        except Exception as e:
+            logger.error(f"Batch extraction call failed: {e}")
+            raw_response = ""
+
+        failed = []
+        for i, obj in zip(pending, _split_batch_response(raw_response, len(pending))):
+            if obj is None:
+                errors[i] = ["No JSON object returned for this image"]
+                failed.append(i)
+                continue
+            ok, errs = validate_schema(obj)
+            if ok:
+                results[i] = normalize(obj)
+            else:
+                partial[i] = obj
+                errors[i] = errs
+                failed.append(i)
+
+        pending = failed
+        if not pending:
+            break
+
+    for i in pending:
+        if i in partial:
+            logger.warning(f"Batch image {i}: returning normalized data after failed validation")
+            results[i] = normalize(partial[i])
+        else:
+            logger.error(f"Batch image {i}: returning default object")
+            results[i] = _default_result("Extraction failed - default returned")
+    return results
+
+
+async def extract_attributes_batch_async(
+    images: List[bytes],
+    retry_on_schema_fail: bool = True,
+    batch_size: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    여러 장의 서로 다른 옷 사진을 배치로 속성 추출 (사진당 결과 1개)
+
+    사진을 batch_size(기본 EXTRACT_BATCH_SIZE)장씩 묶어 한 번의 호출로 JSON
+    배열을 받고, 사진별로 validate_schema 검증 후 실패한 사진만 다시
+    요청합니다. 묶음들은 동시에 호출됩니다.
+
+    Returns:
+        입력 순서대로 정규화된 속성 딕셔너리 리스트
+    """
+    if not images:
+        return []
+    batch_size = max(1, batch_size or Config.EXTRACT_BATCH_SIZE)
+    if batch_size == 1:
+        return list(
+            await asyncio.gather(
+                *(extract_attributes_async([img], retry_on_schema_fail) for img in images)
+            )
+        )
+
+    prepared = await asyncio.to_thread(prepare_images, images)
+    chunks = [prepared[i : i + batch_size] for i in range(0, len(prepared), batch_size)]
+    logger.info(f"Starting batch attribute extraction: {len(images)} images, {len(chunks)} calls")
+    chunk_results = await asyncio.gather(
+        *(_extract_batch_chunk(chunk, retry_on_schema_fail) for chunk in chunks)
+    )
+    return [result for chunk in chunk_results for result in chunk]
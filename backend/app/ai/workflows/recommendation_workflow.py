@@ -64,6 +64,8 @@ def recommend_outfits(
     user_request: Optional[str] = None,
     weather_info: Optional[Dict[str, Any]] = None,
     use_llm: bool = True,
+    user_id: Optional[str] = None,
+    outers: Optional[List[Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
     """
     코디 추천 (기존 인터페이스 유지)
@@ -75,6 +77,8 @@ def recommend_outfits(
         user_request: 사용자 요청 (TPO)
         weather_info: 날씨 정보
         use_llm: LLM 사용 여부
+        user_id: 사용자 ID (점수 캐시 키)
+        outers: 아우터 아이템 리스트 (기온이 낮을 때 3피스 조합에 사용)
 
     Returns:
         추천된 코디 리스트
@@ -83,10 +87,11 @@ def recommend_outfits(
     initial_state: RecommendationState = {
         "tops": tops,
         "bottoms": bottoms,
+        "outers": outers or [],
         "candidates": [],
         "llm_recommendations": None,
         "final_outfits": [],
-        "metadata": {"user_id": str(kwargs.get("user_id", "unknown"))},
+        "metadata": {"user_id": str(user_id) if user_id else "unknown"},
         "user_request": user_request,
         "weather_info": weather_info,
         "count": count,
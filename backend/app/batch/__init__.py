@@ -4,5 +4,11 @@
 """
 
 from .weather import run_daily_weather_batch
+from .todays_pick import run_daily_todays_pick_batch
+from .nightly import run_nightly_batch
 
-__all__ = ["run_daily_weather_batch"]
+__all__ = [
+    "run_daily_weather_batch",
+    "run_daily_todays_pick_batch",
+    "run_nightly_batch",
+]
@@ -0,0 +1,36 @@
+"""
+야간 배치 실행 스크립트 (Cron/외부 스케줄러용)
+
+사용법:
+    python -m app.batch
+"""
+
+import asyncio
+import json
+import logging
+
+from app.database import SessionLocal
+from app.batch import run_nightly_batch
+from app.domains.weather.service import weather_service
+
+
+async def _run(db) -> dict:
+    try:
+        return await run_nightly_batch(db)
+    finally:
+        # 루프가 닫히기 전에 공유 KMA 세션 정리
+        await weather_service.client.aclose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        result = asyncio.run(_run(db))
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
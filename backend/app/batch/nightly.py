@@ -0,0 +1,29 @@
+"""야간 배치 오케스트레이션 (날씨 수집 -> Today's Pick 사전 생성)"""
+
+import logging
+from sqlalchemy.orm import Session
+
+from .weather import run_daily_weather_batch
+from .todays_pick import run_daily_todays_pick_batch
+
+logger = logging.getLogger(__name__)
+
+
+async def run_nightly_batch(db: Session) -> dict:
+    """
+    날씨 배치 후 Today's Pick 사전 생성 배치를 순서대로 실행
+
+    날씨 배치가 일부 지역만 성공해도 추천 배치는 진행합니다
+    (실패 지역은 추천 생성 시 KMA에서 직접 조회).
+
+    Args:
+        db: 데이터베이스 세션 (주입)
+
+    Returns:
+        dict: 단계별 실행 결과
+    """
+    weather_result = await run_daily_weather_batch(db)
+    logger.info(f"Weather batch: {weather_result.get('message')}")
+
+    todays_pick_result = await run_daily_todays_pick_batch(db)
+    return {"weather": weather_result, "todays_pick": todays_pick_result}
@@ -0,0 +1,218 @@
+"""Today's Pick 사전 생성 배치 작업"""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import desc, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import Config
+from app.database import SessionLocal
+from app.domains.recommendation.model import (
+    PICK_SOURCE_BATCH,
+    TodaysPick,
+    TodaysPickBatchProgress,
+)
+from app.domains.user.model import User
+from app.domains.weather.service import weather_service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGION = "Seoul"
+
+
+def _active_user_ids(since: datetime):
+    """
+    ``since`` 이후 사용자가 직접 활동한 사용자 id (select).
+
+    배치가 만든 추천(source=batch)은 활동으로 치지 않으므로, 돌아오지 않는
+    사용자는 ACTIVE_DAYS 이후 대상에서 빠집니다.
+    """
+    requested = select(TodaysPick.user_id).where(
+        TodaysPick.created_at >= since,
+        TodaysPick.source != PICK_SOURCE_BATCH,
+    )
+    return select(User.id).where(
+        or_(User.last_active_at >= since, User.id.in_(requested))
+    )
+
+
+def _active_users(db: Session, since: datetime) -> List[Tuple[UUID, str]]:
+    """최근 활동한 사용자와 마지막 추천의 지역"""
+    user_ids = [row[0] for row in db.execute(_active_user_ids(since))]
+    if not user_ids:
+        return []
+    latest_picks = dict(
+        db.query(TodaysPick.user_id, TodaysPick.weather)
+        .filter(TodaysPick.user_id.in_(user_ids))
+        .order_by(TodaysPick.user_id, desc(TodaysPick.created_at))
+        .distinct(TodaysPick.user_id)
+        .all()
+    )
+    users = []
+    for user_id in user_ids:
+        weather = latest_picks.get(user_id)
+        region = (weather or {}).get("region") if isinstance(weather, dict) else None
+        users.append((user_id, region or DEFAULT_REGION))
+    return users
+
+
+def _progress_rows(db: Session, run_date: date) -> Dict[UUID, TodaysPickBatchProgress]:
+    rows = (
+        db.query(TodaysPickBatchProgress)
+        .filter(TodaysPickBatchProgress.run_date == run_date)
+        .all()
+    )
+    return {row.user_id: row for row in rows}
+
+
+def _update_progress(
+    db: Session, run_date: date, user_id: UUID, **fields: Any
+) -> None:
+    row = (
+        db.query(TodaysPickBatchProgress)
+        .filter(
+            TodaysPickBatchProgress.run_date == run_date,
+            TodaysPickBatchProgress.user_id == user_id,
+        )
+        .first()
+    )
+    if row is None:
+        row = TodaysPickBatchProgress(run_date=run_date, user_id=user_id, attempts=0)
+        db.add(row)
+    for key, value in fields.items():
+        setattr(row, key, value)
+    db.commit()
+
+
+async def _precompute_user(
+    semaphore: asyncio.Semaphore,
+    run_date: date,
+    user_id: UUID,
+    region: str,
+    weather: Dict[str, Any],
+    attempts: int,
+    generate_image: bool,
+) -> str:
+    """사용자 1명의 추천 생성 (사용자별 독립 세션 사용)"""
+    from app.llm.todays_pick_service import recommend_todays_pick_v2
+
+    async with semaphore:
+        db = SessionLocal()
+        try:
+            _update_progress(
+                db,
+                run_date,
+                user_id,
+                region=region,
+                status="running",
+                attempts=attempts + 1,
+                error=None,
+            )
+            result = await recommend_todays_pick_v2(
+                user_id=user_id,
+                weather=weather,
+                db=db,
+                generate_image=generate_image,
+                reuse_since=datetime.combine(run_date, time.min),
+                source=PICK_SOURCE_BATCH,
+            )
+            _update_progress(
+                db, run_date, user_id, status="done", pick_id=result.get("pick_id")
+            )
+            return "done"
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Today's Pick batch failed for user {user_id}: {e}")
+            try:
+                _update_progress(db, run_date, user_id, status="failed", error=str(e)[:1000])
+            except Exception as progress_err:
+                db.rollback()
+                logger.error(f"Failed to record batch progress for {user_id}: {progress_err}")
+            return "failed"
+        finally:
+            db.close()
+
+
+async def run_daily_todays_pick_batch(
+    db: Session,
+    concurrency: Optional[int] = None,
+    run_date: Optional[date] = None,
+) -> dict:
+    """
+    활성 사용자의 오늘의 추천(TodaysPick)을 미리 생성
+
+    날씨 배치 이후 실행합니다. 사용자별 진행 상태를
+    ``todays_pick_batch_progress``에 기록하므로 같은 날 다시 실행하면
+    완료된 사용자는 건너뛰고 실패/미처리 사용자만 재시도합니다.
+
+    Args:
+        db: 데이터베이스 세션 (주입, 대상 조회/날씨 조회용)
+        concurrency: 동시 처리 사용자 수 (기본: Config.TODAYS_PICK_BATCH_CONCURRENCY)
+        run_date: 기준 날짜 (기본: 오늘)
+
+    Returns:
+        dict: 실행 결과 (완료/실패/건너뜀 개수 등)
+    """
+    run_date = run_date or date.today()
+    concurrency = concurrency or Config.TODAYS_PICK_BATCH_CONCURRENCY
+    active_since = datetime.combine(run_date, time.min) - timedelta(
+        days=Config.TODAYS_PICK_BATCH_ACTIVE_DAYS
+    )
+
+    users = _active_users(db, active_since)
+    progress = _progress_rows(db, run_date)
+
+    pending = []
+    skipped = 0
+    for user_id, region in users:
+        row = progress.get(user_id)
+        if row is not None and (
+            row.status == "done"
+            or row.attempts >= Config.TODAYS_PICK_BATCH_MAX_ATTEMPTS
+        ):
+            skipped += 1
+            continue
+        pending.append((user_id, region, row.attempts if row else 0))
+
+    # 지역별 날씨는 한 번만 조회 (날씨 배치가 저장한 DB 캐시 사용)
+    weather_by_region: Dict[str, Dict[str, Any]] = {}
+    for region in sorted({region for _, region, _ in pending}):
+        weather_by_region[region] = await weather_service.get_region_weather_info(
+            db, region
+        )
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results = await asyncio.gather(
+        *(
+            _precompute_user(
+                semaphore,
+                run_date,
+                user_id,
+                region,
+                weather_by_region[region],
+                attempts,
+                Config.TODAYS_PICK_BATCH_GENERATE_IMAGE,
+            )
+            for user_id, region, attempts in pending
+        )
+    )
+
+    done = results.count("done")
+    failed = results.count("failed")
+    status = "success" if failed == 0 else "partial_success"
+    logger.info(
+        f"Today's Pick batch {run_date}: {done} done, {failed} failed, {skipped} skipped"
+    )
+    return {
+        "status": status,
+        "run_date": run_date.isoformat(),
+        "total": len(users),
+        "done": done,
+        "failed": failed,
+        "skipped": skipped,
+        "message": f"Precomputed {done}/{len(pending)} picks ({skipped} already handled)",
+    }
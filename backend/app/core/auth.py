@@ -7,6 +7,7 @@ from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
 from app.core.config import Config
+from app.core.principal import AuthPrincipal, principal_cache
 from app.core.security import ALGORITHM, SECRET_KEY
 from app.database import get_db
 from app.domains.user.model import User
@@ -15,15 +16,27 @@ logger = logging.getLogger(__name__)
 bearer_scheme = HTTPBearer()
 
 
-def get_current_user(
+def _load_principal(
+    db: Session, user_id: Optional[UUID], username: Optional[str]
+) -> Optional[AuthPrincipal]:
+    user = None
+    if user_id:
+        user = db.query(User).filter(User.id == user_id).first()
+    if not user and username:
+        logger.debug(f"Attempting fallback lookup by username: {username}")
+        user = db.query(User).filter(User.user_name == username).first()
+    return AuthPrincipal.from_user(user) if user else None
+
+
+def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: Session = Depends(get_db),
-) -> User:
+) -> AuthPrincipal:
     """
     현재 로그인한 사용자를 검증하고 반환하는 통합 의존성.
-    """
-    logger.info("--- Auth Check Started ---")
 
+    JWT는 매 요청 검증하고, users 조회는 principal 캐시 미스일 때만 수행한다.
+    """
     if not credentials:
         logger.warning("No credentials provided")
         raise HTTPException(
@@ -35,24 +48,24 @@ def get_current_user(
         # 1. JWT Decode
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            logger.debug(f"Token Payload: {payload}")
         except JWTError as e:
-            logger.error(f"JWT Decode Failed: {str(e)}")
+            logger.warning(f"JWT Decode Failed: {str(e)}")
             raise HTTPException(status_code=401, detail="Invalid or expired token")
 
         user_id_str = payload.get("user_id")
         username = payload.get("sub")
-
-        # 2. Database Lookup
-        user = None
         try:
-            if user_id_str:
-                logger.debug(f"Attempting lookup by UUID: {user_id_str}")
-                user = db.query(User).filter(User.id == UUID(user_id_str)).first()
+            user_id = UUID(user_id_str) if user_id_str else None
+        except ValueError:
+            raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-            if not user and username:
-                logger.debug(f"Attempting fallback lookup by username: {username}")
-                user = db.query(User).filter(User.user_name == username).first()
+        # 2. Principal cache, then Database Lookup
+        principal = principal_cache.lookup(user_id=user_id, user_name=username)
+        if principal is not None:
+            return principal
+
+        try:
+            principal = _load_principal(db, user_id, username)
         except Exception as db_err:
             logger.error(
                 f"Database query failed DURING auth: {type(db_err).__name__}: {str(db_err)}"
@@ -63,12 +76,13 @@ def get_current_user(
                 detail="Database connection error",
             )
 
-        if user is None:
-            logger.warning(f"User not found in database for payload: {payload}")
+        if principal is None:
+            logger.warning(f"User not found in database (user_id={user_id_str})")
             raise HTTPException(status_code=401, detail="User not found in system")
 
-        logger.info(f"Auth Success: {user.user_name} ({user.id})")
-        return user
+        principal_cache.put(principal)
+        logger.debug(f"Auth Success: {principal.user_name} ({principal.id})")
+        return principal
 
     except HTTPException:
         raise
@@ -79,5 +93,19 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Could not validate credentials")
 
 
-def get_current_user_id(current_user: User = Depends(get_current_user)) -> UUID:
-    return current_user.id
+def get_current_user(
+    principal: AuthPrincipal = Depends(get_current_principal),
+    db: Session = Depends(get_db),
+) -> User:
+    """ORM ``User`` row for handlers that modify it (costs one primary-key lookup)."""
+    user = db.get(User, principal.id)
+    if user is None:
+        principal_cache.invalidate(principal.id)
+        raise HTTPException(status_code=401, detail="User not found in system")
+    return user
+
+
+def get_current_user_id(
+    principal: AuthPrincipal = Depends(get_current_principal),
+) -> UUID:
+    return principal.id
@@ -7,3 +7,30 @@ health_router = APIRouter()
 @health_router.get("/health")
 def health():
     return JSONResponse(content={"status": "server is running"})
+
+
+@health_router.get("/metrics")
+def metrics():
+    """인메모리 캐시 적중률 등 프로세스 단위 지표"""
+    from app.ai.classifiers.intent_classifier import local_intent_classifier
+    from app.ai.clients.response_cache import response_cache
+    from app.core.principal import principal_cache
+    from app.core.signed_urls import signed_url_service
+    from app.domains.extraction.dedup import extraction_dedup_index
+    from app.domains.recommendation.score_cache import outfit_score_cache
+    from app.domains.weather.service import weather_service
+
+    return JSONResponse(
+        content={
+            "gemini_response_cache": response_cache.stats(),
+            "extraction_dedup": extraction_dedup_index.stats(),
+            "chat_intent_classifier": local_intent_classifier.stats(),
+            "signed_url_cache": signed_url_service.stats(),
+            "auth_principal_cache": principal_cache.stats(),
+            "kma_weather_client": weather_service.client.stats(),
+            "outfit_score_cache": {
+                "hits": outfit_score_cache.hits,
+                "misses": outfit_score_cache.misses,
+            },
+        }
+    )
@@ -0,0 +1,154 @@
+"""
+Authenticated principal cache.
+
+``get_current_principal`` (app/core/auth.py) verifies the JWT on every
+request but only loads the ``users`` row on a cache miss. The cached
+``AuthPrincipal`` carries the profile fields handlers need (id, name, body
+info, face image path), so recommendation code can read them without another
+``User`` query.
+
+Entries live for ``AUTH_PRINCIPAL_CACHE_TTL_SECONDS`` in a size-bounded LRU.
+Profile writes call ``invalidate``; with several workers the TTL bounds how
+long another worker may serve the old profile.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AuthPrincipal:
+    id: UUID
+    user_name: str
+    gender: Optional[str] = None
+    body_shape: Optional[str] = None
+    height: Optional[float] = None
+    weight: Optional[float] = None
+    age: Optional[int] = None
+    face_image_path: Optional[str] = None
+
+    @classmethod
+    def from_user(cls, user) -> "AuthPrincipal":
+        return cls(
+            id=user.id,
+            user_name=user.user_name,
+            gender=user.gender,
+            body_shape=user.body_shape,
+            height=float(user.height) if user.height else None,
+            weight=float(user.weight) if user.weight else None,
+            age=user.age,
+            face_image_path=user.face_image_path,
+        )
+
+
+def _id_key(user_id) -> str:
+    return f"id:{user_id}"
+
+
+def _name_key(user_name: str) -> str:
+    return f"sub:{user_name}"
+
+
+class PrincipalCache:
+    """TTL + LRU cache of ``AuthPrincipal`` keyed by user id (or JWT ``sub``)."""
+
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[AuthPrincipal, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def _get(self, key: str) -> Optional[AuthPrincipal]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, principal: AuthPrincipal) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for key in (_id_key(principal.id), _name_key(principal.user_name)):
+                self._entries[key] = (principal, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def lookup(
+        self, user_id: Optional[UUID] = None, user_name: Optional[str] = None
+    ) -> Optional[AuthPrincipal]:
+        if not self.enabled:
+            return None
+        if user_id is not None:
+            return self._get(_id_key(user_id))
+        if user_name:
+            return self._get(_name_key(user_name))
+        return None
+
+    def load(self, db: Session, user_id: UUID) -> Optional[AuthPrincipal]:
+        """Cached principal for ``user_id``, loading the ``users`` row on a miss."""
+        from app.domains.user.model import User
+
+        principal = self.lookup(user_id=user_id)
+        if principal is None:
+            user = db.query(User).filter(User.id == user_id).first()
+            if user is None:
+                return None
+            principal = AuthPrincipal.from_user(user)
+            self.put(principal)
+        return principal
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            entry = self._entries.pop(_id_key(user_id), None)
+            if entry is not None:
+                self._entries.pop(_name_key(entry[0].user_name), None)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=Config.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=Config.AUTH_PRINCIPAL_CACHE_SIZE,
+)
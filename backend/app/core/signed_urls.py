@@ -0,0 +1,298 @@
+"""
+Shared Supabase Storage signed-URL service.
+
+Wardrobe, user and mannequin code resolve storage paths through this one
+service, which keeps a size-bounded LRU of signed URLs:
+
+* ``get`` signs a single path on a miss.
+* ``get_many`` signs every missing path of a list page in one
+  ``create_signed_urls`` round trip instead of one request per item.
+* ``aget`` / ``aget_many`` are the same for async handlers: misses are signed
+  with the backend's ``asign`` / ``asign_many``, so a cold cache never blocks
+  the event loop.
+* An entry that is still valid but within ``SIGNED_URL_REFRESH_AHEAD_SECONDS``
+  of expiry is returned as is and re-signed on a background thread, so hot
+  paths never wait for re-signing.
+
+Signing goes through the storage adapter (``app.core.storage``). When it is
+impossible (storage not configured, API error) the public object URL is
+returned, like the per-manager implementations did before.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import Config
+from app.core.storage import StorageBackend, storage
+
+logger = logging.getLogger(__name__)
+
+# 만료 직전 URL은 브라우저가 로드하기 전에 만료될 수 있으므로 재서명
+_MIN_REMAINING_SECONDS = 30
+_BATCH_CHUNK = 100
+
+
+class SignedUrlService:
+    """Signed URLs for one bucket with LRU caching and refresh-ahead."""
+
+    def __init__(
+        self,
+        backend: StorageBackend,
+        expires_in: int = 3600,
+        max_entries: int = 4096,
+        refresh_ahead_seconds: int = 300,
+    ):
+        self.backend = backend
+        self.expires_in = max(60, expires_in)
+        self.max_entries = max_entries
+        self.refresh_ahead_seconds = min(refresh_ahead_seconds, self.expires_in // 2)
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.sign_calls = 0
+
+    # --- storage -----------------------------------------------------------
+
+    def public_url(self, image_path: str) -> str:
+        return self.backend.public_url(image_path)
+
+    def _sign_one(self, image_path: str) -> Optional[str]:
+        with self._lock:
+            self.sign_calls += 1
+        return self.backend.sign(image_path, self.expires_in)
+
+    def _sign_batch(self, image_paths: List[str]) -> Dict[str, str]:
+        signed: Dict[str, str] = {}
+        for start in range(0, len(image_paths), _BATCH_CHUNK):
+            with self._lock:
+                self.sign_calls += 1
+            signed.update(
+                self.backend.sign_many(
+                    image_paths[start : start + _BATCH_CHUNK], self.expires_in
+                )
+            )
+        return signed
+
+    async def _asign_one(self, image_path: str) -> Optional[str]:
+        with self._lock:
+            self.sign_calls += 1
+        return await self.backend.asign(image_path, self.expires_in)
+
+    async def _asign_batch(self, image_paths: List[str]) -> Dict[str, str]:
+        chunks = [
+            image_paths[start : start + _BATCH_CHUNK]
+            for start in range(0, len(image_paths), _BATCH_CHUNK)
+        ]
+        with self._lock:
+            self.sign_calls += len(chunks)
+        signed: Dict[str, str] = {}
+        for result in await asyncio.gather(
+            *(self.backend.asign_many(chunk, self.expires_in) for chunk in chunks)
+        ):
+            signed.update(result)
+        return signed
+
+    # --- cache -------------------------------------------------------------
+
+    def _lookup(self, image_path: str, now: float) -> Tuple[Optional[str], bool]:
+        """(cached url or None, needs background refresh)."""
+        with self._lock:
+            entry = self._entries.get(image_path)
+            if entry is None or entry[1] - now <= _MIN_REMAINING_SECONDS:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(image_path)
+            self.hits += 1
+            return entry[0], entry[1] - now <= self.refresh_ahead_seconds
+
+    def _store(self, image_path: str, url: str, signed_at: float) -> None:
+        with self._lock:
+            self._entries[image_path] = (url, signed_at + self.expires_in)
+            self._entries.move_to_end(image_path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _schedule_refresh(self, image_paths: Iterable[str]) -> None:
+        with self._lock:
+            pending = [p for p in image_paths if p not in self._refreshing]
+            if not pending:
+                return
+            self._refreshing.update(pending)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="signed-url-refresh"
+                )
+            executor = self._executor
+        executor.submit(self._refresh, pending)
+
+    def _refresh(self, image_paths: List[str]) -> None:
+        try:
+            signed_at = time.time()
+            signed = self._sign_batch(image_paths)
+            for path, url in signed.items():
+                self._store(path, url, signed_at)
+            with self._lock:
+                self.refreshes += len(signed)
+        except Exception as e:
+            logger.warning(f"Background signed URL refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(image_paths)
+
+    # --- resolution (shared by the sync and async API) ------------------------
+
+    def _resolve_cached(self, image_path: str, now: float) -> Optional[str]:
+        """URL that needs no signing call, or None when ``image_path`` must be signed."""
+        if not image_path:
+            return ""
+        if image_path.startswith("http"):
+            return image_path
+        if not self.backend.available:
+            return self.public_url(image_path)
+        cached, stale = self._lookup(image_path, now)
+        if cached and stale:
+            self._schedule_refresh([image_path])
+        return cached
+
+    def _accept_one(self, image_path: str, url: Optional[str], now: float) -> str:
+        if not url:
+            logger.warning(
+                f"Signed URL missing in response for {image_path}, using public URL fallback."
+            )
+            return self.public_url(image_path)
+        self._store(image_path, url, now)
+        return url
+
+    def _partition(
+        self, image_paths: Iterable[str], now: float
+    ) -> Tuple[Dict[str, str], List[str]]:
+        """(URLs resolved without signing, paths that need signing)."""
+        resolved: Dict[str, str] = {}
+        missing: List[str] = []
+        stale: List[str] = []
+        for path in dict.fromkeys(image_paths):
+            if not path:
+                resolved[path] = ""
+            elif path.startswith("http"):
+                resolved[path] = path
+            elif not self.backend.available:
+                resolved[path] = self.public_url(path)
+            else:
+                cached, needs_refresh = self._lookup(path, now)
+                if cached:
+                    resolved[path] = cached
+                    if needs_refresh:
+                        stale.append(path)
+                else:
+                    missing.append(path)
+        if stale:
+            self._schedule_refresh(stale)
+        return resolved, missing
+
+    def _accept_many(
+        self,
+        resolved: Dict[str, str],
+        missing: List[str],
+        signed: Dict[str, str],
+        now: float,
+    ) -> Dict[str, str]:
+        for path in missing:
+            url = signed.get(path)
+            if url:
+                self._store(path, url, now)
+                resolved[path] = url
+            else:
+                resolved[path] = self.public_url(path)
+        return resolved
+
+    # --- public API ----------------------------------------------------------
+
+    def get(self, image_path: str) -> str:
+        """Signed URL for one storage path (public URL fallback)."""
+        now = time.time()
+        resolved = self._resolve_cached(image_path, now)
+        if resolved is not None:
+            return resolved
+        try:
+            url = self._sign_one(image_path)
+        except Exception as e:
+            logger.warning(f"Error generating Supabase signed URL for {image_path}: {e}")
+            return self.public_url(image_path)
+        return self._accept_one(image_path, url, now)
+
+    async def aget(self, image_path: str) -> str:
+        """``get`` for async handlers: a miss is signed without blocking the loop."""
+        now = time.time()
+        resolved = self._resolve_cached(image_path, now)
+        if resolved is not None:
+            return resolved
+        try:
+            url = await self._asign_one(image_path)
+        except Exception as e:
+            logger.warning(f"Error generating Supabase signed URL for {image_path}: {e}")
+            return self.public_url(image_path)
+        return self._accept_one(image_path, url, now)
+
+    def get_many(self, image_paths: Iterable[str]) -> Dict[str, str]:
+        """Signed URLs for many paths with at most one batch-sign round trip."""
+        now = time.time()
+        resolved, missing = self._partition(image_paths, now)
+        signed: Dict[str, str] = {}
+        if missing:
+            try:
+                signed = self._sign_batch(missing)
+            except Exception as e:
+                logger.warning(f"Error batch-signing {len(missing)} storage paths: {e}")
+        return self._accept_many(resolved, missing, signed, now)
+
+    async def aget_many(self, image_paths: Iterable[str]) -> Dict[str, str]:
+        """``get_many`` for async handlers (chunks are signed concurrently)."""
+        now = time.time()
+        resolved, missing = self._partition(image_paths, now)
+        signed: Dict[str, str] = {}
+        if missing:
+            try:
+                signed = await self._asign_batch(missing)
+            except Exception as e:
+                logger.warning(f"Error batch-signing {len(missing)} storage paths: {e}")
+        return self._accept_many(resolved, missing, signed, now)
+
+    def invalidate(self, image_path: str) -> None:
+        with self._lock:
+            self._entries.pop(image_path, None)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "background_refreshes": self.refreshes,
+                "sign_calls": self.sign_calls,
+            }
+
+
+signed_url_service = SignedUrlService(
+    backend=storage,
+    expires_in=Config.SIGNED_URL_EXPIRES_SECONDS,
+    max_entries=Config.SIGNED_URL_CACHE_SIZE,
+    refresh_ahead_seconds=Config.SIGNED_URL_REFRESH_AHEAD_SECONDS,
+)
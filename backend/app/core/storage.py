@@ -0,0 +1,384 @@
+"""
+Object storage adapter.
+
+Every module that touches object storage (wardrobe, user, mannequin, image
+generation, signed URLs) goes through ``storage`` instead of creating its own
+Supabase client. Backends expose the same operations in sync and async form:
+
+* ``SupabaseStorage`` talks to the Storage REST API over shared keep-alive
+  ``httpx`` connection pools (one sync, one async), so async request handlers
+  never block on the synchronous SDK.
+* ``LocalStorage`` keeps objects under a directory. It serves development
+  without Supabase and offline throughput benchmarks
+  (``benchmarks/storage_throughput.py``).
+
+Select with ``STORAGE_BACKEND=supabase|local``.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+import httpx
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class StorageError(Exception):
+    """Raised when a storage operation fails."""
+
+
+class StorageBackend(ABC):
+    """Upload / download / remove / sign for one bucket."""
+
+    bucket_name: str
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    def storage_path(self, path: str) -> str:
+        # 버킷명 접두사 제거 (있다면)
+        if "/" in path and path.startswith(self.bucket_name):
+            return path.replace(f"{self.bucket_name}/", "", 1)
+        return path
+
+    @abstractmethod
+    def public_url(self, path: str) -> str: ...
+
+    @abstractmethod
+    def upload(
+        self,
+        path: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        upsert: bool = False,
+    ) -> str: ...
+
+    @abstractmethod
+    def download(self, path: str) -> bytes: ...
+
+    @abstractmethod
+    def remove(self, paths: List[str]) -> None: ...
+
+    @abstractmethod
+    def sign(self, path: str, expires_in: int) -> Optional[str]: ...
+
+    @abstractmethod
+    def sign_many(self, paths: List[str], expires_in: int) -> Dict[str, str]: ...
+
+    # 기본 비동기 구현은 스레드로 위임 (네이티브 비동기 백엔드는 재정의)
+    async def aupload(
+        self,
+        path: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        upsert: bool = False,
+    ) -> str:
+        return await asyncio.to_thread(self.upload, path, data, content_type, upsert)
+
+    async def adownload(self, path: str) -> bytes:
+        return await asyncio.to_thread(self.download, path)
+
+    async def aremove(self, paths: List[str]) -> None:
+        await asyncio.to_thread(self.remove, paths)
+
+    async def asign(self, path: str, expires_in: int) -> Optional[str]:
+        return await asyncio.to_thread(self.sign, path, expires_in)
+
+    async def asign_many(self, paths: List[str], expires_in: int) -> Dict[str, str]:
+        return await asyncio.to_thread(self.sign_many, paths, expires_in)
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        self.close()
+
+
+class SupabaseStorage(StorageBackend):
+    """Supabase Storage REST API over pooled httpx clients."""
+
+    def __init__(
+        self,
+        supabase_url: str,
+        supabase_key: str,
+        bucket_name: str,
+        max_connections: int = 20,
+        timeout: float = 30.0,
+    ):
+        self.supabase_url = supabase_url.rstrip("/")
+        self.supabase_key = supabase_key
+        self.bucket_name = bucket_name
+        self.base_url = f"{self.supabase_url}/storage/v1"
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._timeout = httpx.Timeout(timeout)
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+        # AsyncClient는 이벤트 루프에 묶이므로 루프별로 하나씩 유지
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @property
+    def available(self) -> bool:
+        return bool(self.supabase_url and self.supabase_key)
+
+    @property
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.supabase_key}",
+            "apikey": self.supabase_key,
+        }
+
+    def _sync_client(self) -> httpx.Client:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        headers=self._headers,
+                        limits=self._limits,
+                        timeout=self._timeout,
+                    )
+        return self._client
+
+    def _async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                limits=self._limits,
+                timeout=self._timeout,
+            )
+            self._async_clients[loop] = client
+        return client
+
+    def _object_url(self, *parts: str) -> str:
+        return "/" + "/".join(quote(p, safe="/") for p in parts)
+
+    def _absolute_signed_url(self, signed_path: Optional[str]) -> Optional[str]:
+        if not signed_path:
+            return None
+        return f"{self.base_url}{signed_path}"
+
+    @staticmethod
+    def _check(response: httpx.Response, action: str, path: str) -> httpx.Response:
+        if response.status_code >= 400:
+            raise StorageError(
+                f"Storage {action} failed for {path}: "
+                f"{response.status_code} {response.text[:200]}"
+            )
+        return response
+
+    def public_url(self, path: str) -> str:
+        return f"{self.base_url}/object/public/{self.bucket_name}/{self.storage_path(path)}"
+
+    def _upload_request(self, path: str, data: bytes, content_type: str, upsert: bool):
+        return {
+            "url": self._object_url("object", self.bucket_name, self.storage_path(path)),
+            "content": data,
+            "headers": {
+                "content-type": content_type,
+                "cache-control": "max-age=3600",
+                "x-upsert": "true" if upsert else "false",
+            },
+        }
+
+    def _sign_many_result(self, response: httpx.Response, by_storage_path: Dict[str, str]):
+        signed: Dict[str, str] = {}
+        for item in response.json() or []:
+            if not isinstance(item, dict) or item.get("error"):
+                continue
+            original = by_storage_path.get(item.get("path"))
+            url = self._absolute_signed_url(item.get("signedURL"))
+            if original and url:
+                signed[original] = url
+        return signed
+
+    # --- sync ---------------------------------------------------------------
+
+    def upload(
+        self,
+        path: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        upsert: bool = False,
+    ) -> str:
+        response = self._sync_client().post(
+            **self._upload_request(path, data, content_type, upsert)
+        )
+        self._check(response, "upload", path)
+        return path
+
+    def download(self, path: str) -> bytes:
+        response = self._sync_client().get(
+            self._object_url("object", self.bucket_name, self.storage_path(path))
+        )
+        return self._check(response, "download", path).content
+
+    def remove(self, paths: List[str]) -> None:
+        response = self._sync_client().request(
+            "DELETE",
+            self._object_url("object", self.bucket_name),
+            json={"prefixes": [self.storage_path(p) for p in paths]},
+        )
+        self._check(response, "remove", ", ".join(paths))
+
+    def sign(self, path: str, expires_in: int) -> Optional[str]:
+        response = self._sync_client().post(
+            self._object_url("object", "sign", self.bucket_name, self.storage_path(path)),
+            json={"expiresIn": expires_in},
+        )
+        return self._absolute_signed_url(
+            self._check(response, "sign", path).json().get("signedURL")
+        )
+
+    def sign_many(self, paths: List[str], expires_in: int) -> Dict[str, str]:
+        by_storage_path = {self.storage_path(p): p for p in paths}
+        response = self._sync_client().post(
+            self._object_url("object", "sign", self.bucket_name),
+            json={"expiresIn": expires_in, "paths": list(by_storage_path)},
+        )
+        self._check(response, "sign", f"{len(paths)} paths")
+        return self._sign_many_result(response, by_storage_path)
+
+    # --- async --------------------------------------------------------------
+
+    async def aupload(
+        self,
+        path: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        upsert: bool = False,
+    ) -> str:
+        response = await self._async_client().post(
+            **self._upload_request(path, data, content_type, upsert)
+        )
+        self._check(response, "upload", path)
+        return path
+
+    async def adownload(self, path: str) -> bytes:
+        response = await self._async_client().get(
+            self._object_url("object", self.bucket_name, self.storage_path(path))
+        )
+        return self._check(response, "download", path).content
+
+    async def aremove(self, paths: List[str]) -> None:
+        response = await self._async_client().request(
+            "DELETE",
+            self._object_url("object", self.bucket_name),
+            json={"prefixes": [self.storage_path(p) for p in paths]},
+        )
+        self._check(response, "remove", ", ".join(paths))
+
+    async def asign(self, path: str, expires_in: int) -> Optional[str]:
+        response = await self._async_client().post(
+            self._object_url("object", "sign", self.bucket_name, self.storage_path(path)),
+            json={"expiresIn": expires_in},
+        )
+        return self._absolute_signed_url(
+            self._check(response, "sign", path).json().get("signedURL")
+        )
+
+    async def asign_many(self, paths: List[str], expires_in: int) -> Dict[str, str]:
+        by_storage_path = {self.storage_path(p): p for p in paths}
+        response = await self._async_client().post(
+            self._object_url("object", "sign", self.bucket_name),
+            json={"expiresIn": expires_in, "paths": list(by_storage_path)},
+        )
+        self._check(response, "sign", f"{len(paths)} paths")
+        return self._sign_many_result(response, by_storage_path)
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        self.close()
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+class LocalStorage(StorageBackend):
+    """Objects as files under ``root/bucket``; signed URLs are plain public URLs."""
+
+    def __init__(self, root: str, bucket_name: str, base_url: str = ""):
+        self.root = Path(root) / bucket_name
+        self.bucket_name = bucket_name
+        self.base_url = base_url.rstrip("/")
+
+    def _file(self, path: str) -> Path:
+        target = (self.root / self.storage_path(path)).resolve()
+        if not target.is_relative_to(self.root.resolve()):
+            raise StorageError(f"Path escapes storage root: {path}")
+        return target
+
+    def public_url(self, path: str) -> str:
+        if self.base_url:
+            return f"{self.base_url}/{self.bucket_name}/{self.storage_path(path)}"
+        return self._file(path).as_uri()
+
+    def upload(
+        self,
+        path: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        upsert: bool = False,
+    ) -> str:
+        target = self._file(path)
+        if target.exists() and not upsert:
+            raise StorageError(f"Object already exists: {path}")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+        return path
+
+    def download(self, path: str) -> bytes:
+        try:
+            return self._file(path).read_bytes()
+        except FileNotFoundError:
+            raise StorageError(f"Object not found: {path}")
+
+    def remove(self, paths: List[str]) -> None:
+        for path in paths:
+            self._file(path).unlink(missing_ok=True)
+
+    def sign(self, path: str, expires_in: int) -> Optional[str]:
+        return self.public_url(path)
+
+    def sign_many(self, paths: List[str], expires_in: int) -> Dict[str, str]:
+        return {path: self.public_url(path) for path in paths}
+
+
+def create_storage() -> StorageBackend:
+    if Config.STORAGE_BACKEND == "local":
+        return LocalStorage(
+            root=Config.LOCAL_STORAGE_ROOT,
+            bucket_name=Config.SUPABASE_STORAGE_BUCKET,
+            base_url=Config.LOCAL_STORAGE_BASE_URL,
+        )
+    return SupabaseStorage(
+        supabase_url=Config.SUPABASE_URL,
+        supabase_key=Config.SUPABASE_SERVICE_KEY or Config.SUPABASE_ANON_KEY,
+        bucket_name=Config.SUPABASE_STORAGE_BUCKET,
+        max_connections=Config.STORAGE_MAX_CONNECTIONS,
+    )
+
+
+storage = create_storage()
@@ -1,9 +1,12 @@
+from datetime import datetime, timezone
+
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from app.domains.user.schema import UserCreate
 from app.domains.user.model import User
 from .schema import UserLogin
 from app.core.security import hash_password, verify_password, create_access_token
+from app.domains.user.service import user_manager
 
 
 def register_user(db: Session, user_data: UserCreate):
@@ -22,6 +25,7 @@ def register_user(db: Session, user_data: UserCreate):
         height=user_data.height,
         weight=user_data.weight,
         body_shape=user_data.body_shape,
+        last_active_at=datetime.now(timezone.utc),
     )
     db.add(db_user)
     db.commit()
@@ -44,6 +48,7 @@ def authenticate_user(db: Session, user_data: UserLogin):
         return None
     if not verify_password(user_data.password, user.password):
         return None
+    user_manager.touch_last_active(db, user.id)
 
     # Generate token
     access_token = create_access_token(
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from app.database import Base
@@ -11,12 +11,19 @@ class ChatSession(Base):
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     user_id = Column(PG_UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     session_summary = Column(Text, nullable=True)  # Long-term memory
+    # session_summary 에 접힌 마지막 메시지 시각 (NULL이면 아직 요약 전, 첫 질문만 보관)
+    summary_until = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="chat_sessions")
     messages = relationship("ChatMessage", back_populates="session")
 
+    # 사용자별 세션 목록 (user_id 단독 조회도 이 인덱스의 접두사로 처리)
+    __table_args__ = (
+        Index("ix_chat_sessions_user_id_created_at", "user_id", "created_at"),
+    )
+
 
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
@@ -35,3 +42,8 @@ class ChatMessage(Base):
 
     # Relationships
     session = relationship("ChatSession", back_populates="messages")
+
+    # 세션별 최신 메시지 / 메시지 수 조회 (세션 목록 상관 서브쿼리)
+    __table_args__ = (
+        Index("ix_chat_messages_session_id_created_at", "session_id", "created_at"),
+    )
@@ -1,16 +1,24 @@
 """Chat domain router."""
 
+import base64
+import json
 import logging
+import uuid
+from datetime import datetime
 from fastapi import Query
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy import func, select, tuple_
 
-from app.core.auth import get_current_user
-from app.database import get_db
-from app.domains.user.model import User
-from app.ai.workflows.chat_workflow import get_chat_workflow
+from app.core.auth import get_current_principal
+from app.core.principal import AuthPrincipal
+from app.database import AsyncDB, async_session_scope, get_async_db, run_db
+from app.domains.user.service import user_manager
+from app.ai.workflows.chat_workflow import get_chat_workflow, stream_chat
 from app.ai.schemas.workflow_state import ChatState
 from .model import ChatMessage, ChatSession
+from .service import chat_history_compactor
 from .schema import ChatRequest
 
 logger = logging.getLogger(__name__)
@@ -30,98 +38,140 @@ def _serialize_dt(dt):
 
 
 @chat_router.post("/chat/sessions")
-def create_chat_session(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+async def create_chat_session(
+    current_user: AuthPrincipal = Depends(get_current_principal),
+    db: AsyncDB = Depends(get_async_db),
 ):
     try:
         session = ChatSession(user_id=current_user.id)
         db.add(session)
-        db.commit()
-        db.refresh(session)
+        await db.commit()
+        await db.refresh(session)
         return {
             "success": True,
             "session_id": str(session.id),
             "created_at": _serialize_dt(session.created_at),
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Create chat session error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to process chat message.")
 
 
+def _encode_session_cursor(last_activity, session_id) -> str:
+    raw = f"{last_activity.isoformat()}|{session_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_session_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        last_activity, session_id = raw.split("|", 1)
+        return datetime.fromisoformat(last_activity), uuid.UUID(session_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
 @chat_router.get("/chat/sessions")
-def list_chat_sessions(
+async def list_chat_sessions(
     limit: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    current_user: AuthPrincipal = Depends(get_current_principal),
+    db: AsyncDB = Depends(get_async_db),
 ):
+    """
+    Sessions ordered by last activity (newest first), with keyset pagination.
+
+    Latest message, message count and last activity come from one query
+    (correlated subqueries, each an index probe on
+    ix_chat_messages_session_id_created_at) instead of two extra queries per
+    session.
+    """
+    cursor_key = _decode_session_cursor(cursor) if cursor else None
     try:
-        sessions = (
-            db.query(ChatSession)
-            .filter(ChatSession.user_id == current_user.id)
-            .order_by(ChatSession.created_at.desc())
-            .limit(limit)
-            .all()
+        per_session = ChatMessage.session_id == ChatSession.id
+        latest_content = (
+            select(ChatMessage.content)
+            .where(per_session)
+            .order_by(ChatMessage.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
         )
+        latest_at = select(func.max(ChatMessage.created_at)).where(per_session).scalar_subquery()
+        message_count = select(func.count()).where(per_session).scalar_subquery()
 
-        items = []
-        for s in sessions:
-            latest_message = (
-                db.query(ChatMessage)
-                .filter(ChatMessage.session_id == s.id)
-                .order_by(ChatMessage.created_at.desc())
-                .first()
+        sessions = (
+            select(
+                ChatSession.id,
+                ChatSession.session_summary,
+                ChatSession.created_at,
+                latest_content.label("content"),
+                message_count.label("message_count"),
+                func.coalesce(latest_at, ChatSession.created_at).label("last_activity"),
             )
-            message_count = (
-                db.query(ChatMessage).filter(ChatMessage.session_id == s.id).count()
+            .where(ChatSession.user_id == current_user.id)
+            .subquery("sessions")
+        )
+        query = select(sessions)
+        if cursor_key:
+            query = query.where(
+                tuple_(sessions.c.last_activity, sessions.c.id) < cursor_key
             )
-            preview = (
-                (latest_message.content or "").strip()
-                if latest_message and latest_message.content
-                else (s.session_summary or "New chat")
+        result = await db.execute(
+            query.order_by(sessions.c.last_activity.desc(), sessions.c.id.desc()).limit(
+                limit + 1
             )
+        )
+        rows = result.all()
+
+        items = []
+        for row in rows[:limit]:
+            preview = (row.content or "").strip() or (row.session_summary or "New chat")
             items.append(
                 {
-                    "session_id": str(s.id),
+                    "session_id": str(row.id),
                     "title": preview[:40] if preview else "New chat",
-                    "message_count": message_count,
-                    "created_at": _serialize_dt(s.created_at),
-                    "updated_at": _serialize_dt(
-                        latest_message.created_at if latest_message else s.created_at
-                    ),
+                    "message_count": row.message_count,
+                    "created_at": _serialize_dt(row.created_at),
+                    "updated_at": _serialize_dt(row.last_activity),
                 }
             )
 
-        return {"success": True, "items": items}
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = _encode_session_cursor(last.last_activity, last.id)
+
+        return {"success": True, "items": items, "next_cursor": next_cursor}
     except Exception as e:
         logger.error(f"List chat sessions error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to process chat message.")
 
 
 @chat_router.get("/chat/sessions/{session_id}/messages")
-def get_chat_session_messages(
+async def get_chat_session_messages(
     session_id: str,
     limit: int = Query(100, ge=1, le=300),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: AuthPrincipal = Depends(get_current_principal),
+    db: AsyncDB = Depends(get_async_db),
 ):
     try:
-        session = (
-            db.query(ChatSession)
-            .filter(ChatSession.id == session_id, ChatSession.user_id == current_user.id)
-            .first()
+        session = await db.scalar(
+            select(ChatSession).where(
+                ChatSession.id == session_id, ChatSession.user_id == current_user.id
+            )
         )
         if not session:
             raise HTTPException(status_code=404, detail="Chat session not found.")
 
         messages = (
-            db.query(ChatMessage)
-            .filter(ChatMessage.session_id == session.id)
-            .order_by(ChatMessage.created_at.asc())
-            .limit(limit)
-            .all()
-        )
+            await db.scalars(
+                select(ChatMessage)
+                .where(ChatMessage.session_id == session.id)
+                .order_by(ChatMessage.created_at.asc())
+                .limit(limit)
+            )
+        ).all()
 
         items = [
             {
@@ -141,109 +191,205 @@ def get_chat_session_messages(
         raise HTTPException(status_code=500, detail="Failed to process chat message.")
 
 
-@chat_router.post("/chat")
-async def send_message(
-    request: ChatRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """Process chat message and persist session/messages."""
-    try:
-        session: ChatSession | None = None
-
-        if request.session_id:
-            session = (
-                db.query(ChatSession)
-                .filter(
-                    ChatSession.id == request.session_id,
-                    ChatSession.user_id == current_user.id,
-                )
-                .first()
+async def _prepare_chat(
+    request: ChatRequest, current_user: AuthPrincipal, db: AsyncDB
+) -> tuple[ChatSession, ChatState, bool]:
+    """
+    Resolve/create the session, persist the user message and build the workflow
+    state. The flag tells whether old turns should be folded into the summary.
+    """
+    session: ChatSession | None = None
+    await run_db(db, user_manager.touch_last_active, current_user.id)
+
+    if request.session_id:
+        session = await db.scalar(
+            select(ChatSession).where(
+                ChatSession.id == request.session_id,
+                ChatSession.user_id == current_user.id,
             )
+        )
 
-        if not session:
-            session = ChatSession(user_id=current_user.id)
-            db.add(session)
-            db.commit()
-            db.refresh(session)
-        if not session.session_summary:
-            session.session_summary = request.query[:120]
-            db.commit()
-
-        # Persist user message first.
+    if not session:
+        session = ChatSession(user_id=current_user.id)
+        db.add(session)
+        await db.commit()
+        await db.refresh(session)
+    if not session.session_summary:
+        session.session_summary = request.query[:120]
+        await db.commit()
+
+    # Persist user message first.
+    db.add(
+        ChatMessage(
+            session_id=session.id,
+            sender="USER",
+            content=request.query,
+            extracted_5w1h={"text": request.query},
+        )
+    )
+    await db.commit()
+
+    # Build workflow history from DB so context is server-driven:
+    # long-term summary + every message not folded into it yet.
+    unsummarized = [ChatMessage.session_id == session.id]
+    if session.summary_until is not None:
+        unsummarized.append(ChatMessage.created_at > session.summary_until)
+    unsummarized_count = await db.scalar(
+        select(func.count()).select_from(ChatMessage).where(*unsummarized)
+    )
+    needs_compaction = chat_history_compactor.needs_compaction(unsummarized_count or 0)
+    db_messages = list(
+        reversed(
+            (
+                await db.scalars(
+                    select(ChatMessage)
+                    .where(*unsummarized)
+                    .order_by(ChatMessage.created_at.desc())
+                    .limit(chat_history_compactor.prompt_limit)
+                )
+            ).all()
+        )
+    )
+
+    history: list[dict[str, str]] = []
+    for m in db_messages:
+        text = (m.content or "").strip()
+        if not text and isinstance(m.extracted_5w1h, dict):
+            text = str(m.extracted_5w1h.get("text") or "").strip()
+        if not text:
+            continue
+        history.append({"role": _normalize_role(m.sender), "content": text})
+
+    if not history and request.history:
+        history = request.history[-chat_history_compactor.prompt_limit :]
+
+    initial_state: ChatState = {
+        "messages": history,
+        "user_query": request.query,
+        "context": {
+            "user_id": str(current_user.id),
+            "is_pick_updated": False,
+            "lat": request.lat,
+            "lon": request.lon,
+            "session_id": str(session.id),
+            "session_summary": (
+                session.session_summary if session.summary_until is not None else None
+            ),
+        },
+        "response": None,
+        "recommendations": None,
+        "todays_pick": None,
+    }
+    return session, initial_state, needs_compaction
+
+
+async def _save_assistant_message(db: AsyncDB, session_id, final_state: ChatState) -> None:
+    assistant_text = str(final_state.get("response") or "").strip()
+    if assistant_text:
         db.add(
             ChatMessage(
-                session_id=session.id,
-                sender="USER",
-                content=request.query,
-                extracted_5w1h={"text": request.query},
+                session_id=session_id,
+                sender="AGENT",
+                content=assistant_text,
+                extracted_5w1h={"text": assistant_text},
             )
         )
-        db.commit()
-
-        # Build workflow history from DB so context is server-driven.
-        db_messages = (
-            db.query(ChatMessage)
-            .filter(ChatMessage.session_id == session.id)
-            .order_by(ChatMessage.created_at.asc())
-            .limit(30)
-            .all()
-        )
+        await db.commit()
 
-        history: list[dict[str, str]] = []
-        for m in db_messages:
-            text = (m.content or "").strip()
-            if not text and isinstance(m.extracted_5w1h, dict):
-                text = str(m.extracted_5w1h.get("text") or "").strip()
-            if not text:
-                continue
-            history.append({"role": _normalize_role(m.sender), "content": text})
-
-        if not history and request.history:
-            history = request.history
-
-        initial_state: ChatState = {
-            "messages": history,
-            "user_query": request.query,
-            "context": {
-                "user_id": str(current_user.id),
-                "is_pick_updated": False,
-                "lat": request.lat,
-                "lon": request.lon,
-                "session_id": str(session.id),
-            },
-            "response": None,
-            "recommendations": None,
-            "todays_pick": None,
-        }
+
+def _chat_result(session_id, final_state: ChatState) -> dict:
+    return {
+        "success": True,
+        "session_id": str(session_id),
+        "response": final_state.get("response"),
+        "is_pick_updated": final_state.get("context", {}).get(
+            "is_pick_updated", False
+        ),
+        "recommendations": final_state.get("recommendations"),
+        "todays_pick": final_state.get("todays_pick"),
+    }
+
+
+def _sse(event: str, data: dict) -> str:
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@chat_router.post("/chat")
+async def send_message(
+    request: ChatRequest,
+    background_tasks: BackgroundTasks,
+    current_user: AuthPrincipal = Depends(get_current_principal),
+    db: AsyncDB = Depends(get_async_db),
+):
+    """Process chat message and persist session/messages."""
+    try:
+        session, initial_state, needs_compaction = await _prepare_chat(
+            request, current_user, db
+        )
 
         workflow = get_chat_workflow()
         final_state = await workflow.ainvoke(initial_state)
 
-        assistant_text = str(final_state.get("response") or "").strip()
-        if assistant_text:
-            db.add(
-                ChatMessage(
-                    session_id=session.id,
-                    sender="AGENT",
-                    content=assistant_text,
-                    extracted_5w1h={"text": assistant_text},
-                )
-            )
-            db.commit()
+        await _save_assistant_message(db, session.id, final_state)
+        if needs_compaction:
+            background_tasks.add_task(chat_history_compactor.compact, session.id)
+        return _chat_result(session.id, final_state)
 
-        return {
-            "success": True,
-            "session_id": str(session.id),
-            "response": final_state.get("response"),
-            "is_pick_updated": final_state.get("context", {}).get(
-                "is_pick_updated", False
-            ),
-            "recommendations": final_state.get("recommendations"),
-            "todays_pick": final_state.get("todays_pick"),
-        }
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Chat processing error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to process chat message.")
+
+
+@chat_router.post("/chat/stream")
+async def stream_message(
+    request: ChatRequest,
+    current_user: AuthPrincipal = Depends(get_current_principal),
+    db: AsyncDB = Depends(get_async_db),
+):
+    """
+    Same as ``POST /chat`` but as a Server-Sent Events stream.
 
+    Events: ``session`` (session id), ``status`` (pipeline stage), ``intent``,
+    ``token`` (response text chunks as Gemini produces them), then ``done``
+    with the same body ``POST /chat`` returns, or ``error``. The assistant
+    message is persisted when the stream completes, and old turns are folded
+    into the session summary after that when needed.
+    """
+    try:
+        session, state, needs_compaction = await _prepare_chat(request, current_user, db)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Chat processing error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to process chat message.")
+    session_id = session.id
+
+    async def event_stream():
+        yield _sse("session", {"session_id": str(session_id)})
+        try:
+            async for event, data in stream_chat(state):
+                yield _sse(event, data)
+        except Exception as e:
+            logger.error(f"Chat stream error: {e}", exc_info=True)
+            yield _sse("error", {"detail": "Failed to process chat message."})
+            return
+
+        # 요청 스코프 세션의 수명과 무관하게 별도 세션으로 저장
+        try:
+            async with async_session_scope() as save_db:
+                await _save_assistant_message(save_db, session_id, state)
+        except Exception as e:
+            logger.error(f"Chat stream persist error: {e}", exc_info=True)
+        yield _sse("done", _chat_result(session_id, state))
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=(
+            BackgroundTask(chat_history_compactor.compact, session_id)
+            if needs_compaction
+            else None
+        ),
+    )
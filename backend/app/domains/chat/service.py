@@ -0,0 +1,135 @@
+"""
+Chat history compaction.
+
+Prompts carry ``ChatSession.session_summary`` (long-term memory) plus every
+message newer than the summary, so no turn is ever dropped from context. Once
+more than ``CHAT_COMPACTION_TRIGGER_MESSAGES`` messages are newer than the
+summary, everything except the last ``CHAT_HISTORY_TAIL_MESSAGES`` is folded
+into the summary by one LLM call after the response has been sent, so the
+prompt size per turn stays bounded by the trigger.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Optional
+from uuid import UUID
+
+from app.ai.clients.gemini_client import gemini_client
+from app.ai.prompts.chat_prompts import build_history_summary_prompt
+from app.core.config import Config
+from app.database import SessionLocal
+
+from .model import ChatMessage, ChatSession
+
+logger = logging.getLogger(__name__)
+
+
+def _speaker(sender: str) -> str:
+    role = (sender or "").strip().lower()
+    return "Assistant" if role in {"assistant", "agent", "ai", "bot"} else "User"
+
+
+class ChatHistoryCompactor:
+    """Folds old chat turns into ``ChatSession.session_summary``."""
+
+    def __init__(self, tail_messages: int = 8, trigger_messages: int = 20):
+        self.tail_messages = max(1, tail_messages)
+        self.trigger_messages = max(self.tail_messages + 1, trigger_messages)
+        self._in_flight: set = set()
+        self._lock = threading.Lock()
+
+    def needs_compaction(self, unsummarized_count: int) -> bool:
+        return unsummarized_count > self.trigger_messages
+
+    @property
+    def prompt_limit(self) -> int:
+        """Cap on unsummarized messages per prompt.
+
+        Compaction keeps the count at or below the trigger, so the cap only
+        applies while compaction keeps failing (e.g. the summary call errors).
+        """
+        return 2 * self.trigger_messages
+
+    def _load(self, session_id: UUID):
+        db = SessionLocal()
+        try:
+            session = db.query(ChatSession).filter(ChatSession.id == session_id).first()
+            if not session:
+                return None, None, []
+            query = db.query(ChatMessage).filter(ChatMessage.session_id == session_id)
+            if session.summary_until is not None:
+                query = query.filter(ChatMessage.created_at > session.summary_until)
+            messages = query.order_by(ChatMessage.created_at.asc()).all()
+            previous = session.session_summary if session.summary_until else None
+            return session.summary_until, previous, messages
+        finally:
+            db.close()
+
+    def _save(self, session_id: UUID, expected_until, summary: str, until) -> bool:
+        db = SessionLocal()
+        try:
+            session = db.query(ChatSession).filter(ChatSession.id == session_id).first()
+            # 다른 워커가 먼저 요약했으면 덮어쓰지 않음
+            if not session or session.summary_until != expected_until:
+                return False
+            session.session_summary = summary
+            session.summary_until = until
+            db.commit()
+            return True
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def compact(self, session_id: UUID) -> Optional[str]:
+        """Fold every unsummarized message except the tail into the summary."""
+        with self._lock:
+            if session_id in self._in_flight:
+                return None
+            self._in_flight.add(session_id)
+        try:
+            summary_until, previous, messages = await asyncio.to_thread(
+                self._load, session_id
+            )
+            if not self.needs_compaction(len(messages)):
+                return None
+
+            folded = messages[: -self.tail_messages]
+            transcript = "\n".join(
+                f"{_speaker(m.sender)}: {(m.content or '').strip()}"
+                for m in folded
+                if (m.content or "").strip()
+            )
+            summary = await gemini_client.generate_content_async(
+                build_history_summary_prompt(previous, transcript),
+                temperature=0.2,
+                max_output_tokens=400,
+                cache=False,
+            )
+            summary = (summary or "").strip()
+            if not summary:
+                logger.warning(f"Chat session {session_id}: empty summary, compaction skipped")
+                return None
+
+            saved = await asyncio.to_thread(
+                self._save, session_id, summary_until, summary, folded[-1].created_at
+            )
+            if saved:
+                logger.info(
+                    f"Chat session {session_id}: folded {len(folded)} messages into summary"
+                )
+            return summary if saved else None
+        except Exception as e:
+            logger.error(f"Chat history compaction failed for {session_id}: {e}")
+            return None
+        finally:
+            with self._lock:
+                self._in_flight.discard(session_id)
+
+
+chat_history_compactor = ChatHistoryCompactor(
+    tail_messages=Config.CHAT_HISTORY_TAIL_MESSAGES,
+    trigger_messages=Config.CHAT_COMPACTION_TRIGGER_MESSAGES,
+)
@@ -0,0 +1,155 @@
+"""
+Upload dedup for attribute extraction.
+
+Every saved closet item stores the SHA-256 of the uploaded bytes and a 64-bit
+difference hash (dHash) of the image. A new upload that matches one of the
+user's items exactly (SHA-256) reuses that item's attributes and processed
+image, so the Gemini Vision call, background removal and storage upload are
+skipped.
+
+Near matching (dHash within ``EXTRACTION_DEDUP_DHASH_DISTANCE`` bits, e.g. the
+same photo re-encoded or resized) is opt-in and off by default: dHash only
+compares grayscale structure, so the same cut in another color can match and
+would inherit the other garment's attributes, color included.
+"""
+
+import hashlib
+import io
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+import numpy as np
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+DHASH_SIZE = 8
+_SIGN_BIT = 1 << 63
+_MASK64 = (1 << 64) - 1
+
+
+def image_sha256(contents: bytes) -> str:
+    return hashlib.sha256(contents).hexdigest()
+
+
+def image_dhash(contents: bytes) -> Optional[int]:
+    """
+    64-bit difference hash as a signed integer (fits a Postgres BIGINT).
+
+    Returns None when the bytes cannot be decoded as an image.
+    """
+    try:
+        with Image.open(io.BytesIO(contents)) as img:
+            gray = img.convert("L").resize(
+                (DHASH_SIZE + 1, DHASH_SIZE), Image.Resampling.LANCZOS
+            )
+            pixels = np.asarray(gray, dtype=np.int16)
+    except Exception as e:
+        logger.debug(f"dHash skipped, undecodable image: {e}")
+        return None
+
+    bits = (pixels[:, 1:] > pixels[:, :-1]).ravel()
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return value - (1 << 64) if value & _SIGN_BIT else value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & _MASK64).count("1")
+
+
+@dataclass
+class DedupHit:
+    item_id: UUID
+    image_path: str
+    attributes: Dict[str, Any]
+    exact: bool
+
+
+class ExtractionDedupIndex:
+    """Per-user lookup of previously extracted uploads (with hit counters)."""
+
+    def __init__(self, max_distance: int = 0):
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    def lookup(
+        self,
+        db: Session,
+        user_id: UUID,
+        sha256: str,
+        dhash: Optional[int],
+    ) -> Optional[DedupHit]:
+        from app.domains.wardrobe.model import ClosetItem
+
+        base = db.query(
+            ClosetItem.id, ClosetItem.image_path, ClosetItem.features
+        ).filter(
+            ClosetItem.user_id == user_id,
+            ClosetItem.image_path != "",
+            ClosetItem.features.isnot(None),
+        )
+
+        row = base.filter(ClosetItem.image_sha256 == sha256).first()
+        exact = row is not None
+        if row is None and dhash is not None and self.max_distance > 0:
+            # 해시만 읽어 가장 가까운 항목을 찾은 뒤 해당 행만 조회
+            candidates = (
+                db.query(ClosetItem.id, ClosetItem.image_dhash)
+                .filter(
+                    ClosetItem.user_id == user_id,
+                    ClosetItem.image_dhash.isnot(None),
+                )
+                .all()
+            )
+            best_id, best_distance = None, self.max_distance + 1
+            for candidate_id, candidate_hash in candidates:
+                distance = hamming_distance(dhash, candidate_hash)
+                if distance < best_distance:
+                    best_id, best_distance = candidate_id, distance
+            if best_id is not None:
+                row = base.filter(ClosetItem.id == best_id).first()
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            elif exact:
+                self.exact_hits += 1
+            else:
+                self.near_hits += 1
+
+        if row is None:
+            return None
+        return DedupHit(
+            item_id=row.id,
+            image_path=row.image_path,
+            attributes=dict(row.features),
+            exact=exact,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self.exact_hits + self.near_hits
+            lookups = hits + self.misses
+            return {
+                "exact_hits": self.exact_hits,
+                "near_hits": self.near_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "max_distance": self.max_distance,
+            }
+
+
+extraction_dedup_index = ExtractionDedupIndex(
+    max_distance=Config.EXTRACTION_DEDUP_DHASH_DISTANCE
+)
@@ -1,9 +1,19 @@
+import asyncio
 import logging
+from dataclasses import dataclass
+from typing import Optional
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
-from app.core.auth import get_current_user
-from app.domains.user.model import User
+from app.core.auth import get_current_principal
+from app.core.principal import AuthPrincipal
 from .service import extractor
-from .schema import ExtractionResponse, ExtractionUrlResponse, MultiExtractionResponse
+from .dedup import extraction_dedup_index, image_dhash, image_sha256
+from .schema import (
+    ExtractionFailure,
+    ExtractionResponse,
+    ExtractionUrlResponse,
+    MultiExtractionResponse,
+)
+from app.core.config import Config
 from app.core.schemas import AttributesSchema
 from app.utils.validators import validate_uploaded_file
 from app.utils.response_helpers import handle_route_exception
@@ -15,7 +25,206 @@ extraction_router = APIRouter()
 
 
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import AsyncDB, get_async_db, run_db
+
+
+@dataclass
+class _Upload:
+    """Per-image state carried between the stages of a /extract request."""
+
+    contents: bytes
+    sha256: str
+    dhash: Optional[int]
+    attributes: Optional[dict] = None
+    image_path: Optional[str] = None
+    processed: Optional[bytes] = None
+
+
+class _ExtractionBatcher:
+    """
+    Groups new images into batched Gemini calls as their inspection finishes.
+
+    A call is sent as soon as ``batch_size`` images are waiting, or when no
+    more images can arrive. Each image awaits only the future of its own slot,
+    so images of a finished call move on to upload/insert while other calls
+    are still running.
+    """
+
+    def __init__(self, expected: int, batch_size: int):
+        self._remaining = expected
+        self._batch_size = max(1, batch_size)
+        self._waiting: list[tuple[bytes, asyncio.Future]] = []
+        self._calls: set[asyncio.Task] = set()
+
+    def submit(self, contents: bytes) -> asyncio.Future:
+        slot = asyncio.get_running_loop().create_future()
+        self._waiting.append((contents, slot))
+        self._resolved()
+        return slot
+
+    def skip(self) -> None:
+        """The image needs no extraction (reused or failed before extraction)."""
+        self._resolved()
+
+    def _resolved(self) -> None:
+        self._remaining -= 1
+        while len(self._waiting) >= self._batch_size or (
+            self._waiting and self._remaining <= 0
+        ):
+            chunk = self._waiting[: self._batch_size]
+            del self._waiting[: self._batch_size]
+            call = asyncio.create_task(self._extract(chunk))
+            self._calls.add(call)
+            call.add_done_callback(self._calls.discard)
+
+    async def _extract(self, chunk: list[tuple[bytes, asyncio.Future]]) -> None:
+        try:
+            results = await extractor.extract_batch_async([contents for contents, _ in chunk])
+        except Exception as e:
+            for _, slot in chunk:
+                if not slot.done():
+                    slot.set_exception(e)
+            return
+        for (_, slot), attributes in zip(chunk, results):
+            if not slot.done():
+                slot.set_result(attributes)
+
+    def cancel(self) -> None:
+        for call in list(self._calls):
+            call.cancel()
+
+
+async def _inspect_upload(
+    idx: int,
+    total: int,
+    img: UploadFile,
+    user_id,
+    db: AsyncDB,
+    db_lock: asyncio.Lock,
+    semaphore: asyncio.Semaphore,
+) -> _Upload:
+    """Read, validate and hash one image, reusing a previous extraction if any."""
+    async with semaphore:
+        contents = await img.read()
+        size = len(contents)
+        logger.info(f"Processing image {idx+1}/{total}: {img.filename} ({size} bytes)")
+
+        # File validation
+        validate_uploaded_file(
+            filename=img.filename,
+            content_type=img.content_type,
+            file_size=size,
+        )
+
+        # Reuse a previous extraction of the same (or near-identical) photo
+        upload = _Upload(
+            contents=contents,
+            sha256=image_sha256(contents),
+            dhash=await asyncio.to_thread(image_dhash, contents),
+        )
+        async with db_lock:
+            hit = await run_db(
+                db, extraction_dedup_index.lookup, user_id, upload.sha256, upload.dhash
+            )
+
+    if hit:
+        logger.info(
+            f"Image {idx+1} matches item {hit.item_id} "
+            f"({'exact' if hit.exact else 'near'}), skipping extraction."
+        )
+        upload.attributes = hit.attributes
+        upload.image_path = hit.image_path
+    return upload
+
+
+async def _remove_background(upload: _Upload, semaphore: asyncio.Semaphore) -> bytes:
+    async with semaphore:
+        return await image_processing_service.remove_background_bytes(upload.contents)
+
+
+def _insert_upload(db: Session, user_id, upload: _Upload) -> dict:
+    from app.domains.wardrobe.service import wardrobe_manager
+
+    try:
+        return wardrobe_manager.insert_item(
+            db,
+            user_id,
+            upload.image_path,
+            upload.attributes,
+            image_sha256=upload.sha256,
+            image_dhash=upload.dhash,
+            resolve_image_url=False,
+        )
+    except Exception:
+        db.rollback()
+        raise
+
+
+async def _save_upload(
+    idx: int,
+    img: UploadFile,
+    upload: _Upload,
+    user_id,
+    db: AsyncDB,
+    db_lock: asyncio.Lock,
+    semaphore: asyncio.Semaphore,
+) -> ExtractionResponse:
+    """Upload the processed image (unless reused) and insert the closet item."""
+    from app.domains.wardrobe.service import wardrobe_manager
+
+    if upload.image_path is None:
+        processed_filename = f"{(img.filename or 'item').rsplit('.', 1)[0]}.png"
+        async with semaphore:
+            upload.image_path = await wardrobe_manager.upload_image_async(
+                upload.processed, processed_filename, user_id
+            )
+
+    logger.info(f"Saving item {idx+1} to database...")
+    async with db_lock:
+        record = await run_db(db, _insert_upload, user_id, upload)
+
+    item_id = str(record["item_id"])
+    logger.info(f"Item {idx+1} processed successfully. Item ID: {item_id}")
+    return ExtractionResponse(
+        success=True,
+        attributes=AttributesSchema(**upload.attributes),
+        saved_to=f"supabase:{item_id}",
+        image_url=await wardrobe_manager.aget_signed_url(record["image_url"]),
+        item_id=item_id,
+        blob_name=record["blob_name"],
+        storage_type="supabase",
+    )
+
+
+async def _process_upload(
+    idx: int,
+    images: list[UploadFile],
+    user_id,
+    db: AsyncDB,
+    db_lock: asyncio.Lock,
+    semaphore: asyncio.Semaphore,
+    batcher: _ExtractionBatcher,
+) -> ExtractionResponse:
+    """One image end to end; stages of different images overlap."""
+    try:
+        upload = await _inspect_upload(
+            idx, len(images), images[idx], user_id, db, db_lock, semaphore
+        )
+    except BaseException:
+        batcher.skip()
+        raise
+
+    if upload.attributes is None:
+        # 배치 호출 중 자기 자리의 결과와 자기 배경 제거만 기다림
+        upload.attributes, upload.processed = await asyncio.gather(
+            batcher.submit(upload.contents), _remove_background(upload, semaphore)
+        )
+    else:
+        batcher.skip()
+
+    return await _save_upload(
+        idx, images[idx], upload, user_id, db, db_lock, semaphore
+    )
 
 
 @extraction_router.post(
@@ -26,97 +235,67 @@ from app.database import get_db
 )
 async def extract(
     images: list[UploadFile] = File(..., description="업로드할 옷 이미지 파일들"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: AuthPrincipal = Depends(get_current_principal),
+    db: AsyncDB = Depends(get_async_db),
 ):
     """
     Extract and save clothing attributes for each image individually.
+
+    Every image runs as its own pipeline: read/validate/dedup lookup, then
+    (for a new image) its slot in a batched Gemini call (EXTRACT_BATCH_SIZE
+    images per call) together with its background removal, then storage
+    upload and DB insert. Stages of different images overlap, so one slow
+    image does not hold back the others; network-bound steps share
+    EXTRACT_MAX_CONCURRENCY slots. A failing image is reported in ``failed``
+    without aborting the others; the request only fails when no image could
+    be saved.
     """
     logger.info("=== Batch Extract Request Started ===")
     logger.info(f"User authenticated: ID={current_user.id}")
     logger.info(f"Received {len(images)} images for batch extraction.")
 
-    results: list[ExtractionResponse] = []
+    semaphore = asyncio.Semaphore(max(1, Config.EXTRACT_MAX_CONCURRENCY))
+    # 같은 세션을 동시에 쓰지 않도록 DB 작업만 직렬화 (루프는 막지 않음)
+    db_lock = asyncio.Lock()
+    batcher = _ExtractionBatcher(len(images), Config.EXTRACT_BATCH_SIZE)
+    user_id = current_user.id
 
     try:
-        from app.domains.wardrobe.service import wardrobe_manager
-
-        for idx, img in enumerate(images):
-            try:
-                contents = await img.read()
-                size = len(contents)
-                logger.info(
-                    f"Processing image {idx+1}/{len(images)}: {img.filename} ({size} bytes)"
-                )
-
-                # File validation
-                validate_uploaded_file(
-                    filename=img.filename,
-                    content_type=img.content_type,
-                    file_size=size,
-                )
-
-                # Individual extraction for this specific image
-                logger.info(f"Starting attribute extraction for image {idx+1}...")
-                attributes = extractor.extract(
-                    [contents]
-                )  # Pass as list of 1 for multi-image logic compatibility
-
-                # Remove background immediately after upload and before storage.
-                logger.info(f"Running background removal for image {idx+1}...")
-                processed_contents = await image_processing_service.remove_background_bytes(
-                    contents
-                )
-                processed_filename = f"{(img.filename or 'item').rsplit('.', 1)[0]}.png"
-
-                # Save as individual item
-                logger.info(f"Saving item {idx+1} to database...")
-                record = wardrobe_manager.save_item(
-                    db=db,
-                    image_bytes=processed_contents,
-                    original_filename=processed_filename,
-                    attributes=attributes,
-                    user_id=current_user.id,
-                )
-
-                item_id = str(record["item_id"])
-                image_url = record["image_url"]
-                blob_name = record["blob_name"]
-
-                results.append(
-                    ExtractionResponse(
-                        success=True,
-                        attributes=AttributesSchema(**attributes),
-                        saved_to=f"supabase:{item_id}",
-                        image_url=image_url,
-                        item_id=item_id,
-                        blob_name=blob_name,
-                        storage_type="supabase",
-                    )
-                )
-                logger.info(f"Item {idx+1} processed successfully. Item ID: {item_id}")
-
-            except Exception as item_err:
-                logger.error(
-                    f"Failed to process image {idx+1} ({img.filename}): {item_err}"
-                )
-                # We could continue with other items or fail the whole request.
-                # Here we continue but mark it as failure (though pydantic might complain if success=False isn't handled)
-                # For now, let's let individual failures raise exception to keep it simple,
-                # or just skip. Let's raise for now to be safe.
-                raise
-
-        logger.info(f"=== Batch Extract Completed: {len(results)} items processed ===")
-        return MultiExtractionResponse(
-            success=True, items=results, total_processed=len(results)
+        outcomes = await asyncio.gather(
+            *(
+                _process_upload(idx, images, user_id, db, db_lock, semaphore, batcher)
+                for idx in range(len(images))
+            ),
+            return_exceptions=True,
         )
+    finally:
+        batcher.cancel()
 
-    except HTTPException as e:
-        logger.error(f"HTTPException: {e.status_code} - {e.detail}")
-        raise
-    except Exception as e:
+    results: list[ExtractionResponse] = []
+    failed: list[ExtractionFailure] = []
+    errors: list[Exception] = []
+    for idx, (img, outcome) in enumerate(zip(images, outcomes)):
+        if isinstance(outcome, ExtractionResponse):
+            results.append(outcome)
+            continue
+        if not isinstance(outcome, Exception):
+            raise outcome  # CancelledError 등은 그대로 전파
+        errors.append(outcome)
+        detail = outcome.detail if isinstance(outcome, HTTPException) else str(outcome)
         logger.error(
-            f"Unexpected error during extraction: {type(e).__name__}: {str(e)}",
-            exc_info=True,
+            f"Failed to process image {idx+1} ({img.filename}): "
+            f"{type(outcome).__name__}: {detail}",
+            exc_info=not isinstance(outcome, HTTPException),
         )
-        raise handle_route_exception(e)
+        failed.append(ExtractionFailure(index=idx, filename=img.filename, error=str(detail)))
+
+    if errors and not results:
+        raise handle_route_exception(errors[0])
+
+    logger.info(
+        f"=== Batch Extract Completed: {len(results)} items processed, "
+        f"{len(failed)} failed ==="
+    )
+    return MultiExtractionResponse(
+        success=True, items=results, total_processed=len(results), failed=failed
+    )
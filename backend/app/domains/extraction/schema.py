@@ -13,10 +13,17 @@ class ExtractionResponse(BaseModel):
     storage_type: Optional[str] = Field(None)
 
 
+class ExtractionFailure(BaseModel):
+    index: int
+    filename: Optional[str] = Field(None)
+    error: str
+
+
 class MultiExtractionResponse(BaseModel):
     success: bool
     items: list[ExtractionResponse]
     total_processed: int
+    failed: list[ExtractionFailure] = Field(default_factory=list)
 
 
 class ExtractionUrlResponse(BaseModel):
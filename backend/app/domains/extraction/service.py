@@ -1,6 +1,10 @@
 import logging
-from typing import Dict, Any
-from app.ai.workflows.extraction_workflow import extract_attributes
+from typing import Dict, Any, List
+from app.ai.workflows.extraction_workflow import (
+    extract_attributes,
+    extract_attributes_async,
+    extract_attributes_batch_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +37,47 @@ class AttributeExtractor:
         )
         return extract_attributes(images, retry_on_schema_fail=retry_on_schema_fail)
 
+    async def extract_async(
+        self, images: bytes | list[bytes], retry_on_schema_fail: bool = True
+    ) -> Dict[str, Any]:
+        """
+        이미지(들)에서 의류 속성 추출 (비동기, 라우터 등 async 경로용)
+
+        Args:
+            images: 단일 이미지 바이트 또는 이미지 바이트 리스트
+            retry_on_schema_fail: 스키마 검증 실패 시 재시도 여부
+
+        Returns:
+            추출된 속성 딕셔너리 (신뢰도 포함)
+        """
+        if isinstance(images, bytes):
+            images = [images]
+
+        logger.info(
+            f"Extracting attributes from {len(images)} images with confidence scores..."
+        )
+        return await extract_attributes_async(
+            images, retry_on_schema_fail=retry_on_schema_fail
+        )
+
+    async def extract_batch_async(
+        self, images: list[bytes], retry_on_schema_fail: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        서로 다른 옷 사진 여러 장을 배치 호출로 추출 (사진당 결과 1개)
+
+        Args:
+            images: 이미지 바이트 리스트 (각각 다른 옷)
+            retry_on_schema_fail: 검증에 실패한 사진만 한 번 재요청할지 여부
+
+        Returns:
+            입력 순서대로의 속성 딕셔너리 리스트
+        """
+        logger.info(f"Batch extracting attributes from {len(images)} garments...")
+        return await extract_attributes_batch_async(
+            images, retry_on_schema_fail=retry_on_schema_fail
+        )
+
 
 # 싱글톤 인스턴스 (하위 호환성 유지)
 extractor = AttributeExtractor()
@@ -102,7 +102,9 @@ class GenerationService:
                 "Calling Nano Banana for outfit generation with reference images..."
             )
 
-            image_url = self.client.generate_mannequin_composite(
+            # 이미지 생성/업로드는 동기 SDK 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            image_url = await asyncio.to_thread(
+                self.client.generate_mannequin_composite,
                 top_description=top_desc,
                 bottom_description=bottom_desc,
                 gender=request.gender,
@@ -0,0 +1,177 @@
+"""
+Pure image effects: encoded image bytes in, PNG bytes out.
+
+These functions hold no request state so they can run in a thread or in an
+image worker process (see worker_pool.py) unchanged. Input may be any
+bytes-like buffer; a worker passes a memoryview of its shared memory block,
+which is decoded in place rather than copied into a ``bytes`` first.
+"""
+
+import io
+from typing import Callable, Dict
+
+from PIL import Image, ImageEnhance, ImageFilter
+
+# Optional imports with fallbacks
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy import ndimage
+except ImportError:
+    ndimage = None
+
+
+class _BufferReader(io.RawIOBase):
+    """Seekable read-only file over a bytes-like buffer, without copying it."""
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = max(0, min(len(b), len(self._view) - self._pos))
+        b[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        # 공유 메모리 블록을 닫을 수 있도록 뷰를 놓아줌
+        self._view.release()
+        super().close()
+
+
+def _open(image_bytes) -> Image.Image:
+    """Decode fully while the buffer is still valid, then drop the reference."""
+    with _BufferReader(image_bytes) as fp:
+        image = Image.open(fp)
+        image.load()
+    return image
+
+
+def _to_png(image: Image.Image, **save_kwargs) -> bytes:
+    buffered = io.BytesIO()
+    image.save(buffered, format="PNG", **save_kwargs)
+    return buffered.getvalue()
+
+
+def remove_background(image_bytes: bytes) -> bytes:
+    """Background removal with a pooled rembg session of the current process."""
+    from rembg import remove
+
+    from .session_pool import rembg_session_pool
+
+    image = _open(image_bytes)
+    with rembg_session_pool.session() as session:
+        return _to_png(remove(image, session=session))
+
+
+def silhouette(image_bytes: bytes) -> bytes:
+    """Clothing silhouette for hanger display"""
+    image = _open(image_bytes)
+
+    # Convert to grayscale
+    gray_image = image.convert("L")
+
+    # Enhance contrast
+    enhancer = ImageEnhance.Contrast(gray_image)
+    enhanced = enhancer.enhance(2.0)
+
+    # Apply threshold
+    if np is not None:
+        img_array = np.array(enhanced)
+
+        # Adaptive thresholding
+        threshold = np.percentile(img_array, 70)
+        silhouette_array = np.where(img_array > threshold, 0, 255)
+
+        # Clean up with morphological operations
+        if ndimage is not None:
+            silhouette_array = ndimage.binary_closing(silhouette_array, iterations=2)
+
+        # Convert back to image
+        silhouette_image = Image.fromarray(
+            silhouette_array.astype(np.uint8) * 255, mode="L"
+        )
+    else:
+        # Fallback processing without numpy
+        silhouette_image = enhanced
+
+    # Create RGBA version with transparency
+    rgba_image = Image.new("RGBA", silhouette_image.size, (0, 0, 0, 0))
+    rgba_image.paste(silhouette_image, mask=silhouette_image)
+    return _to_png(rgba_image)
+
+
+def shadow(image_bytes: bytes) -> bytes:
+    """Realistic shadow effect"""
+    image = _open(image_bytes)
+
+    # Convert to RGBA
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+
+    # Create shadow layer
+    shadow_layer = Image.new("RGBA", image.size, (0, 0, 0, 80))
+    shadow_layer = shadow_layer.filter(ImageFilter.GaussianBlur(radius=10))
+
+    # Offset shadow
+    shadow_offset = Image.new("RGBA", image.size, (0, 0, 0, 0))
+    shadow_offset.paste(shadow_layer, (8, 8))
+
+    # Composite original image with shadow
+    return _to_png(Image.alpha_composite(shadow_offset, image))
+
+
+def enhance(image_bytes: bytes) -> bytes:
+    """Color / contrast / sharpness enhancement"""
+    image = _open(image_bytes)
+
+    # Convert to RGBA if needed
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+
+    # Enhance colors
+    enhanced = ImageEnhance.Color(image).enhance(1.2)
+
+    # Enhance contrast
+    enhanced = ImageEnhance.Contrast(enhanced).enhance(1.1)
+
+    # Enhance sharpness
+    enhanced = ImageEnhance.Sharpness(enhanced).enhance(1.1)
+    return _to_png(enhanced, optimize=True)
+
+
+EFFECTS: Dict[str, Callable[[bytes], bytes]] = {
+    "background_removal": remove_background,
+    "silhouette": silhouette,
+    "shadow": shadow,
+    "enhance": enhance,
+}
+
+
+def apply(effect: str, image_bytes: bytes) -> bytes:
+    try:
+        func = EFFECTS[effect]
+    except KeyError:
+        raise ValueError(f"Unknown image effect: {effect}")
+    return func(image_bytes)
@@ -1,19 +1,11 @@
+import asyncio
 import requests
-import io
 import base64
-from PIL import Image, ImageFilter, ImageEnhance
-from rembg import remove, new_session
+from rembg import remove
 
-# Optional imports with fallbacks
-try:
-    import numpy as np
-except ImportError:
-    np = None
-
-try:
-    from scipy import ndimage
-except ImportError:
-    ndimage = None
+from . import effects
+from .session_pool import rembg_session_pool
+from .worker_pool import image_worker_pool, process_mode_enabled
 
 
 class ImageProcessingService:
@@ -64,21 +56,17 @@ class ImageProcessingService:
         try:
             # Download image
             print("[DEBUG] Downloading image...")
-            response = requests.get(image_url)
-            response.raise_for_status()
-            image_data = response.content
+            image_data = await self._download(image_url)
             print(f"[DEBUG] Image downloaded. Size: {len(image_data)} bytes")
 
-            # Process with rembg using lightweight model (u2netp)
-            print("[DEBUG] Loading rembg session (u2netp)...")
-            session = new_session("u2netp")
             print("[DEBUG] Running remove()...")
-            output_data = remove(image_data, session=session)
+            if process_mode_enabled():
+                output_data = await image_worker_pool.run("background_removal", image_data)
+            else:
+                output_data = await asyncio.to_thread(self._remove_with_pooled_session, image_data)
             print(f"[DEBUG] Background removed. Output size: {len(output_data)} bytes")
 
-            # Convert to base64
-            img_str = base64.b64encode(output_data).decode()
-            return f"data:image/png;base64,{img_str}"
+            return self._to_data_url(output_data)
 
         except Exception as e:
             print(f"[ERROR] Local background removal error: {e}")
@@ -88,58 +76,48 @@ class ImageProcessingService:
             return image_url
 
     async def remove_background_bytes(self, image_bytes: bytes) -> bytes:
-        """Remove background from raw image bytes using local rembg model."""
+        """Remove background from raw image bytes using local rembg model.
+
+        rembg inference is CPU-bound, so it runs in an image worker process
+        (IMAGE_WORKER_MODE=process) or a worker thread, keeping the event
+        loop free for other uploads.
+        """
         try:
-            session = new_session("u2netp")
-            return remove(image_bytes, session=session)
+            if process_mode_enabled():
+                return await image_worker_pool.run("background_removal", image_bytes)
+            return await asyncio.to_thread(self._remove_with_pooled_session, image_bytes)
         except Exception as e:
             print(f"[ERROR] Byte background removal error: {e}")
             return image_bytes
 
+    def _remove_with_pooled_session(self, image_bytes: bytes) -> bytes:
+        # Process with a pooled rembg session (loaded once per process)
+        with rembg_session_pool.session() as session:
+            return remove(image_bytes, session=session)
+
+    async def _download(self, image_url: str) -> bytes:
+        response = await asyncio.to_thread(requests.get, image_url)
+        response.raise_for_status()
+        return response.content
+
+    @staticmethod
+    def _to_data_url(png_bytes: bytes) -> str:
+        img_str = base64.b64encode(png_bytes).decode()
+        return f"data:image/png;base64,{img_str}"
+
+    async def _apply_effect(self, effect: str, image_url: str) -> str:
+        """Download, run a CPU-bound effect off the event loop, return a data URL."""
+        image_data = await self._download(image_url)
+        if process_mode_enabled():
+            output = await image_worker_pool.run(effect, image_data)
+        else:
+            output = await asyncio.to_thread(effects.apply, effect, image_data)
+        return self._to_data_url(output)
+
     async def _create_silhouette(self, image_url: str) -> str:
         """Create clothing silhouette for hanger display"""
         try:
-            response = requests.get(image_url)
-            image = Image.open(io.BytesIO(response.content))
-
-            # Convert to grayscale
-            gray_image = image.convert("L")
-
-            # Enhance contrast
-            enhancer = ImageEnhance.Contrast(gray_image)
-            enhanced = enhancer.enhance(2.0)
-
-            # Apply threshold
-            if np is not None:
-                img_array = np.array(enhanced)
-
-                # Adaptive thresholding
-                threshold = np.percentile(img_array, 70)
-                silhouette = np.where(img_array > threshold, 0, 255)
-
-                # Clean up with morphological operations
-                if ndimage is not None:
-                    silhouette = ndimage.binary_closing(silhouette, iterations=2)
-
-                # Convert back to image
-                silhouette_image = Image.fromarray(
-                    silhouette.astype(np.uint8) * 255, mode="L"
-                )
-            else:
-                # Fallback processing without numpy
-                silhouette_image = enhanced
-
-            # Create RGBA version with transparency
-            rgba_image = Image.new("RGBA", silhouette_image.size, (0, 0, 0, 0))
-            rgba_image.paste(silhouette_image, mask=silhouette_image)
-
-            # Convert to base64
-            buffered = io.BytesIO()
-            rgba_image.save(buffered, format="PNG")
-            img_str = base64.b64encode(buffered.getvalue()).decode()
-
-            return f"data:image/png;base64,{img_str}"
-
+            return await self._apply_effect("silhouette", image_url)
         except Exception as e:
             print(f"Silhouette generation error: {e}")
             return image_url
@@ -147,31 +125,7 @@ class ImageProcessingService:
     async def _add_shadow_effect(self, image_url: str) -> str:
         """Add realistic shadow effect to clothing"""
         try:
-            response = requests.get(image_url)
-            image = Image.open(io.BytesIO(response.content))
-
-            # Convert to RGBA
-            if image.mode != "RGBA":
-                image = image.convert("RGBA")
-
-            # Create shadow layer
-            shadow = Image.new("RGBA", image.size, (0, 0, 0, 80))
-            shadow = shadow.filter(ImageFilter.GaussianBlur(radius=10))
-
-            # Offset shadow
-            shadow_offset = Image.new("RGBA", image.size, (0, 0, 0, 0))
-            shadow_offset.paste(shadow, (8, 8))
-
-            # Composite original image with shadow
-            result = Image.alpha_composite(shadow_offset, image)
-
-            # Convert to base64
-            buffered = io.BytesIO()
-            result.save(buffered, format="PNG")
-            img_str = base64.b64encode(buffered.getvalue()).decode()
-
-            return f"data:image/png;base64,{img_str}"
-
+            return await self._apply_effect("shadow", image_url)
         except Exception as e:
             print(f"Shadow effect error: {e}")
             return image_url
@@ -179,32 +133,7 @@ class ImageProcessingService:
     async def _enhance_clothing(self, image_url: str) -> str:
         """Enhance clothing image quality"""
         try:
-            response = requests.get(image_url)
-            image = Image.open(io.BytesIO(response.content))
-
-            # Convert to RGBA if needed
-            if image.mode != "RGBA":
-                image = image.convert("RGBA")
-
-            # Enhance colors
-            enhancer = ImageEnhance.Color(image)
-            enhanced = enhancer.enhance(1.2)
-
-            # Enhance contrast
-            enhancer = ImageEnhance.Contrast(enhanced)
-            enhanced = enhancer.enhance(1.1)
-
-            # Enhance sharpness
-            enhancer = ImageEnhance.Sharpness(enhanced)
-            enhanced = enhancer.enhance(1.1)
-
-            # Convert to base64
-            buffered = io.BytesIO()
-            enhanced.save(buffered, format="PNG", optimize=True)
-            img_str = base64.b64encode(buffered.getvalue()).decode()
-
-            return f"data:image/png;base64,{img_str}"
-
+            return await self._apply_effect("enhance", image_url)
         except Exception as e:
             print(f"Image enhancement error: {e}")
             return image_url
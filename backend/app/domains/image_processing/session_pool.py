@@ -0,0 +1,111 @@
+"""
+Process-wide rembg session pool.
+
+Creating a rembg session loads the ONNX model from disk, which costs hundreds
+of milliseconds and a model-sized allocation. Sessions are created once
+(at startup via ``load`` or lazily on first use) and handed out to callers;
+``REMBG_POOL_SIZE`` also caps how many inferences run in parallel.
+"""
+
+import io
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from PIL import Image
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class RembgSessionPool:
+    """Fixed-size pool of rembg sessions (thread-safe)."""
+
+    def __init__(
+        self,
+        model_name: str = "u2netp",
+        pool_size: int = 1,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+    ):
+        self.model_name = model_name
+        self.pool_size = max(1, pool_size)
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._sessions: List = []
+        self._lock = threading.Lock()
+
+    def _session_options(self):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        # 0이면 onnxruntime 기본값(코어 수 기반) 사용
+        if self.intra_op_threads > 0:
+            options.intra_op_num_threads = self.intra_op_threads
+        if self.inter_op_threads > 0:
+            options.inter_op_num_threads = self.inter_op_threads
+        return options
+
+    def _create_session(self):
+        from rembg import new_session
+
+        logger.info(f"Loading rembg session ({self.model_name})...")
+        return new_session(self.model_name, sess_opts=self._session_options())
+
+    def _grow(self) -> Optional[object]:
+        """Create one more session, or return None if the pool is full."""
+        with self._lock:
+            if len(self._sessions) >= self.pool_size:
+                return None
+            session = self._create_session()
+            self._sessions.append(session)
+            return session
+
+    @property
+    def loaded(self) -> int:
+        return len(self._sessions)
+
+    def load(self, warmup: bool = True) -> None:
+        """Create every session up front, optionally running one warm-up inference each."""
+        while (session := self._grow()) is not None:
+            self._idle.put(session)
+        if warmup:
+            from rembg import remove
+
+            buf = io.BytesIO()
+            Image.new("RGB", (64, 64), "white").save(buf, format="PNG")
+            sessions = [self._idle.get() for _ in range(len(self._sessions))]
+            try:
+                for session in sessions:
+                    remove(buf.getvalue(), session=session)
+            finally:
+                for session in sessions:
+                    self._idle.put(session)
+        logger.info(
+            f"rembg session pool ready: {self.loaded} x {self.model_name} "
+            f"(warmup={'on' if warmup else 'off'})"
+        )
+
+    @contextmanager
+    def session(self) -> Iterator:
+        """Borrow a session, waiting for one to be returned if all are busy."""
+        try:
+            session = self._idle.get_nowait()
+        except queue.Empty:
+            session = self._grow() or self._idle.get()
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+
+rembg_session_pool = RembgSessionPool(
+    model_name=Config.REMBG_MODEL,
+    pool_size=Config.REMBG_POOL_SIZE,
+    intra_op_threads=Config.REMBG_INTRA_OP_THREADS,
+    inter_op_threads=Config.REMBG_INTER_OP_THREADS,
+)
@@ -0,0 +1,191 @@
+"""
+Process pool for CPU-bound image work (rembg and PIL/NumPy effects).
+
+With ``IMAGE_WORKER_MODE=process`` image effects run in dedicated worker
+processes so inference never competes with request handling for the API
+process's GIL, and batches use every core.
+
+* Workers are forked from a fork server that has already imported NumPy,
+  PIL and onnxruntime, so that code is loaded once and shared copy-on-write.
+  rembg itself is not preloaded: importing it starts native threads, and
+  forking after that deadlocks the child. Each worker therefore imports rembg
+  and loads its ONNX session once, in the pool initializer (ONNX Runtime
+  sessions are not fork-safe either, so they could not be inherited).
+* Image bytes travel through ``multiprocessing.shared_memory`` blocks: only
+  the block name and size are pickled, not the payload. The worker decodes
+  the input straight from a memoryview of its block and writes the encoded
+  result into a new block; the parent copies that out once into the returned
+  ``bytes``.
+* The output block is read and unlinked by a done-callback on the worker
+  future, so it is released even when the awaiting request is cancelled or
+  fails after the worker has finished.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, InvalidStateError, ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Tuple
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+# 포크 서버가 미리 import 할 모듈 (스레드를 띄우지 않아 포크에 안전한 것만)
+FORKSERVER_PRELOAD = [
+    "numpy",
+    "onnxruntime",
+    "PIL.Image",
+    "app.domains.image_processing.effects",
+]
+
+
+def _init_worker(preload: bool, warmup: bool) -> None:
+    # 워커 프로세스마다 rembg 세션을 한 번만 로드
+    if not preload:
+        return
+    from .session_pool import rembg_session_pool
+
+    try:
+        rembg_session_pool.load(warmup=warmup)
+    except Exception as e:
+        logger.error(f"Image worker {os.getpid()} failed to preload rembg: {e}")
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _write_block(data: bytes) -> SharedMemory:
+    block = SharedMemory(create=True, size=max(1, len(data)))
+    try:
+        block.buf[: len(data)] = data
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    return block
+
+
+def _run_effect(effect: str, in_name: str, in_size: int) -> Tuple[str, int]:
+    """Worker side: apply the effect to the input block in place, return the output block."""
+    from . import effects
+
+    block = SharedMemory(name=in_name)
+    try:
+        view = block.buf[:in_size]
+        try:
+            output = effects.apply(effect, view)
+        finally:
+            view.release()
+    finally:
+        block.close()
+
+    out_block = _write_block(output)
+    out_block.close()  # 부모의 done-callback이 읽은 뒤 unlink
+    return out_block.name, len(output)
+
+
+def _collect_output(job: Future, output: Future) -> None:
+    """Done-callback of a worker job: copy the output block out and unlink it.
+
+    Runs whether or not anyone still awaits ``output``, so a cancelled request
+    never leaves its output block behind.
+    """
+    try:
+        out_name, out_size = job.result()
+        block = SharedMemory(name=out_name)
+        try:
+            result = bytes(block.buf[:out_size])
+        finally:
+            block.close()
+            block.unlink()
+    except BaseException as e:
+        try:
+            output.set_exception(e)
+        except InvalidStateError:  # 요청이 이미 취소됨
+            pass
+        return
+    try:
+        output.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class ImageWorkerPool:
+    """Runs effects from ``effects.py`` in worker processes over shared memory."""
+
+    def __init__(self, processes: int = 0, preload: bool = True, warmup: bool = True):
+        self.processes = processes or os.cpu_count() or 1
+        self.preload = preload
+        self.warmup = warmup
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Start every worker now so models are loaded before the first request."""
+        with self._lock:
+            if self._executor is not None:
+                return
+            # 워커가 부모와 같은 resource tracker를 쓰도록 먼저 기동
+            # (공유 메모리 블록 등록/해제가 한 곳에서 짝이 맞음)
+            resource_tracker.ensure_running()
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload(FORKSERVER_PRELOAD)
+            else:
+                context = multiprocessing.get_context("spawn")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.preload, self.warmup),
+            )
+            futures = [self._executor.submit(_ping) for _ in range(self.processes)]
+            pids = {future.result() for future in futures}
+            logger.info(f"Image worker pool started: {len(pids)} processes")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, effect: str, image_bytes: bytes) -> bytes:
+        """Apply ``effect`` to ``image_bytes`` in a worker process."""
+        if self._executor is None:
+            await asyncio.to_thread(self.start)
+        in_block = _write_block(image_bytes)
+        output: Future = Future()
+        try:
+            job = self._executor.submit(
+                _run_effect, effect, in_block.name, len(image_bytes)
+            )
+            job.add_done_callback(lambda job: _collect_output(job, output))
+            try:
+                return await asyncio.wrap_future(output)
+            except asyncio.CancelledError:
+                job.cancel()  # 아직 대기 중이면 실행하지 않음
+                raise
+        finally:
+            in_block.close()
+            in_block.unlink()
+
+
+image_worker_pool = ImageWorkerPool(
+    processes=Config.IMAGE_WORKER_PROCESSES,
+    preload=Config.REMBG_PRELOAD,
+    warmup=Config.REMBG_WARMUP,
+)
+
+
+def process_mode_enabled() -> bool:
+    return Config.IMAGE_WORKER_MODE == "process"
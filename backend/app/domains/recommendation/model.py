@@ -1,10 +1,26 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, Float, JSON, Text
+from sqlalchemy import (
+    Column,
+    String,
+    ForeignKey,
+    DateTime,
+    Date,
+    Float,
+    Integer,
+    JSON,
+    Text,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.database import Base
 import uuid
 
 
+PICK_SOURCE_REQUEST = "request"
+PICK_SOURCE_BATCH = "batch"
+
+
 class TodaysPick(Base):
     __tablename__ = "todays_picks"
 
@@ -20,8 +36,44 @@ class TodaysPick(Base):
     score = Column(Float, nullable=True)  # 추천 점수 (0.0~1.0)
     weather = Column(JSON, nullable=True)  # 날씨 정보 스냅샷
     image_url = Column(String, nullable=True)  # 생성된 코디 이미지 주소
+    # 생성 경로: request(사용자 요청) / batch(야간 사전 생성)
+    source = Column(
+        String, nullable=False, default=PICK_SOURCE_REQUEST, server_default=PICK_SOURCE_REQUEST
+    )
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # 사용자별 최신 추천 조회 (Today's Pick 조회/배치 재개 판단)
+    __table_args__ = (
+        Index("ix_todays_picks_user_id_created_at", "user_id", "created_at"),
+    )
+
     def __repr__(self):
         return f"<TodaysPick(id={self.id}, user_id={self.user_id})>"
+
+
+class TodaysPickBatchProgress(Base):
+    """야간 Today's Pick 사전 생성 배치의 사용자별 진행 상태"""
+
+    __tablename__ = "todays_pick_batch_progress"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    run_date = Column(Date, nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    region = Column(String, nullable=True)
+
+    status = Column(String, nullable=False, default="pending")  # pending/running/done/failed
+    attempts = Column(Integer, nullable=False, default=0)
+    pick_id = Column(UUID(as_uuid=True), ForeignKey("todays_picks.id"), nullable=True)
+    error = Column(Text, nullable=True)
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint("run_date", "user_id", name="uix_todays_pick_batch_user"),
+    )
+
+    def __repr__(self):
+        return f"<TodaysPickBatchProgress(user_id={self.user_id}, status={self.status})>"
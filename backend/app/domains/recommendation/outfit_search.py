@@ -0,0 +1,172 @@
+"""
+Three-piece (top x bottom x outer) outfit search.
+
+An outer layer is added when the temperature calls for one (below
+``OUTER_TEMPERATURE_THRESHOLD``). A three-piece outfit scores the mean of its
+three pairwise compatibility scores plus an outer warmth adjustment:
+
+    clip((S(top, bottom) + S(top, outer) + S(bottom, outer)) / 3 + W(outer))
+
+For every top/bottom pair the best reachable score is bounded using the best
+outer score of each side, so pairs are expanded over the outers in descending
+bound order and the search stops as soon as no remaining pair can beat the
+current top K.
+"""
+
+import heapq
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .scoring import (
+    build_feature_matrices,
+    outer_reasons,
+    outer_warmth_delta,
+    pair_reasons,
+    score_feature_matrices,
+)
+from .selection import select_top_candidates
+
+logger = logging.getLogger(__name__)
+
+OUTER_TEMPERATURE_THRESHOLD = 15.0
+
+
+def outfit_temperature(weather_info: Optional[Dict[str, Any]]) -> Optional[float]:
+    """
+    Representative temperature from ``temperature`` or the min/max midpoint.
+
+    None when the weather lookup failed (``available`` is False): its 0 °C
+    placeholders must not turn every outage into a winter outfit.
+    """
+    if not weather_info or weather_info.get("available") is False:
+        return None
+    temperature = weather_info.get("temperature")
+    if temperature is None:
+        temp_min, temp_max = weather_info.get("temp_min"), weather_info.get("temp_max")
+        if temp_min is None or temp_max is None:
+            return None
+        temperature = (float(temp_min) + float(temp_max)) / 2
+    try:
+        return float(temperature)
+    except (TypeError, ValueError):
+        return None
+
+
+def needs_outer(temperature: Optional[float]) -> bool:
+    return temperature is not None and temperature < OUTER_TEMPERATURE_THRESHOLD
+
+
+class ThreePieceSearch:
+    """Top-K top/bottom/outer combinations with upper-bound pruning."""
+
+    def __init__(
+        self,
+        tops: Sequence[Dict[str, Any]],
+        bottoms: Sequence[Dict[str, Any]],
+        outers: Sequence[Dict[str, Any]],
+        temperature: float,
+        user_id: Optional[Any] = None,
+    ):
+        self.temperature = temperature
+        self.top_features, self.bottom_features, self.outer_features = (
+            build_feature_matrices(tops, bottoms, outers)
+        )
+        if user_id is not None:
+            from .score_cache import outfit_score_cache
+
+            self.pair_scores, _, _ = outfit_score_cache.score_matrix(user_id, tops, bottoms)
+        else:
+            self.pair_scores = score_feature_matrices(self.top_features, self.bottom_features)
+        self.top_outer = score_feature_matrices(self.top_features, self.outer_features)
+        self.bottom_outer = score_feature_matrices(self.bottom_features, self.outer_features)
+        self.outer_bonus = outer_warmth_delta(self.outer_features.warmth, temperature)
+        self.scored_outfits = 0
+
+    def upper_bounds(self) -> np.ndarray:
+        """(n_tops, n_bottoms) best reachable three-piece score per pair."""
+        bounds = (
+            self.pair_scores
+            + self.top_outer.max(axis=1)[:, None]
+            + self.bottom_outer.max(axis=1)[None, :]
+        ) / 3 + self.outer_bonus.max()
+        return np.clip(bounds, 0.0, 1.0)
+
+    def select(self, k: int) -> List[Tuple[int, int, int, float]]:
+        """Up to ``k`` (top_idx, bottom_idx, outer_idx, score), best first."""
+        n_bottoms, n_outers = self.pair_scores.shape[1], len(self.outer_bonus)
+        if k <= 0 or not self.pair_scores.size or not n_outers:
+            return []
+
+        bounds = self.upper_bounds()
+        order = np.argsort(-bounds.ravel(), kind="stable")
+
+        heap: List[Tuple[float, int, int, int, int]] = []
+        self.scored_outfits = 0
+        for flat_idx in order:
+            t, b = divmod(int(flat_idx), n_bottoms)
+            if len(heap) >= k and bounds[t, b] < heap[0][0]:
+                break
+
+            scores = np.clip(
+                (self.pair_scores[t, b] + self.top_outer[t] + self.bottom_outer[b]) / 3
+                + self.outer_bonus,
+                0.0,
+                1.0,
+            )
+            self.scored_outfits += n_outers
+
+            threshold = heap[0][0] if len(heap) >= k else -1.0
+            for o in np.flatnonzero(scores >= threshold):
+                o = int(o)
+                order_key = (t * n_bottoms + b) * n_outers + o
+                entry = (float(scores[o]), -order_key, t, b, o)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+
+        logger.debug(
+            f"Three-piece search scored {self.scored_outfits}/"
+            f"{self.pair_scores.size * n_outers} outfits for k={k}"
+        )
+        return [(t, b, o, score) for score, _, t, b, o in sorted(heap, reverse=True)]
+
+    def candidate(self, t: int, b: int, o: int, score: float) -> Dict[str, Any]:
+        reasons = pair_reasons(
+            self.top_features.formality[t],
+            self.bottom_features.formality[b],
+            self.top_features.season_sets[t],
+            self.bottom_features.season_sets[b],
+        )
+        reasons += outer_reasons(self.outer_features.warmth[o], self.temperature)
+        return {
+            "top": self.top_features.items[t],
+            "bottom": self.bottom_features.items[b],
+            "outer": self.outer_features.items[o],
+            "score": score,
+            "reasons": reasons,
+        }
+
+
+def select_top_outfits(
+    tops: Sequence[Dict[str, Any]],
+    bottoms: Sequence[Dict[str, Any]],
+    outers: Sequence[Dict[str, Any]],
+    k: int,
+    temperature: Optional[float] = None,
+    user_id: Optional[Any] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Top-K outfit candidates, adding an outer layer when the temperature needs one.
+
+    Returns:
+        Candidate dicts with ``top``, ``bottom``, ``score``, ``reasons`` and,
+        for three-piece outfits, ``outer``
+    """
+    if not outers or not needs_outer(temperature):
+        return select_top_candidates(tops, bottoms, k, user_id=user_id)
+
+    search = ThreePieceSearch(tops, bottoms, outers, temperature, user_id=user_id)
+    return [search.candidate(t, b, o, s) for t, b, o, s in search.select(k)]
@@ -1,8 +1,11 @@
+import asyncio
+import logging
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Query, HTTPException, Depends
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import delete
+from app.database import AsyncDB, get_async_db, run_db
+from app.domains.user.service import user_manager
 from app.storage.memory_store import list_all_items
 from .service import recommender
 from .model import TodaysPick
@@ -16,6 +19,9 @@ from app.domains.wardrobe.schema import WardrobeItemSchema
 from app.core.schemas import AttributesSchema
 from app.utils.response_helpers import create_success_response, handle_route_exception
 from app.core.auth import get_current_user_id
+from app.ai.workflows.recommendation_workflow import recommend_outfits
+
+logger = logging.getLogger(__name__)
 
 recommendation_router = APIRouter()
 
@@ -24,7 +30,7 @@ recommendation_router = APIRouter()
 async def recommend_todays_pick(
     request: TodaysPickRequest,
     user_id: UUID = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncDB = Depends(get_async_db),
 ):
     """
     오늘의 추천 코디 (Today's Pick)
@@ -33,6 +39,7 @@ async def recommend_todays_pick(
         from app.llm.todays_pick_service import recommend_todays_pick_v2
         from app.domains.weather.service import weather_service
 
+        await run_db(db, user_manager.touch_last_active, user_id)
         weather_info = await weather_service.get_weather_info(
             db, request.lat, request.lon
         )
@@ -50,7 +57,7 @@ async def recommend_todays_pick(
 async def regenerate_todays_pick(
     request: TodaysPickRequest,
     user_id: UUID = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncDB = Depends(get_async_db),
 ):
     """
     오늘의 추천 코디 재생성 (Regenerate Today's Pick)
@@ -63,13 +70,16 @@ async def regenerate_todays_pick(
 
         # Delete recent picks (last 24h) so regenerate always creates a fresh style.
         recent_window_start = datetime.now() - timedelta(hours=24)
-        db.query(TodaysPick).filter(
-            TodaysPick.user_id == user_id,
-            TodaysPick.created_at >= recent_window_start,
-        ).delete()
-        db.commit()
+        await db.execute(
+            delete(TodaysPick).where(
+                TodaysPick.user_id == user_id,
+                TodaysPick.created_at >= recent_window_start,
+            )
+        )
+        await db.commit()
 
         # Generate new pick
+        await run_db(db, user_manager.touch_last_active, user_id)
         weather_info = await weather_service.get_weather_info(
             db, request.lat, request.lon
         )
@@ -118,17 +128,42 @@ def get_outfit_score(top_id: str = Query(...), bottom_id: str = Query(...)):
         raise handle_route_exception(e)
 
 
+async def _outfit_weather(
+    temperature: Optional[float], lat: float, lon: float
+) -> Optional[dict]:
+    """추천용 날씨: 쿼리 기온이 있으면 그대로, 없으면 좌표의 날씨 조회"""
+    if temperature is not None:
+        return {"temperature": temperature}
+    try:
+        from app.domains.weather.service import weather_service
+
+        weather_info = await weather_service.get_weather_info(None, lat, lon)
+    except Exception as e:
+        logger.warning(f"Weather lookup for outfit recommendation failed: {e}")
+        return None
+    if weather_info.get("available") is False:
+        logger.warning("Weather unavailable for outfit recommendation; skipping outers")
+        return None
+    return weather_info
+
+
 @recommendation_router.get("/recommend/outfit", response_model=RecommendationResponse)
-def recommend_outfit(
+async def recommend_outfit(
     count: int = Query(1, ge=1),
     season: Optional[str] = Query(None),
     formality: Optional[float] = Query(None),
     use_llm: bool = Query(True, description="LLM 사용 여부 (기본값: true)"),
+    temperature: Optional[float] = Query(
+        None, description="기온(°C). 없으면 lat/lon 위치의 날씨를 조회"
+    ),
+    lat: float = Query(37.5665),
+    lon: float = Query(126.9780),
 ):
     try:
         all_items = [
             {
                 "id": item.id,
+                "filename": f"item_{item.id}",
                 "attributes": item.attributes,
                 "image_url": item.image_url,
             }
@@ -216,10 +251,20 @@ def recommend_outfit(
                 message="No items match the filters",
             )
 
+        # 기온이 낮으면 아우터까지 포함한 3피스 조합 탐색
+        weather_info = await _outfit_weather(temperature, lat, lon)
+
         # Use Gemini
         if use_llm:
             try:
-                recommendations = recommender.recommend_with_llm(tops, bottoms, count)
+                recommendations = await asyncio.to_thread(
+                    recommender.recommend_with_llm,
+                    tops,
+                    bottoms,
+                    count,
+                    outers=outers,
+                    weather_info=weather_info,
+                )
                 if recommendations:
                     return create_success_response(
                         {"outfits": recommendations},
@@ -230,8 +275,15 @@ def recommend_outfit(
                 print(f"LLM recommendation error: {e}")
                 # Fall through to rule-based fallback
 
-        # Fallback: rule-based recommendation
-        recommendations = recommender._rule_based_recommendation(tops, bottoms, count)
+        # Fallback: rule-based recommendation (same candidate search, no LLM)
+        recommendations = recommend_outfits(
+            tops,
+            bottoms,
+            count,
+            weather_info=weather_info,
+            use_llm=False,
+            outers=outers,
+        ) or recommender._rule_based_recommendation(tops, bottoms, count)
         return create_success_response(
             {"outfits": recommendations},
             count=len(recommendations),
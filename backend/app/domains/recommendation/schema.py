@@ -7,6 +7,7 @@ from app.domains.wardrobe.schema import WardrobeItemSchema
 class OutfitRecommendationSchema(BaseModel):
     top: WardrobeItemSchema
     bottom: WardrobeItemSchema
+    outer: Optional[WardrobeItemSchema] = None
     score: float
     reasons: List[str]
     reasoning: Optional[str] = None
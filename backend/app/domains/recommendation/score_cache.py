@@ -0,0 +1,227 @@
+"""
+Per-user outfit score cache.
+
+Pair compatibility only depends on the scoring features of the two items, so a
+user's tops x bottoms score matrix is kept between requests. Each row/column
+is keyed by item id and a hash of the item's scoring features, and the parsed
+features (formality, season set) are kept alongside. New or changed items are
+rescored together: one vectorized pass for the stale rows against all columns
+and one for the stale columns against all rows, so a cold cache costs a single
+full-matrix computation. A deleted item drops its row/column. Users are
+evicted least-recently-used.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import Config
+
+from .scoring import (
+    ItemFeatureMatrix,
+    build_feature_matrices,
+    pack_feature_matrices,
+    score_feature_matrices,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def feature_hash(formality: float, seasons: set) -> str:
+    raw = f"{float(formality)!r}|{'|'.join(sorted(map(str, seasons)))}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+# (item id, feature hash, formality, season set)
+_Key = Tuple[str, str, float, frozenset]
+
+
+@dataclass
+class _Axis:
+    """One side (tops or bottoms) of a cached score matrix, as parsed features."""
+
+    ids: List[str] = field(default_factory=list)
+    hashes: List[str] = field(default_factory=list)
+    formality: List[float] = field(default_factory=list)
+    season_sets: List[frozenset] = field(default_factory=list)
+    index: Dict[str, int] = field(default_factory=dict)
+
+    def upsert(self, keys: Sequence[_Key]) -> List[int]:
+        """Insert or update items; returns their positions."""
+        positions = []
+        for item_id, digest, formality, seasons in keys:
+            pos = self.index.get(item_id)
+            if pos is None:
+                pos = self.index[item_id] = len(self.ids)
+                self.ids.append(item_id)
+                self.hashes.append(digest)
+                self.formality.append(formality)
+                self.season_sets.append(seasons)
+            else:
+                self.hashes[pos] = digest
+                self.formality[pos] = formality
+                self.season_sets[pos] = seasons
+            positions.append(pos)
+        return positions
+
+    def stale(self, keys: Sequence[_Key]) -> List[_Key]:
+        return [
+            key
+            for key in keys
+            if (pos := self.index.get(key[0])) is None or self.hashes[pos] != key[1]
+        ]
+
+    def parsed(self, positions: Optional[List[int]] = None):
+        if positions is None:
+            return ((), self.formality, self.season_sets, None)
+        return (
+            (),
+            [self.formality[p] for p in positions],
+            [self.season_sets[p] for p in positions],
+            None,
+        )
+
+    def remove(self, item_id: str) -> Optional[int]:
+        pos = self.index.pop(item_id, None)
+        if pos is None:
+            return None
+        del self.ids[pos], self.hashes[pos], self.formality[pos], self.season_sets[pos]
+        self.index = {item_id: i for i, item_id in enumerate(self.ids)}
+        return pos
+
+
+@dataclass
+class _UserScoreTable:
+    tops: _Axis = field(default_factory=_Axis)
+    bottoms: _Axis = field(default_factory=_Axis)
+    scores: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+
+    def refresh(self, stale_tops: Sequence[_Key], stale_bottoms: Sequence[_Key]) -> None:
+        """Upsert stale items and rescore their rows/columns in one pass per side."""
+        rows = self.tops.upsert(stale_tops)
+        cols = self.bottoms.upsert(stale_bottoms)
+
+        n_tops, n_bottoms = len(self.tops.ids), len(self.bottoms.ids)
+        if self.scores.shape != (n_tops, n_bottoms):
+            grown = np.zeros((n_tops, n_bottoms))
+            old_tops, old_bottoms = self.scores.shape
+            grown[:old_tops, :old_bottoms] = self.scores
+            self.scores = grown
+
+        if rows and n_bottoms:
+            self.scores[rows, :] = score_feature_matrices(
+                *pack_feature_matrices(self.tops.parsed(rows), self.bottoms.parsed())
+            )
+        if cols and n_tops:
+            self.scores[:, cols] = score_feature_matrices(
+                *pack_feature_matrices(self.tops.parsed(), self.bottoms.parsed(cols))
+            )
+
+    def remove(self, item_id: str) -> None:
+        pos = self.tops.remove(item_id)
+        if pos is not None:
+            self.scores = np.delete(self.scores, pos, axis=0)
+        pos = self.bottoms.remove(item_id)
+        if pos is not None:
+            self.scores = np.delete(self.scores, pos, axis=1)
+
+
+def _keys(features: ItemFeatureMatrix) -> List[_Key]:
+    return [
+        (str(item["id"]), feature_hash(f, s), float(f), frozenset(s))
+        for item, f, s in zip(features.items, features.formality, features.season_sets)
+    ]
+
+
+class OutfitScoreCache:
+    """LRU of per-user score matrices (thread-safe)."""
+
+    def __init__(self, max_users: int = 1000):
+        self.max_users = max_users
+        self._tables: "OrderedDict[str, _UserScoreTable]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _table(self, user_id: str, create: bool = True) -> Optional[_UserScoreTable]:
+        table = self._tables.get(user_id)
+        if table is not None:
+            self._tables.move_to_end(user_id)
+        elif create:
+            table = self._tables[user_id] = _UserScoreTable()
+            while len(self._tables) > self.max_users:
+                self._tables.popitem(last=False)
+        return table
+
+    def score_matrix(
+        self,
+        user_id: Any,
+        tops: Sequence[Dict[str, Any]],
+        bottoms: Sequence[Dict[str, Any]],
+    ) -> Tuple[np.ndarray, ItemFeatureMatrix, ItemFeatureMatrix]:
+        """
+        Scores for ``tops`` x ``bottoms``, computing only uncached rows/columns.
+
+        Items without an ``id`` cannot be cached, so the matrix is computed
+        directly in that case.
+        """
+        top_features, bottom_features = build_feature_matrices(tops, bottoms)
+        if any(i.get("id") is None for i in (*tops, *bottoms)):
+            return score_feature_matrices(top_features, bottom_features), top_features, bottom_features
+
+        top_keys, bottom_keys = _keys(top_features), _keys(bottom_features)
+        with self._lock:
+            table = self._table(str(user_id))
+            stale_tops = table.tops.stale(top_keys)
+            stale_bottoms = table.bottoms.stale(bottom_keys)
+            stale = len(stale_tops) + len(stale_bottoms)
+            if stale:
+                table.refresh(stale_tops, stale_bottoms)
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            rows = [table.tops.index[k[0]] for k in top_keys]
+            cols = [table.bottoms.index[k[0]] for k in bottom_keys]
+            scores = table.scores[np.ix_(rows, cols)]
+
+        if stale:
+            logger.debug(f"Score cache refreshed {stale} rows/columns for user {user_id}")
+        return scores, top_features, bottom_features
+
+    def add_item(self, user_id: Any, item: Dict[str, Any], category: Optional[str]) -> None:
+        """Add/refresh one item's row or column if the user's matrix is cached."""
+        role = (category or "").lower()
+        if role not in ("top", "bottom") or item.get("id") is None:
+            return
+        keys = _keys(build_feature_matrices([item])[0])
+        with self._lock:
+            table = self._table(str(user_id), create=False)
+            if table is None:
+                return
+            if role == "top":
+                table.refresh(keys, [])
+            else:
+                table.refresh([], keys)
+
+    def remove_item(self, user_id: Any, item_id: Any) -> None:
+        """Drop one item's row/column from the user's cached matrix."""
+        with self._lock:
+            table = self._table(str(user_id), create=False)
+            if table is not None:
+                table.remove(str(item_id))
+
+    def clear(self, user_id: Any = None) -> None:
+        with self._lock:
+            if user_id is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(str(user_id), None)
+
+
+outfit_score_cache = OutfitScoreCache(max_users=Config.OUTFIT_SCORE_CACHE_MAX_USERS)
@@ -0,0 +1,188 @@
+"""
+Vectorized outfit compatibility scoring.
+
+Implements the same rules as ``RecommendationService.calculate_outfit_score``
+but evaluates a whole tops x bottoms matrix in one NumPy pass. Item
+attributes are parsed once per item instead of once per pair; items that carry
+a precomputed ``feature_vector`` (see ``app.domains.wardrobe.features``) are
+read from that array without touching the attribute tree.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.domains.wardrobe import features as fv
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FORMALITY = 0.5
+DEFAULT_WARMTH = 0.5
+
+
+def _item_formality(item: Dict[str, Any]) -> float:
+    vector = item.get("feature_vector")
+    if vector:
+        return float(vector[fv.FORMALITY])
+    attributes = item.get("attributes") or {}
+    scores = attributes.get("scores")
+    formality = scores.get("formality", DEFAULT_FORMALITY) if scores else None
+    return DEFAULT_FORMALITY if formality is None else formality
+
+
+def _item_warmth(item: Dict[str, Any]) -> float:
+    vector = item.get("feature_vector")
+    if vector:
+        return float(vector[fv.WARMTH])
+    attributes = item.get("attributes") or {}
+    warmth = (attributes.get("scores") or {}).get("warmth")
+    return DEFAULT_WARMTH if warmth is None else warmth
+
+
+def _item_seasons(item: Dict[str, Any]) -> set:
+    vector = item.get("feature_vector")
+    if vector:
+        return fv.seasons_from_mask(int(vector[fv.SEASON_MASK]))
+    attributes = item.get("attributes") or {}
+    scores = attributes.get("scores")
+    seasons = scores.get("season", []) if scores else []
+    return set(seasons) if isinstance(seasons, list) else set()
+
+
+@dataclass
+class ItemFeatureMatrix:
+    """Per-item features packed into arrays (one row per item)."""
+
+    items: Sequence[Dict[str, Any]]
+    formality: np.ndarray  # (n,) float64
+    seasons: np.ndarray  # (n, V) uint8, one column per season in the vocabulary
+    season_sets: List[set] = field(default_factory=list)
+    warmth: Optional[np.ndarray] = None  # (n,) float64, used for outer layers
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def has_season(self) -> np.ndarray:
+        return self.seasons.any(axis=1)
+
+
+def build_feature_matrices(
+    *groups: Sequence[Dict[str, Any]],
+) -> Tuple[ItemFeatureMatrix, ...]:
+    """
+    Parse each item group once into feature arrays sharing one season vocabulary.
+
+    Args:
+        *groups: item lists (e.g. tops, bottoms) in the ``{"attributes": {...}}`` shape
+
+    Returns:
+        One ``ItemFeatureMatrix`` per group, in the same order
+    """
+    return pack_feature_matrices(
+        *(
+            (
+                items,
+                [_item_formality(i) for i in items],
+                [_item_seasons(i) for i in items],
+                [_item_warmth(i) for i in items],
+            )
+            for items in groups
+        )
+    )
+
+
+ParsedGroup = Tuple[
+    Sequence[Dict[str, Any]], Sequence[float], Sequence[set], Optional[Sequence[float]]
+]
+
+
+def pack_feature_matrices(*groups: ParsedGroup) -> Tuple[ItemFeatureMatrix, ...]:
+    """
+    Pack already-parsed ``(items, formality, season_sets, warmth)`` groups into
+    feature matrices with a shared season vocabulary (no attribute parsing).
+    """
+    vocab: Dict[Any, int] = {}
+    for _, _, season_sets, _ in groups:
+        for seasons in season_sets:
+            for season in seasons:
+                vocab.setdefault(season, len(vocab))
+
+    matrices = []
+    for items, formality, season_sets, warmth in groups:
+        season_matrix = np.zeros((len(formality), len(vocab)), dtype=np.uint8)
+        for row, seasons in enumerate(season_sets):
+            for season in seasons:
+                season_matrix[row, vocab[season]] = 1
+        matrices.append(
+            ItemFeatureMatrix(
+                items=items,
+                formality=np.asarray(formality, dtype=np.float64).reshape(-1),
+                seasons=season_matrix,
+                season_sets=list(season_sets),
+                warmth=(
+                    None
+                    if warmth is None
+                    else np.asarray(warmth, dtype=np.float64).reshape(-1)
+                ),
+            )
+        )
+    return tuple(matrices)
+
+
+def score_feature_matrices(
+    tops: ItemFeatureMatrix, bottoms: ItemFeatureMatrix
+) -> np.ndarray:
+    """Return the (n_tops, n_bottoms) compatibility score matrix."""
+    diff = np.abs(tops.formality[:, None] - bottoms.formality[None, :])
+    formality_delta = np.where(diff < 0.1, 0.2, np.where(diff > 0.4, -0.2, 0.0))
+
+    # uint8 행렬곱 결과가 0보다 크면 공통 시즌이 하나 이상 존재
+    common = (tops.seasons.astype(np.int32) @ bottoms.seasons.T.astype(np.int32)) > 0
+    both_defined = tops.has_season[:, None] & bottoms.has_season[None, :]
+    season_delta = np.where(common, 0.1, np.where(both_defined, -0.1, 0.0))
+
+    # Same addition order as the scalar scorer so float results are identical.
+    scores = DEFAULT_FORMALITY + formality_delta + season_delta
+    return np.clip(scores, 0.0, 1.0)
+
+
+def pair_reasons(
+    t_formality: float, b_formality: float, t_seasons: set, b_seasons: set
+) -> List[str]:
+    """Human-readable reasons for one pair, matching the scalar scorer's wording."""
+    reasons = []
+    diff = abs(t_formality - b_formality)
+    if diff < 0.1:
+        reasons.append("Formality matches perfectly.")
+    elif diff > 0.4:
+        reasons.append("Formality clash.")
+
+    common_seasons = t_seasons.intersection(b_seasons)
+    if common_seasons:
+        reasons.append(f"Suitable for {', '.join(common_seasons)}.")
+    elif t_seasons and b_seasons:
+        reasons.append("Season mismatch.")
+    return reasons
+
+
+def target_warmth(temperature: float) -> float:
+    """Desired outer warmth: 0.0 at 20°C and above, 1.0 at 0°C and below."""
+    return min(1.0, max(0.0, (20.0 - float(temperature)) / 20.0))
+
+
+def outer_warmth_delta(warmth: np.ndarray, temperature: float) -> np.ndarray:
+    """Score adjustment for each outer's warmth against the temperature."""
+    diff = np.abs(np.asarray(warmth, dtype=np.float64) - target_warmth(temperature))
+    return np.where(diff < 0.2, 0.1, np.where(diff > 0.5, -0.1, 0.0))
+
+
+def outer_reasons(warmth: float, temperature: float) -> List[str]:
+    diff = abs(float(warmth) - target_warmth(temperature))
+    if diff < 0.2:
+        return [f"Outer warmth suits {float(temperature):.0f}°C."]
+    if diff > 0.5:
+        return ["Outer warmth mismatch."]
+    return []
@@ -0,0 +1,250 @@
+"""
+Bounded top-K outfit candidate selection.
+
+Items are bucketed by formality band and season set. Every item in a bucket
+shares the same season set and lies in a narrow formality range, so the
+best score any pair from two buckets can reach is known without scoring the
+pairs. Bucket pairs are visited from the highest bound down; once K pairs
+are kept in a min-heap and the next bound is below the worst kept score, the
+remaining buckets are never scored. In practice this skips the clearly
+incompatible (formality clash / season mismatch) pairs entirely.
+
+The bucket index only serves calls without a user. Signed-in users rank the
+score matrix kept by ``score_cache``: every pair is already scored there, so
+bounding buckets would save nothing and the matrix is ranked directly with
+``rank_score_matrix``.
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .scoring import (
+    DEFAULT_FORMALITY,
+    ItemFeatureMatrix,
+    build_feature_matrices,
+    pair_reasons,
+    score_feature_matrices,
+)
+
+logger = logging.getLogger(__name__)
+
+FORMALITY_BAND_WIDTH = 0.1
+
+
+@dataclass
+class _Bucket:
+    indices: np.ndarray
+    formality_min: float
+    formality_max: float
+    seasons: np.ndarray  # shared season row of every member
+    has_season: bool
+
+
+class WardrobeIndex:
+    """Per-user item index keyed by (formality band, season set)."""
+
+    def __init__(self, features: ItemFeatureMatrix):
+        self.features = features
+        grouped: Dict[Tuple[int, bytes], List[int]] = {}
+        bands = np.floor(features.formality / FORMALITY_BAND_WIDTH).astype(np.int64)
+        for row in range(len(features)):
+            key = (int(bands[row]), features.seasons[row].tobytes())
+            grouped.setdefault(key, []).append(row)
+
+        self.buckets: List[_Bucket] = []
+        for rows in grouped.values():
+            indices = np.asarray(rows, dtype=np.int64)
+            formality = features.formality[indices]
+            seasons = features.seasons[indices[0]]
+            self.buckets.append(
+                _Bucket(
+                    indices=indices,
+                    formality_min=float(formality.min()),
+                    formality_max=float(formality.max()),
+                    seasons=seasons,
+                    has_season=bool(seasons.any()),
+                )
+            )
+
+    def _arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if not self.buckets:
+            width = self.features.seasons.shape[1]
+            return (
+                np.empty(0),
+                np.empty(0),
+                np.empty((0, width), dtype=np.uint8),
+                np.empty(0, dtype=bool),
+            )
+        return (
+            np.array([b.formality_min for b in self.buckets]),
+            np.array([b.formality_max for b in self.buckets]),
+            np.stack([b.seasons for b in self.buckets]),
+            np.array([b.has_season for b in self.buckets]),
+        )
+
+    def upper_bounds(self, other: "WardrobeIndex") -> np.ndarray:
+        """Best reachable score for every (self bucket, other bucket) pair."""
+        a_min, a_max, a_seasons, a_has = self._arrays()
+        b_min, b_max, b_seasons, b_has = other._arrays()
+
+        # 두 구간 사이 최소 격식 차이 (겹치면 0)
+        min_diff = np.maximum(
+            0.0,
+            np.maximum(a_min[:, None] - b_max[None, :], b_min[None, :] - a_max[:, None]),
+        )
+        formality_delta = np.where(
+            min_diff < 0.1, 0.2, np.where(min_diff > 0.4, -0.2, 0.0)
+        )
+        common = (a_seasons.astype(np.int32) @ b_seasons.T.astype(np.int32)) > 0
+        both_defined = a_has[:, None] & b_has[None, :]
+        season_delta = np.where(common, 0.1, np.where(both_defined, -0.1, 0.0))
+        return np.clip(DEFAULT_FORMALITY + formality_delta + season_delta, 0.0, 1.0)
+
+
+class TopKSelector:
+    """
+    Select the K best top/bottom pairs without scoring every combination.
+
+    Results are identical to scoring all pairs and stable-sorting by score
+    (ties keep tops x bottoms iteration order).
+    """
+
+    def __init__(self, tops: Sequence[Dict[str, Any]], bottoms: Sequence[Dict[str, Any]]):
+        self.top_features, self.bottom_features = build_feature_matrices(tops, bottoms)
+        self.top_index = WardrobeIndex(self.top_features)
+        self.bottom_index = WardrobeIndex(self.bottom_features)
+        self.scored_pairs = 0
+
+    def select(self, k: int) -> List[Tuple[int, int, float]]:
+        """Return up to ``k`` (top_idx, bottom_idx, score) tuples, best first."""
+        n_bottoms = len(self.bottom_features)
+        if k <= 0 or not len(self.top_features) or not n_bottoms:
+            return []
+
+        bounds = self.top_index.upper_bounds(self.bottom_index)
+        order = np.argsort(-bounds.ravel(), kind="stable")
+        n_bottom_buckets = bounds.shape[1]
+
+        # min-heap 루트 = 현재 K개 중 가장 나쁜 후보 (낮은 점수, 같은 점수면 나중 순서)
+        heap: List[Tuple[float, int, int, int]] = []
+        self.scored_pairs = 0
+        for flat_idx in order:
+            a, b = divmod(int(flat_idx), n_bottom_buckets)
+            if len(heap) >= k and bounds[a, b] < heap[0][0]:
+                break
+
+            top_rows = self.top_index.buckets[a].indices
+            bottom_rows = self.bottom_index.buckets[b].indices
+            scores = score_feature_matrices(
+                self._subset(self.top_features, top_rows),
+                self._subset(self.bottom_features, bottom_rows),
+            )
+            self.scored_pairs += scores.size
+
+            for i, j in zip(*np.nonzero(scores >= (heap[0][0] if len(heap) >= k else -1.0))):
+                t_idx, b_idx = int(top_rows[i]), int(bottom_rows[j])
+                entry = (float(scores[i, j]), -(t_idx * n_bottoms + b_idx), t_idx, b_idx)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+
+        ranked = sorted(heap, reverse=True)
+        return [(t_idx, b_idx, score) for score, _, t_idx, b_idx in ranked]
+
+    def candidate(self, top_idx: int, bottom_idx: int, score: float) -> Dict[str, Any]:
+        return _candidate(self.top_features, self.bottom_features, top_idx, bottom_idx, score)
+
+    @staticmethod
+    def _subset(features: ItemFeatureMatrix, rows: np.ndarray) -> ItemFeatureMatrix:
+        return ItemFeatureMatrix(
+            items=(),
+            formality=features.formality[rows],
+            seasons=features.seasons[rows],
+        )
+
+
+def _candidate(
+    top_features: ItemFeatureMatrix,
+    bottom_features: ItemFeatureMatrix,
+    top_idx: int,
+    bottom_idx: int,
+    score: float,
+) -> Dict[str, Any]:
+    return {
+        "top": top_features.items[top_idx],
+        "bottom": bottom_features.items[bottom_idx],
+        "score": score,
+        "reasons": pair_reasons(
+            top_features.formality[top_idx],
+            bottom_features.formality[bottom_idx],
+            top_features.season_sets[top_idx],
+            bottom_features.season_sets[bottom_idx],
+        ),
+    }
+
+
+def rank_score_matrix(scores: np.ndarray, k: int) -> List[Tuple[int, int, float]]:
+    """
+    Top ``k`` entries of a precomputed score matrix without a full sort.
+
+    Same order as a stable descending sort (ties keep row-major order).
+    """
+    flat = scores.ravel()
+    if k <= 0 or not flat.size:
+        return []
+    if k < flat.size:
+        kth = np.partition(flat, flat.size - k)[flat.size - k]
+        selected = np.flatnonzero(flat >= kth)
+    else:
+        selected = np.arange(flat.size)
+    # lexsort: 마지막 키(점수 내림차순)가 1순위, 인덱스가 동점 처리
+    selected = selected[np.lexsort((selected, -flat[selected]))][:k]
+    n_bottoms = scores.shape[1]
+    return [(int(i) // n_bottoms, int(i) % n_bottoms, float(flat[i])) for i in selected]
+
+
+def select_top_pairs(
+    tops: Sequence[Dict[str, Any]],
+    bottoms: Sequence[Dict[str, Any]],
+    k: int,
+    user_id: Optional[Any] = None,
+) -> Tuple[List[Tuple[int, int, float]], ItemFeatureMatrix, ItemFeatureMatrix]:
+    """
+    Top-K (top_idx, bottom_idx, score) tuples plus the parsed feature matrices.
+
+    With ``user_id`` the user's cached score matrix replaces the bucket index:
+    only new or changed items are scored (a cold cache is one vectorized full
+    pass) and the full matrix is ranked by ``rank_score_matrix``, so no
+    pruning applies. Without a user, ``TopKSelector`` prunes bucket pairs.
+    """
+    if user_id is not None:
+        from .score_cache import outfit_score_cache
+
+        scores, top_features, bottom_features = outfit_score_cache.score_matrix(
+            user_id, tops, bottoms
+        )
+        return rank_score_matrix(scores, k), top_features, bottom_features
+
+    selector = TopKSelector(tops, bottoms)
+    selected = selector.select(k)
+    logger.debug(
+        f"Candidate selection scored {selector.scored_pairs}/"
+        f"{len(tops) * len(bottoms)} pairs for k={k}"
+    )
+    return selected, selector.top_features, selector.bottom_features
+
+
+def select_top_candidates(
+    tops: Sequence[Dict[str, Any]],
+    bottoms: Sequence[Dict[str, Any]],
+    k: int,
+    user_id: Optional[Any] = None,
+) -> List[Dict[str, Any]]:
+    """Top-K candidate dicts (``top``, ``bottom``, ``score``, ``reasons``)."""
+    selected, top_features, bottom_features = select_top_pairs(tops, bottoms, k, user_id)
+    return [_candidate(top_features, bottom_features, t, b, s) for t, b, s in selected]
@@ -1,6 +1,6 @@
 import logging
 import random
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 from app.ai.workflows.recommendation_workflow import get_recommendation_workflow
 from app.ai.schemas.workflow_state import RecommendationState
@@ -83,22 +83,32 @@ class RecommendationService:
         return score, reasons
 
     def recommend_with_llm(
-        self, tops: List[Dict[str, Any]], bottoms: List[Dict[str, Any]], count: int = 3
+        self,
+        tops: List[Dict[str, Any]],
+        bottoms: List[Dict[str, Any]],
+        count: int = 3,
+        outers: Optional[List[Dict[str, Any]]] = None,
+        weather_info: Optional[Dict[str, Any]] = None,
+        user_id: Optional[Any] = None,
     ) -> List[Dict[str, Any]]:
         """
         Recommend outfits using LLM-based workflow.
+
+        ``user_id`` keys the per-user outfit score cache; without it candidates
+        are scored from scratch.
         """
         try:
             # Construct state
             initial_state: RecommendationState = {
                 "tops": tops,
                 "bottoms": bottoms,
+                "outers": outers or [],
                 "candidates": [],
                 "llm_recommendations": None,
                 "final_outfits": [],
-                "metadata": {},
+                "metadata": {"user_id": str(user_id) if user_id else "unknown"},
                 "user_request": None,
-                "weather_info": None,
+                "weather_info": weather_info,
                 "count": count,
             }
 
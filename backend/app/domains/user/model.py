@@ -20,6 +20,8 @@ class User(Base):
     )  # Path to user's face image in storage
     password = Column(String, nullable=False)
     created_at = Column(DateTime, server_default=text("now()"))
+    # 사용자가 직접 한 활동(로그인, 추천/채팅 요청)의 마지막 시각 (배치 대상 선정용)
+    last_active_at = Column(DateTime(timezone=True), nullable=True, index=True)
 
     # Relationships
     closet_items = relationship("ClosetItem", back_populates="owner")
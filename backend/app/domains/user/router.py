@@ -2,9 +2,9 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlalchemy.orm import Session
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_principal
+from app.core.principal import AuthPrincipal
 from app.database import get_db
-from app.domains.user.model import User
 from app.domains.user.schema import UserUpdate, UserResponse
 from app.domains.user.service import user_manager
 
@@ -20,7 +20,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
     description="현재 로그인한 사용자의 정보를 조회합니다.",
 )
 def read_users_me(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
     # Use user_manager to get profile with signed URL
@@ -38,7 +38,7 @@ def read_users_me(
 )
 def update_profile(
     update_data: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
     try:
@@ -56,7 +56,7 @@ def update_profile(
 )
 async def upload_profile_image(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
     try:
@@ -1,81 +1,64 @@
 ﻿import logging
 import uuid
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict
 
-from supabase import create_client, Client
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
 
-from app.core.config import Config
+from app.core.principal import principal_cache
+from app.core.signed_urls import signed_url_service
+from app.core.storage import storage
 from app.domains.user.model import User
 from app.domains.user.schema import UserUpdate, UserResponse
 from app.utils.validators import validate_file_extension
 
 logger = logging.getLogger(__name__)
 
+# last_active_at 갱신 최소 간격 (요청마다 users 행을 쓰지 않도록)
+ACTIVITY_TOUCH_INTERVAL = timedelta(hours=1)
+
 
 class UserManager:
     def __init__(self):
-        self.supabase_url = Config.SUPABASE_URL
-        self.supabase_key = Config.SUPABASE_SERVICE_KEY or Config.SUPABASE_ANON_KEY
-        self.bucket_name = "wardrobe-images"  # Use existing bucket
-        self.supabase: Optional[Client] = None
-
-        if self.supabase_url and self.supabase_key:
-            try:
-                self.supabase = create_client(self.supabase_url, self.supabase_key)
-            except Exception as e:
-                logger.error(f"Failed to initialize Supabase Client: {e}")
-
-    def get_signed_url(self, image_path: str, expires_in: int = 3600) -> str:
-        """Generate a signed URL from Supabase Storage with public URL fallback."""
-        if not image_path:
-            return ""
+        self.storage = storage
+        self.bucket_name = storage.bucket_name
 
-        if image_path.startswith("http"):
-            return image_path
+    def get_signed_url(self, image_path: str) -> str:
+        """Generate a signed URL from Supabase Storage with public URL fallback."""
+        return signed_url_service.get(image_path)
 
-        if not self.supabase:
-            return f"{self.supabase_url}/storage/v1/object/public/{self.bucket_name}/{image_path}"
+    async def aget_signed_url(self, image_path: str) -> str:
+        """``get_signed_url`` for async handlers (signs without blocking the loop)."""
+        return await signed_url_service.aget(image_path)
 
+    def touch_last_active(self, db: Session, user_id: UUID) -> None:
+        """Record user-initiated activity (at most one write per interval)."""
+        now = datetime.now(timezone.utc)
         try:
-            path = image_path
-            if "/" in path and path.startswith(self.bucket_name):
-                path = path.replace(f"{self.bucket_name}/", "", 1)
-
-            res = self.supabase.storage.from_(self.bucket_name).create_signed_url(
-                path, expires_in
-            )
-            signed = (
-                res.get("signedURL")
-                or res.get("signedUrl")
-                or res.get("signed_url")
+            db.execute(
+                update(User)
+                .where(
+                    User.id == user_id,
+                    or_(
+                        User.last_active_at.is_(None),
+                        User.last_active_at < now - ACTIVITY_TOUCH_INTERVAL,
+                    ),
+                )
+                .values(last_active_at=now)
             )
-            if signed:
-                return signed
-
-            logger.warning(
-                f"Signed URL missing in response for {image_path}, using public URL fallback."
-            )
-            return f"{self.supabase_url}/storage/v1/object/public/{self.bucket_name}/{path}"
+            db.commit()
         except Exception as e:
-            logger.warning(
-                f"Error generating Supabase signed URL for {image_path}: {e}"
-            )
-            path = (
-                image_path.replace(f"{self.bucket_name}/", "", 1)
-                if image_path.startswith(self.bucket_name)
-                else image_path
-            )
-            return f"{self.supabase_url}/storage/v1/object/public/{self.bucket_name}/{path}"
+            db.rollback()
+            logger.warning(f"Failed to record activity for user {user_id}: {e}")
 
     async def upload_face_image(
         self, db: Session, user_id: UUID, file: UploadFile
     ) -> str:
         """Upload face image to Supabase and update DB"""
-        if not self.supabase:
+        if not self.storage.available:
             raise Exception("Supabase Storage not initialized")
 
         # Read file content
@@ -93,10 +76,8 @@ class UserManager:
 
         try:
             # Upload to Supabase
-            self.supabase.storage.from_(self.bucket_name).upload(
-                path=file_path,
-                file=image_bytes,
-                file_options={"content-type": content_type, "upsert": "true"},
+            await self.storage.aupload(
+                file_path, image_bytes, content_type, upsert=True
             )
 
             # Update DB
@@ -105,6 +86,7 @@ class UserManager:
                 # Delete old image if exists (Implementation skipped for brevity)
                 user.face_image_path = file_path
                 db.commit()
+                principal_cache.invalidate(user_id)
                 db.refresh(user)
                 return file_path
             else:
@@ -138,6 +120,7 @@ class UserManager:
             setattr(user, key, value)
 
         db.commit()
+        principal_cache.invalidate(user_id)
         db.refresh(user)
 
         return self.get_user_profile(db, user_id)  # Return with URL
@@ -0,0 +1,108 @@
+"""
+Compact numeric feature vectors for wardrobe items.
+
+The vector is computed once when an item is saved and stored in
+``closet_items.feature_vector`` so that scoring and filtering can read a short
+float array instead of deserializing the full ``features`` JSONB tree.
+
+Layout (index: meaning):
+    0 formality      0.0~1.0 (missing -> 0.5, same default as the scorer)
+    1 warmth         0.0~1.0 (missing -> 0.5)
+    2 versatility    0.0~1.0 (missing -> 0.5)
+    3 season mask    bit i set for ENUMS["season"][i]
+    4 color index    index into ENUMS["color"] (unknown/other values -> "unknown")
+    5 category code  index into ENUMS["category_main"] (-1 if unknown)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from app.ai.prompts.extraction_prompts import ENUMS
+
+FORMALITY = 0
+WARMTH = 1
+VERSATILITY = 2
+SEASON_MASK = 3
+COLOR_INDEX = 4
+CATEGORY_CODE = 5
+VECTOR_LENGTH = 6
+
+DEFAULT_SCORE = 0.5
+
+SEASONS: Sequence[str] = ENUMS["season"]
+COLORS: Sequence[str] = ENUMS["color"]
+CATEGORIES: Sequence[str] = ENUMS["category_main"]
+
+_SEASON_BITS = {season: 1 << i for i, season in enumerate(SEASONS)}
+_COLOR_CODES = {color: i for i, color in enumerate(COLORS)}
+_CATEGORY_CODES = {category: i for i, category in enumerate(CATEGORIES)}
+_UNKNOWN_COLOR = _COLOR_CODES["unknown"]
+
+
+def _score(scores: Dict[str, Any], key: str) -> float:
+    value = scores.get(key)
+    try:
+        return DEFAULT_SCORE if value is None else float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_SCORE
+
+
+def season_mask(seasons: Any) -> int:
+    """Bitmask of known seasons (a bare string counts as one season)."""
+    if isinstance(seasons, str):
+        seasons = [seasons]
+    if not isinstance(seasons, (list, tuple, set)):
+        return 0
+    mask = 0
+    for season in seasons:
+        mask |= _SEASON_BITS.get(str(season).lower(), 0)
+    return mask
+
+
+def seasons_from_mask(mask: int) -> Set[str]:
+    return {season for season, bit in _SEASON_BITS.items() if mask & bit}
+
+
+def encode_feature_vector(
+    attributes: Dict[str, Any], category: Optional[str] = None
+) -> List[float]:
+    """
+    Build the compact feature vector from an extracted attribute dict.
+
+    Args:
+        attributes: attribute tree as stored in ``ClosetItem.features``
+        category: ``ClosetItem.category`` used when the tree has no category
+
+    Returns:
+        ``VECTOR_LENGTH`` floats in the layout described in the module docstring
+    """
+    attributes = attributes or {}
+    scores = attributes.get("scores") or {}
+
+    # 점수기와 동일하게 scores.season 이 리스트일 때만 시즌으로 인정
+    seasons = scores.get("season")
+    mask = season_mask(seasons) if isinstance(seasons, list) else 0
+
+    color = attributes.get("color")
+    primary = color.get("primary") if isinstance(color, dict) else color
+    color_code = _COLOR_CODES.get(str(primary or "").lower(), _UNKNOWN_COLOR)
+
+    category_raw = attributes.get("category")
+    main = category_raw.get("main") if isinstance(category_raw, dict) else category_raw
+    main = str(main or category or "").lower()
+    if main == "outerwear":
+        main = "outer"
+    category_code = _CATEGORY_CODES.get(main, -1)
+
+    return [
+        _score(scores, "formality"),
+        _score(scores, "warmth"),
+        _score(scores, "versatility"),
+        float(mask),
+        float(color_code),
+        float(category_code),
+    ]
+
+
+def category_from_vector(vector: Sequence[float]) -> Optional[str]:
+    code = int(vector[CATEGORY_CODE])
+    return CATEGORIES[code] if 0 <= code < len(CATEGORIES) else None
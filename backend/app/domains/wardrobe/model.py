@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import BigInteger, Column, Integer, String, ForeignKey, DateTime, Float, Index
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -25,6 +25,33 @@ class ClosetItem(Base):
     season = Column(ARRAY(String), nullable=True)  # ['SPRING', 'FALL']
     mood_tags = Column(ARRAY(String), nullable=True)  # ['CASUAL', 'STREET']
 
+    # Compact scoring features computed at save time (see wardrobe/features.py)
+    feature_vector = Column(ARRAY(Float), nullable=True)
+
+    # Upload hashes for extraction dedup (see extraction/dedup.py)
+    image_sha256 = Column(String(64), nullable=True)
+    image_dhash = Column(BigInteger, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
     # Relationships
     owner = relationship("User", back_populates="closet_items")
     outfit_associations = relationship("OutfitItem", back_populates="item")
+
+    __table_args__ = (
+        Index("ix_closet_items_user_id_image_sha256", "user_id", "image_sha256"),
+        # 옷장 목록 keyset 페이지네이션 (created_at DESC, id DESC)
+        Index("ix_closet_items_user_id_created_at_id", "user_id", "created_at", "id"),
+        # 카테고리 필터 목록 / 추천 후보 조회
+        Index("ix_closet_items_user_id_category", "user_id", "category"),
+    )
+
+
+class ClosetCategoryCount(Base):
+    """Per-user item count per category, kept in step with closet_items writes."""
+
+    __tablename__ = "closet_category_counts"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    category = Column(String, primary_key=True)
+    item_count = Column(Integer, nullable=False, default=0, server_default="0")
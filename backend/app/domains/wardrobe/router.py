@@ -14,7 +14,7 @@ from app.utils.response_helpers import create_success_response, handle_route_exc
 from .schema import WardrobeItemCreate, WardrobeItemSchema, WardrobeResponse
 from app.core.auth import get_current_user_id
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import AsyncDB, get_async_db, get_db
 
 wardrobe_router = APIRouter()
 
@@ -63,21 +63,29 @@ def get_wardrobe_items(category: Optional[str] = Query(None)):
     summary="내 옷장 이미지 목록 조회",
     description="현재 로그인한 사용자의 모든 옷장 아이템 이미지 목록을 조회합니다. 토큰에서 자동으로 user_id를 추출합니다.",
 )
-def get_my_wardrobe_images(
+async def get_my_wardrobe_images(
     category: Optional[str] = Query(
         None, description="Category filter (e.g. top, bottom)"
     ),
     skip: int = Query(0, ge=0, description="Number of items to skip (pagination)"),
     limit: int = Query(20, ge=1, le=100, description="Max number of items to return"),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (지정하면 skip 무시)"
+    ),
     user_id: UUID = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncDB = Depends(get_async_db),
 ):
     """Get all wardrobe images for the current user (from token)."""
     try:
         from .service import wardrobe_manager
 
-        result = wardrobe_manager.get_user_wardrobe_items(
-            db=db, user_id=user_id, category=category, skip=skip, limit=limit
+        result = await wardrobe_manager.get_user_wardrobe_items_async(
+            db=db,
+            user_id=user_id,
+            category=category,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
         )
 
         return create_success_response(
@@ -85,6 +93,7 @@ def get_my_wardrobe_images(
             count=result["count"],
             total_count=result["total_count"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
         )
     except Exception as e:
         raise handle_route_exception(e)
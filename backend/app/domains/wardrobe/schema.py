@@ -21,3 +21,4 @@ class WardrobeResponse(BaseModel):
     count: int
     total_count: Optional[int] = None
     has_more: Optional[bool] = None
+    next_cursor: Optional[str] = None
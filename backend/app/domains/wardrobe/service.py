@@ -1,89 +1,256 @@
 import os
 import json
+import base64
 import uuid
 import logging
 from datetime import datetime
-import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
-from supabase import create_client, Client
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.core.config import Config
+from app.database import AsyncDB
+from app.core.signed_urls import signed_url_service
+from app.core.storage import storage
 from app.utils.validators import validate_file_extension
 from .schema import WardrobeResponse, WardrobeItemSchema
+from .features import encode_feature_vector
+from app.domains.recommendation.score_cache import outfit_score_cache
 from app.core.schemas import AttributesSchema
 
 logger = logging.getLogger(__name__)
 
 
+def _category_filter(category: Optional[str]) -> Optional[List[str]]:
+    if not category:
+        return None
+    cat_upper = category.upper()
+    # Handle equivalent categories from UI/legacy data.
+    if cat_upper in {"OUTER", "OUTERWEAR"}:
+        return ["OUTER", "OUTERWEAR"]
+    return [cat_upper]
+
+
+def _sum_counts(counts: Dict[str, int], categories: Optional[List[str]]) -> int:
+    if categories is None:
+        return sum(c for c in counts.values() if c > 0)
+    return sum(max(counts.get(c, 0), 0) for c in categories)
+
+
+def _encode_cursor(created_at: datetime, item_id) -> str:
+    raw = f"{created_at.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, item_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
 class WardrobeManager:
     def __init__(self):
-        self.supabase_url = Config.SUPABASE_URL
-        self.supabase_key = Config.SUPABASE_SERVICE_KEY or Config.SUPABASE_ANON_KEY
-        self.bucket_name = Config.SUPABASE_STORAGE_BUCKET
-        self.supabase: Optional[Client] = None
-        self._signed_url_cache: Dict[str, tuple[str, float]] = {}
-
-        if self.supabase_url and self.supabase_key:
-            try:
-                self.supabase = create_client(self.supabase_url, self.supabase_key)
-            except Exception as e:
-                logger.error(f"Failed to initialize Supabase Client: {e}")
-
-    def get_signed_url(self, image_path: str, expires_in: int = 3600) -> str:
+        self.storage = storage
+        self.bucket_name = storage.bucket_name
+
+    def get_signed_url(self, image_path: str) -> str:
         """Supabase Storage?먯꽌 ?쒕챸??URL ?앹꽦 (?ㅽ뙣 ??怨듭슜 URL 諛섑솚)"""
-        if not image_path:
-            return ""
+        return signed_url_service.get(image_path)
 
-        if image_path.startswith("http"):
-            return image_path
+    async def aget_signed_url(self, image_path: str) -> str:
+        """``get_signed_url`` for async handlers (signs without blocking the loop)."""
+        return await signed_url_service.aget(image_path)
 
-        now_ts = time.time()
-        cached = self._signed_url_cache.get(image_path)
-        if cached and cached[1] > now_ts:
-            return cached[0]
+    def resolve_image_urls(self, image_paths: List[str]) -> Dict[str, str]:
+        """List pages: sign every path in one batch round trip (cached)."""
+        return signed_url_service.get_many(image_paths)
 
-        # Supabase ?대씪?댁뼵?멸? ?녿뒗 寃쎌슦 怨듭슜 URL 異붿륫 諛섑솚
-        if not self.supabase:
-            return f"{self.supabase_url}/storage/v1/object/public/{self.bucket_name}/{image_path}"
+    async def aresolve_image_urls(self, image_paths: List[str]) -> Dict[str, str]:
+        """``resolve_image_urls`` for async handlers."""
+        return await signed_url_service.aget_many(image_paths)
 
-        try:
-            # 踰꾪궥紐??쒓굅 (?덈떎硫?
-            path = image_path
-            if "/" in path and path.startswith(self.bucket_name):
-                path = path.replace(f"{self.bucket_name}/", "", 1)
-
-            # 1. ?쒕챸??URL ?쒕룄 (蹂댁븞???믪쓬)
-            res = self.supabase.storage.from_(self.bucket_name).create_signed_url(
-                path, expires_in
-            )
-            signed_url = res.get("signedURL")
-            if signed_url:
-                self._signed_url_cache[image_path] = (
-                    signed_url,
-                    now_ts + max(60, expires_in - 30),
-                )
-                return signed_url
+    def _to_schema(
+        self,
+        item,
+        resolve_image_urls: bool = True,
+        image_urls: Optional[Dict[str, str]] = None,
+    ) -> WardrobeItemSchema:
+        features = item.features or {}
+        if "category" not in features:
+            features["category"] = {
+                "main": item.category.lower() if item.category else "unknown",
+                "sub": item.sub_category.lower() if item.sub_category else "",
+                "confidence": 1.0,
+            }
+        if not resolve_image_urls:
+            image_url = item.image_path
+        elif image_urls is not None and item.image_path in image_urls:
+            image_url = image_urls[item.image_path]
+        else:
+            image_url = self.get_signed_url(item.image_path)
+        return WardrobeItemSchema(
+            id=str(item.id),
+            filename=f"item_{item.id}",
+            attributes=AttributesSchema(**features),
+            image_url=image_url,
+        )
 
-            # 2. ?ㅽ뙣 ??怨듭슜 URL濡??대갚 (媛?쒖꽦 ?뺣낫 ?곗꽑)
-            logger.warning(
-                f"Signed URL generation returned None for {path}, falling back to public URL."
-            )
-            return f"{self.supabase_url}/storage/v1/object/public/{self.bucket_name}/{path}"
+    def get_user_feature_vectors(
+        self, db: Session, user_id: UUID, limit: int = 200
+    ) -> List[Dict[str, Any]]:
+        """
+        Compact per-item rows for scoring: ``{"id", "category", "feature_vector"}``.
 
-        except Exception as e:
-            logger.warning(
-                f"Error generating Supabase signed URL for {image_path}: {e}"
+        Only the id/category/vector columns are loaded. Rows saved before the
+        vector column existed are encoded from ``features`` on the fly.
+        """
+        from .model import ClosetItem
+
+        rows = (
+            db.query(ClosetItem.id, ClosetItem.category, ClosetItem.feature_vector)
+            .filter(ClosetItem.user_id == user_id)
+            .order_by(ClosetItem.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+        missing = [row.id for row in rows if not row.feature_vector]
+        legacy_features: Dict[Any, Any] = {}
+        if missing:
+            legacy_features = dict(
+                db.query(ClosetItem.id, ClosetItem.features)
+                .filter(ClosetItem.id.in_(missing))
+                .all()
             )
-            # ?먮윭 諛쒖깮 ??怨듭슜 URL ?щ㎎?쇰줈 諛섑솚?섏뿬 釉뚮씪?곗??먯꽌 ?쒕룄?섍쾶 ??
-            path = (
-                image_path.replace(f"{self.bucket_name}/", "", 1)
-                if image_path.startswith(self.bucket_name)
-                else image_path
+
+        return [
+            {
+                "id": str(row.id),
+                "category": (row.category or "").lower(),
+                "feature_vector": row.feature_vector
+                or encode_feature_vector(legacy_features.get(row.id), row.category),
+            }
+            for row in rows
+        ]
+
+    def get_items_by_ids(
+        self,
+        db: Session,
+        user_id: UUID,
+        item_ids: List[Any],
+        resolve_image_urls: bool = True,
+    ) -> Dict[str, WardrobeItemSchema]:
+        """Load full item schemas for the given ids only (keyed by item id)."""
+        from .model import ClosetItem
+
+        ids = [i for i in item_ids if i]
+        if not ids:
+            return {}
+        closet_items = (
+            db.query(ClosetItem)
+            .filter(ClosetItem.user_id == user_id, ClosetItem.id.in_(ids))
+            .all()
+        )
+        image_urls = (
+            self.resolve_image_urls([item.image_path for item in closet_items])
+            if resolve_image_urls
+            else None
+        )
+        return {
+            str(item.id): self._to_schema(item, resolve_image_urls, image_urls)
+            for item in closet_items
+        }
+
+    def _bump_category_count(
+        self, db: Session, user_id: UUID, category: str, delta: int
+    ) -> None:
+        """Adjust the cached per-category count in the caller's transaction."""
+        from .model import ClosetCategoryCount
+
+        stmt = pg_insert(ClosetCategoryCount).values(
+            user_id=user_id, category=category, item_count=max(delta, 0)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ClosetCategoryCount.user_id, ClosetCategoryCount.category],
+            set_={
+                "item_count": func.greatest(ClosetCategoryCount.item_count + delta, 0)
+            },
+        )
+        db.execute(stmt)
+
+    def _category_counts_statement(self, user_id: UUID):
+        from .model import ClosetCategoryCount
+
+        return select(ClosetCategoryCount.category, ClosetCategoryCount.item_count).where(
+            ClosetCategoryCount.user_id == user_id
+        )
+
+    def get_category_counts(self, db: Session, user_id: UUID) -> Dict[str, int]:
+        rows = db.execute(self._category_counts_statement(user_id)).all()
+        return {category: count for category, count in rows if count > 0}
+
+    def count_user_items(
+        self, db: Session, user_id: UUID, categories: Optional[List[str]] = None
+    ) -> int:
+        """Total from closet_category_counts (no COUNT over closet_items)."""
+        return _sum_counts(self.get_category_counts(db, user_id), categories)
+
+    def _page_statement(
+        self,
+        user_id: UUID,
+        categories: Optional[List[str]],
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+    ):
+        """One listing page (+1 row to detect has_more), newest first."""
+        from .model import ClosetItem
+
+        stmt = select(ClosetItem).where(ClosetItem.user_id == user_id)
+        if categories:
+            stmt = stmt.where(ClosetItem.category.in_(categories))
+        if cursor:
+            created_at, item_id = _decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(ClosetItem.created_at, ClosetItem.id) < tuple_(created_at, item_id)
             )
-            return f"{self.supabase_url}/storage/v1/object/public/{self.bucket_name}/{path}"
+        stmt = stmt.order_by(ClosetItem.created_at.desc(), ClosetItem.id.desc())
+        if not cursor and skip:
+            stmt = stmt.offset(skip)
+        return stmt.limit(limit + 1)
+
+    def _page_result(
+        self,
+        closet_items: List[Any],
+        limit: int,
+        total_count: int,
+        resolve_image_urls: bool,
+        image_urls: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        has_more = len(closet_items) > limit
+        closet_items = closet_items[:limit]
+        next_cursor = (
+            _encode_cursor(closet_items[-1].created_at, closet_items[-1].id)
+            if has_more
+            else None
+        )
+        items: List[WardrobeItemSchema] = [
+            self._to_schema(item, resolve_image_urls, image_urls)
+            for item in closet_items
+        ]
+        return {
+            "items": items,
+            "count": len(items),
+            "total_count": total_count,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
 
     def get_user_wardrobe_items(
         self,
@@ -92,74 +259,72 @@ class WardrobeManager:
         category: Optional[str] = None,
         skip: int = 0,
         limit: int = 20,
+        cursor: Optional[str] = None,
         resolve_image_urls: bool = True,
     ) -> Dict[str, Any]:
-        """Get paginated wardrobe items from DB"""
-        from .model import ClosetItem
+        """
+        Paginated wardrobe items, newest first by ``(created_at, id)``.
 
+        Pass the previous page's ``next_cursor`` as ``cursor`` for keyset
+        pagination (``skip`` is then ignored); offset pagination is kept for
+        existing clients. ``total_count`` comes from the cached category counts.
+        """
         try:
-            query = db.query(ClosetItem).filter(ClosetItem.user_id == user_id)
-            if category:
-                cat_upper = category.upper()
-                # Handle equivalent categories from UI/legacy data.
-                if cat_upper in {"OUTER", "OUTERWEAR"}:
-                    query = query.filter(ClosetItem.category.in_(["OUTER", "OUTERWEAR"]))
-                else:
-                    query = query.filter(ClosetItem.category == cat_upper)
-
-            total_count = query.count()
-            if total_count == 0:
-                return {"items": [], "count": 0, "total_count": 0, "has_more": False}
-
-            from concurrent.futures import ThreadPoolExecutor
+            categories = _category_filter(category)
+            closet_items = db.scalars(
+                self._page_statement(user_id, categories, skip, limit, cursor)
+            ).all()
+            total_count = self.count_user_items(db, user_id, categories)
+
+            image_urls = (
+                self.resolve_image_urls([item.image_path for item in closet_items[:limit]])
+                if resolve_image_urls and closet_items
+                else None
+            )
+            return self._page_result(
+                closet_items, limit, total_count, resolve_image_urls, image_urls
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error in get_user_wardrobe_items: {e}")
+            raise e
 
+    async def get_user_wardrobe_items_async(
+        self,
+        db: AsyncDB,
+        user_id: UUID,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        resolve_image_urls: bool = True,
+    ) -> Dict[str, Any]:
+        """``get_user_wardrobe_items`` for async handlers (``get_async_db``)."""
+        try:
+            categories = _category_filter(category)
             closet_items = (
-                query.order_by(ClosetItem.id.desc()).offset(skip).limit(limit).all()
-            )
-            has_more = (skip + len(closet_items)) < total_count
-
-            # Prepare simple data list in main thread to avoid SQLAlchemy thread-safety issues
-            item_data_list = []
-            for item in closet_items:
-                features = item.features or {}
-                if "category" not in features:
-                    features["category"] = {
-                        "main": item.category.lower() if item.category else "unknown",
-                        "sub": item.sub_category.lower() if item.sub_category else "",
-                        "confidence": 1.0,
-                    }
-                item_data_list.append(
-                    {
-                        "id": str(item.id),
-                        "image_path": item.image_path,
-                        "features": features,
-                    }
+                await db.scalars(
+                    self._page_statement(user_id, categories, skip, limit, cursor)
                 )
+            ).all()
+            counts = (await db.execute(self._category_counts_statement(user_id))).all()
+            total_count = _sum_counts(dict(counts), categories)
 
-            items: List[WardrobeItemSchema] = []
-            for data in item_data_list:
-                final_image_url = (
-                    self.get_signed_url(data["image_path"])
-                    if resolve_image_urls
-                    else data["image_path"]
+            image_urls = (
+                await self.aresolve_image_urls(
+                    [item.image_path for item in closet_items[:limit]]
                 )
-                items.append(
-                    WardrobeItemSchema(
-                        id=data["id"],
-                        filename=f"item_{data['id']}",
-                        attributes=AttributesSchema(**data["features"]),
-                        image_url=final_image_url,
-                    )
-                )
-
-            return {
-                "items": items,
-                "count": len(items),
-                "total_count": total_count,
-                "has_more": has_more,
-            }
+                if resolve_image_urls and closet_items
+                else None
+            )
+            return self._page_result(
+                closet_items, limit, total_count, resolve_image_urls, image_urls
+            )
+        except HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Error in get_user_wardrobe_items: {e}")
+            logger.error(f"Error in get_user_wardrobe_items_async: {e}")
             raise e
 
     def delete_item(self, db: Session, user_id: UUID, item_id: UUID) -> bool:
@@ -177,21 +342,33 @@ class WardrobeManager:
                 return False
 
             # 1. Try to delete from Supabase Storage
+            # (중복 업로드로 같은 이미지를 공유하는 항목이 남아 있으면 유지)
+            shared = (
+                db.query(ClosetItem.id)
+                .filter(
+                    ClosetItem.image_path == item.image_path,
+                    ClosetItem.id != item.id,
+                )
+                .first()
+                is not None
+            )
             if (
-                self.supabase
+                self.storage.available
                 and item.image_path
                 and not item.image_path.startswith("http")
+                and not shared
             ):
                 try:
-                    self.supabase.storage.from_(self.bucket_name).remove(
-                        [item.image_path]
-                    )
+                    self.storage.remove([item.image_path])
+                    signed_url_service.invalidate(item.image_path)
                 except Exception as storage_err:
                     logger.warning(f"Failed to delete storage file: {storage_err}")
 
             # 2. Delete from Database
             db.delete(item)
+            self._bump_category_count(db, user_id, item.category, -1)
             db.commit()
+            outfit_score_cache.remove_item(user_id, item_id)
             return True
         except Exception as e:
             db.rollback()
@@ -205,11 +382,41 @@ class WardrobeManager:
         original_filename: str,
         attributes: dict,
         user_id: UUID,
+        image_sha256: Optional[str] = None,
+        image_dhash: Optional[int] = None,
+        existing_image_path: Optional[str] = None,
     ) -> dict:
-        if not self.supabase:
-            raise Exception("Supabase Storage not initialized")
+        """
+        Upload the image and insert the closet item.
+
+        With ``existing_image_path`` (dedup hit on a re-upload) the stored
+        image is shared with the new item and nothing is uploaded.
+        """
+        if existing_image_path:
+            return self.insert_item(
+                db,
+                user_id,
+                existing_image_path,
+                attributes,
+                image_sha256=image_sha256,
+                image_dhash=image_dhash,
+            )
 
         # 1. Save Image to Supabase Storage
+        image_url = self.upload_image(image_bytes, original_filename, user_id)
+
+        # 2. Save to Database
+        return self.insert_item(
+            db,
+            user_id,
+            image_url,
+            attributes,
+            image_sha256=image_sha256,
+            image_dhash=image_dhash,
+        )
+
+    def _new_image_path(self, original_filename: str, user_id: UUID) -> tuple[str, str]:
+        """(storage path, content type) for a new upload."""
         user_uuid_folder = str(user_id)  # Supabase???대뜑 援ъ“媛 ?먯쑀濡쒖?
         now = datetime.now()
         date_str = now.strftime("%Y%m%d")
@@ -229,24 +436,50 @@ class WardrobeManager:
             content_type = "image/gif"
         elif ext == ".webp":
             content_type = "image/webp"
+        return file_path, content_type
+
+    def upload_image(
+        self, image_bytes: bytes, original_filename: str, user_id: UUID
+    ) -> str:
+        """Upload image bytes to Supabase Storage and return the stored path."""
+        if not self.storage.available:
+            raise Exception("Supabase Storage not initialized")
 
+        file_path, content_type = self._new_image_path(original_filename, user_id)
         try:
-            # Supabase Storage ?낅줈??
-            self.supabase.storage.from_(self.bucket_name).upload(
-                path=file_path,
-                file=image_bytes,
-                file_options={"content-type": content_type},
-            )
+            self.storage.upload(file_path, image_bytes, content_type)
+        except Exception as e:
+            logger.error(f"Supabase Storage Upload failed: {e}")
+            raise Exception(f"Failed to upload image to Supabase: {e}")
 
-            # 怨듦컻 URL ?먮뒗 寃쎈줈 ???(寃쎈줈濡???ν븯??寃껋씠 ?섏쨷??Signed URL ?앹꽦???좊━)
-            # ?ш린?쒕뒗 ?섏쨷??get_signed_url?먯꽌 泥섎━?섍린 ?꾪빐 ?곷? 寃쎈줈留???ν븯嫄곕굹 ?꾩껜 怨듭슜 URL ???媛??
-            # ?곕━??DB??image_path??'bucket/path' ?뺥깭濡???ν븯嫄곕굹 怨듭슜 URL ???
-            image_url = file_path  # ?ш린?쒕뒗 愿濡???곷? 寃쎈줈 ???
+        return file_path
+
+    async def upload_image_async(
+        self, image_bytes: bytes, original_filename: str, user_id: UUID
+    ) -> str:
+        """upload_image for async handlers (pooled async HTTP, no worker thread)."""
+        if not self.storage.available:
+            raise Exception("Supabase Storage not initialized")
+
+        file_path, content_type = self._new_image_path(original_filename, user_id)
+        try:
+            await self.storage.aupload(file_path, image_bytes, content_type)
         except Exception as e:
             logger.error(f"Supabase Storage Upload failed: {e}")
             raise Exception(f"Failed to upload image to Supabase: {e}")
 
-        # 2. Save to Database
+        return file_path
+
+    def insert_item(
+        self,
+        db: Session,
+        user_id: UUID,
+        image_url: str,
+        attributes: dict,
+        image_sha256: Optional[str] = None,
+        image_dhash: Optional[int] = None,
+        resolve_image_url: bool = True,
+    ) -> dict:
         from .model import ClosetItem
 
         category_raw = attributes.get("category", {})
@@ -285,16 +518,27 @@ class WardrobeManager:
             features=features,
             season=season,
             mood_tags=mood_tags,
+            feature_vector=encode_feature_vector(features, category),
+            image_sha256=image_sha256,
+            image_dhash=image_dhash,
         )
         db.add(db_item)
+        self._bump_category_count(db, user_id, category, 1)
         db.commit()
         db.refresh(db_item)
+        outfit_score_cache.add_item(
+            user_id,
+            {"id": str(db_item.id), "feature_vector": db_item.feature_vector},
+            category,
+        )
 
         return {
             "success": "success",
-            "image_url": self.get_signed_url(image_url),
+            "image_url": (
+                self.get_signed_url(image_url) if resolve_image_url else image_url
+            ),
             "item_id": db_item.id,
-            "blob_name": file_path,
+            "blob_name": image_url,
         }
 
     def save_manual_item(
@@ -333,10 +577,17 @@ class WardrobeManager:
             features=features,
             season=season,
             mood_tags=attributes.get("style_tags") or attributes.get("mood_tags") or [],
+            feature_vector=encode_feature_vector(features, category),
         )
         db.add(db_item)
+        self._bump_category_count(db, user_id, category, 1)
         db.commit()
         db.refresh(db_item)
+        outfit_score_cache.add_item(
+            user_id,
+            {"id": str(db_item.id), "feature_vector": db_item.feature_vector},
+            category,
+        )
 
         return WardrobeItemSchema(
             id=str(db_item.id),
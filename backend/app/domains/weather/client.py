@@ -1,13 +1,71 @@
+import asyncio
+import logging
+import random
 import aiohttp
 from typing import Dict, Any, Optional
 from urllib.parse import unquote
 from app.core.config import Config
 
+logger = logging.getLogger(__name__)
+
 
 class KMAWeatherClient:
-    """기상청 단기예보 API 클라이언트"""
+    """
+    기상청 단기예보 API 클라이언트
+
+    배치(17개 지역 동시 조회)와 요청 시 조회가 하나의 keep-alive
+    ``aiohttp.ClientSession`` 을 공유합니다. 세션은 처음 호출될 때 현재
+    이벤트 루프에 만들어지고, 앱 종료(lifespan) 또는 배치 종료 시 ``aclose`` 로
+    닫습니다. 연결 오류/타임아웃/429·5xx 응답은 지터가 들어간 지수 백오프로
+    재시도합니다.
+    """
 
     BASE_URL = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getVilageFcst"
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        limit_per_host: int = 20,
+        dns_cache_ttl: int = 300,
+        timeout: float = 10.0,
+        max_retries: int = 2,
+        backoff_seconds: float = 0.5,
+    ):
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = backoff_seconds
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        # aiohttp 세션은 생성한 루프에 묶이므로 루프가 바뀌면 새로 만듦
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._loop = loop
+        return self._session
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 동시에 실패한 지역들이 같은 순간에 재시도하지 않도록
+        return random.uniform(0, self.backoff_seconds * (2**attempt))
+
+    async def aclose(self) -> None:
+        session, self._session = self._session, None
+        self._loop = None
+        if session is not None and not session.closed:
+            await session.close()
 
     async def fetch_forecast(
         self, base_date: str, base_time: str, nx: int, ny: int, numOfRows: int
@@ -40,18 +98,44 @@ class KMAWeatherClient:
             "ny": ny,
         }
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.BASE_URL,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as e:
-            print(f"KMA API Connection Failed: {e}")
-            return None
-        except Exception as e:
-            print(f"Unexpected error: {e}")
-            return None
+        self.requests += 1
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                async with self._get_session().get(self.BASE_URL, params=params) as response:
+                    if response.status not in self.RETRY_STATUSES or last_attempt:
+                        response.raise_for_status()
+                        return await response.json()
+                    reason = f"HTTP {response.status}"
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # keep-alive 연결이 서버 쪽에서 끊긴 경우도 여기로 옴
+                if last_attempt:
+                    logger.warning(f"KMA API Connection Failed ({nx},{ny}): {e!r}")
+                    self.failures += 1
+                    return None
+                reason = repr(e)
+            except aiohttp.ClientError as e:
+                logger.warning(f"KMA API request failed ({nx},{ny}): {e}")
+                self.failures += 1
+                return None
+            except Exception as e:
+                logger.error(f"Unexpected KMA API error ({nx},{ny}): {e}")
+                self.failures += 1
+                return None
+
+            self.retries += 1
+            delay = self._backoff(attempt)
+            logger.info(
+                f"KMA API retry {attempt + 1}/{self.max_retries} ({nx},{ny}) "
+                f"in {delay:.2f}s: {reason}"
+            )
+            await asyncio.sleep(delay)
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "session_open": self._session is not None and not self._session.closed,
+        }
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
-from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import AsyncDB, get_async_db
 from .service import weather_service
 from .schema import DailyWeatherResponse
 from app.core.regions import get_nearest_region
@@ -12,7 +11,7 @@ router = APIRouter()
 async def get_today_summary(
     lat: float = Query(..., description="위도"),
     lon: float = Query(..., description="경도"),
-    db: Session = Depends(get_db),
+    db: AsyncDB = Depends(get_async_db),
 ):
     # 1. 가장 가까운 지역 찾기
     region_name, region_data = get_nearest_region(lat, lon)
@@ -1,11 +1,13 @@
 import logging
 from datetime import datetime
-from typing import Tuple, Optional, Dict, Any, Protocol, cast
+from typing import Tuple, Optional, Dict, Any, Protocol, Union, cast
 from .model import DailyWeather
 from .client import KMAWeatherClient
 from .utils import dfs_xy_conv
 import asyncio
+from app.core.config import Config
 from app.core.regions import KOREA_REGIONS
+from app.database import AsyncDB, run_db
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -23,9 +25,45 @@ class DbSessionLike(Protocol):
     def rollback(self) -> None: ...
 
 
+# 요청 경로에서는 AsyncSession/ThreadedSession (app.database.get_async_db) 도 받음
+WeatherDb = Union[DbSessionLike, AsyncDB]
+
+
+def _find_daily_weather(db: DbSessionLike, base_date: str, nx: int, ny: int):
+    return db.query(DailyWeather).filter_by(base_date=base_date, nx=nx, ny=ny).first()
+
+
+def _save_daily_weather(db: DbSessionLike, weather_obj: DailyWeather) -> None:
+    try:
+        db.add(weather_obj)
+        db.commit()
+        db.refresh(weather_obj)
+    except Exception:
+        db.rollback()
+        raise
+
+
+def _unavailable_weather_info(region_name: str) -> Dict[str, Any]:
+    # temp_min/max 0은 표시용 자리값일 뿐이므로 available=False 로 구분
+    # (0°C로 읽으면 날씨 조회 실패마다 겨울 코디가 추천됨)
+    return {
+        "summary": "날씨 정보를 가져올 수 없습니다.",
+        "temp_min": 0,
+        "temp_max": 0,
+        "region": region_name,
+        "available": False,
+    }
+
+
 class WeatherService:
     def __init__(self):
-        self.client = KMAWeatherClient()
+        self.client = KMAWeatherClient(
+            limit_per_host=Config.KMA_MAX_CONNECTIONS_PER_HOST,
+            dns_cache_ttl=Config.KMA_DNS_CACHE_TTL_SECONDS,
+            timeout=Config.KMA_TIMEOUT_SECONDS,
+            max_retries=Config.KMA_MAX_RETRIES,
+            backoff_seconds=Config.KMA_RETRY_BACKOFF_SECONDS,
+        )
         self._locks: Dict[str, asyncio.Lock] = {}
 
     async def fetchAndLoadWeather(self, db: Optional[DbSessionLike]):
@@ -160,7 +198,7 @@ class WeatherService:
 
     async def get_daily_weather_summary(
         self,
-        db: Optional[DbSessionLike],
+        db: Optional[WeatherDb],
         nx: int,
         ny: int,
         region: Optional[str] = None,
@@ -178,12 +216,7 @@ class WeatherService:
 
         async with self._locks[lock_key]:
             if db is not None:
-                db_session: DbSessionLike = db
-                cached = (
-                    db_session.query(DailyWeather)
-                    .filter_by(base_date=today_str, nx=nx, ny=ny)
-                    .first()
-                )
+                cached = await run_db(db, _find_daily_weather, today_str, nx, ny)
 
                 if cached:
                     return cached, "DB Cached"
@@ -234,14 +267,10 @@ class WeatherService:
 
         msg = "Fetched from KMA"
         if db is not None:
-            db_session: DbSessionLike = db
             try:
-                db_session.add(weather_obj)
-                db_session.commit()
-                db_session.refresh(weather_obj)
+                await run_db(db, _save_daily_weather, weather_obj)
                 msg += " (Saved to DB)"
             except Exception as e:
-                db_session.rollback()
                 print(f"Failed to save weather data to DB: {e}")
                 msg += f" (DB Save Failed: {str(e)})"
 
@@ -251,7 +280,7 @@ class WeatherService:
         return weather_obj, msg
 
     async def get_weather_info(
-        self, db: Optional[DbSessionLike], lat: float, lon: float
+        self, db: Optional[WeatherDb], lat: float, lon: float
     ) -> Dict[str, Any]:
         """
         코디 추천 엔진에서 사용하기 위한 날씨 정보 간편 반환 함수
@@ -272,44 +301,69 @@ class WeatherService:
             )
 
             if weather_obj is not None:
-                min_temp_raw = weather_obj.min_temp
-                max_temp_raw = weather_obj.max_temp
-                min_temp = (
-                    float(min_temp_raw)
-                    if isinstance(min_temp_raw, (int, float))
-                    else 0.0
-                )
-                max_temp = (
-                    float(max_temp_raw)
-                    if isinstance(max_temp_raw, (int, float))
-                    else 0.0
-                )
-
-                # 가독성을 위한 요약 텍스트 생성 (OutfitRecommender 로직 통합)
-                summary = (
-                    f"{weather_obj.region or '현위치'} 기온 {min_temp}°C ~ {max_temp}°C"
-                )
-                if max_temp >= 24:
-                    summary += " (여름 날씨)"
-                elif max_temp <= 12:
-                    summary += " (겨울 날씨)"
-                else:
-                    summary += " (선선한 날씨)"
-
-                return {
-                    "summary": summary,
-                    "temp_min": min_temp,
-                    "temp_max": max_temp,
-                    "region": region_name,
-                }
+                return self._to_weather_info(weather_obj, region_name)
         except Exception as e:
             logger.error(f"Error in get_weather_info: {e}", exc_info=True)
 
+        return _unavailable_weather_info(region_name)
+
+    async def get_region_weather_info(
+        self, db: Optional[WeatherDb], region_name: str
+    ) -> Dict[str, Any]:
+        """
+        지역명(KOREA_REGIONS 키) 기준 날씨 정보 반환 (배치용)
+        """
+        if region_name not in KOREA_REGIONS:
+            region_name = "Seoul"
+        region = KOREA_REGIONS[region_name]
+
+        try:
+            # 야간 날씨 배치가 저장한 (nx, ny) 격자 그대로 조회
+            weather_obj, _ = await self.get_daily_weather_summary(
+                db, region["nx"], region["ny"], region_name
+            )
+            if weather_obj is not None:
+                return self._to_weather_info(weather_obj, region_name)
+        except Exception as e:
+            logger.error(f"Error in get_region_weather_info: {e}", exc_info=True)
+
+        return _unavailable_weather_info(region_name)
+
+    def _to_weather_info(
+        self, weather_obj: DailyWeather, region_name: str
+    ) -> Dict[str, Any]:
+        min_temp_raw = weather_obj.min_temp
+        max_temp_raw = weather_obj.max_temp
+        min_temp = (
+            float(min_temp_raw)
+            if isinstance(min_temp_raw, (int, float))
+            else 0.0
+        )
+        max_temp = (
+            float(max_temp_raw)
+            if isinstance(max_temp_raw, (int, float))
+            else 0.0
+        )
+
+        # 가독성을 위한 요약 텍스트 생성 (OutfitRecommender 로직 통합)
+        summary = (
+            f"{weather_obj.region or '현위치'} 기온 {min_temp}°C ~ {max_temp}°C"
+        )
+        if max_temp >= 24:
+            summary += " (여름 날씨)"
+        elif max_temp <= 12:
+            summary += " (겨울 날씨)"
+        else:
+            summary += " (선선한 날씨)"
+
         return {
-            "summary": "날씨 정보를 가져올 수 없습니다.",
-            "temp_min": 0,
-            "temp_max": 0,
+            "summary": summary,
+            "temp_min": min_temp,
+            "temp_max": max_temp,
             "region": region_name,
+            # 예보에 최저/최고 기온이 없으면 0.0 자리값이므로 사용 불가로 표시
+            "available": isinstance(min_temp_raw, (int, float))
+            and isinstance(max_temp_raw, (int, float)),
         }
 
     def _parse_weather_data(
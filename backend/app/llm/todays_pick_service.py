@@ -1,7 +1,7 @@
 """Today's Pick service (in-memory, Gemini-driven)."""
 
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from uuid import UUID
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
@@ -14,56 +14,154 @@ from app.storage.memory_store import (
     list_wardrobe_items,
     set_todays_pick,
 )
-from app.domains.recommendation.model import TodaysPick
-from app.domains.user.model import User
+from app.domains.recommendation.model import PICK_SOURCE_REQUEST, TodaysPick
+from app.core.principal import principal_cache
+from app.database import AsyncDB, run_db
 from app.domains.user.service import user_manager
 
 logger = logging.getLogger(__name__)
 
 
-def _pick_items(items: list[dict[str, Any]]) -> dict[str, Any]:
-    from app.domains.recommendation.service import recommender
+def _main_category(item: dict[str, Any]) -> Optional[str]:
+    # Compact feature rows carry the DB category column directly
+    if item.get("category"):
+        return item["category"]
+    return item.get("attributes", {}).get("category", {}).get("main")
 
-    tops = [
-        i
-        for i in items
-        if i.get("attributes", {}).get("category", {}).get("main") == "top"
-    ]
-    bottoms = [
-        i
-        for i in items
-        if i.get("attributes", {}).get("category", {}).get("main") == "bottom"
-    ]
+
+def _pick_items(
+    items: list[dict[str, Any]], user_id: Optional[UUID] = None
+) -> dict[str, Any]:
+    from app.domains.recommendation.selection import select_top_pairs
+
+    tops = [i for i in items if _main_category(i) == "top"]
+    bottoms = [i for i in items if _main_category(i) == "bottom"]
     if not tops or not bottoms:
         raise ValueError("Insufficient wardrobe items")
 
-    best = None
-    best_score = -1.0
-    for top in tops:
-        for bottom in bottoms:
-            score, _ = recommender.calculate_outfit_score(top, bottom)
-            score = float(score)
-            if score > best_score:
-                best_score = score
-                best = {"top": top, "bottom": bottom, "score": score}
+    selected, _, _ = select_top_pairs(tops, bottoms, 1, user_id=user_id)
+    top_idx, bottom_idx, score = selected[0]
+    return {"top": tops[top_idx], "bottom": bottoms[bottom_idx], "score": score}
+
+
+def _schema_to_item(schema: Any) -> dict[str, Any]:
+    return {
+        "id": schema.id,
+        "filename": schema.filename,
+        "image_url": schema.image_url,
+        "attributes": (
+            schema.attributes.model_dump()
+            if hasattr(schema.attributes, "model_dump")
+            else schema.attributes
+        ),
+    }
+
+
+def _pick_from_feature_vectors(
+    db: Session,
+    user_id: UUID,
+    full_schemas: dict[str, Any],
+    resolve_image_urls: bool,
+) -> dict[str, Any]:
+    """Score the compact feature vectors, then load full schemas for the pair only."""
+    from app.domains.wardrobe.service import wardrobe_manager
+
+    rows = wardrobe_manager.get_user_feature_vectors(db=db, user_id=user_id, limit=200)
+    if not rows:
+        raise ValueError("No wardrobe items found for user")
+
+    best = _pick_items(rows, user_id=user_id)
+    top_id, bottom_id = best["top"]["id"], best["bottom"]["id"]
+    schemas = wardrobe_manager.get_items_by_ids(
+        db=db,
+        user_id=user_id,
+        item_ids=[top_id, bottom_id],
+        resolve_image_urls=resolve_image_urls,
+    )
+    if top_id not in schemas or bottom_id not in schemas:
+        raise ValueError("Picked wardrobe items no longer exist")
+    full_schemas.update(schemas)
+    return {
+        "top": _schema_to_item(schemas[top_id]),
+        "bottom": _schema_to_item(schemas[bottom_id]),
+        "score": best["score"],
+    }
+
+
+def _load_recent_pick(
+    db: Session, user_id: UUID, since: datetime
+) -> tuple[Optional[TodaysPick], dict[str, Any]]:
+    """Most recent pick created after ``since`` and the schemas of its items."""
+    from app.domains.wardrobe.service import wardrobe_manager
+
+    existing_pick = (
+        db.query(TodaysPick)
+        .filter(
+            TodaysPick.user_id == user_id,
+            TodaysPick.created_at >= since,
+        )
+        .order_by(desc(TodaysPick.created_at))
+        .first()
+    )
+    if not existing_pick:
+        return None, {}
+    schemas = wardrobe_manager.get_items_by_ids(
+        db=db,
+        user_id=user_id,
+        item_ids=[existing_pick.top_id, existing_pick.bottom_id],
+        resolve_image_urls=False,
+    )
+    return existing_pick, schemas
+
+
+async def _sign_schema_images(schemas: dict[str, Any]) -> None:
+    """Replace storage paths with signed URLs (one batch request)."""
+    from app.domains.wardrobe.service import wardrobe_manager
+
+    urls = await wardrobe_manager.aresolve_image_urls(
+        [schema.image_url for schema in schemas.values() if schema.image_url]
+    )
+    for schema in schemas.values():
+        if schema.image_url in urls:
+            schema.image_url = urls[schema.image_url]
+
+
+def _set_pick_image(db: Session, pick: TodaysPick, image_url: str) -> None:
+    pick.image_url = image_url
+    db.commit()
+    db.refresh(pick)
 
-    return best or {"top": tops[0], "bottom": bottoms[0], "score": 0.5}
+
+def _save_pick(db: Session, pick: TodaysPick) -> None:
+    db.add(pick)
+    db.commit()
+    db.refresh(pick)
 
 
 async def recommend_todays_pick_v2(
     user_id: UUID,
     weather: dict[str, Any],
-    db: Optional[Session] = None,
+    db: Optional[Union[Session, AsyncDB]] = None,
     context: Optional[str] = None,
     generate_image: bool = False,
+    reuse_since: Optional[datetime] = None,
+    source: str = PICK_SOURCE_REQUEST,
 ) -> dict[str, Any]:
-    """Return Today's Pick using DB persistence + Gemini reasoning."""
+    """
+    Return Today's Pick using DB persistence + Gemini reasoning.
+
+    A pick created after ``reuse_since`` (default: the last 24h) is returned
+    instead of generating a new one. ``db`` may be a sync ``Session`` (batch)
+    or an async-handler session from ``get_async_db``; DB work goes through
+    ``run_db`` and URL signing through the async signed-URL API, so neither
+    blocks the event loop.
+    """
     try:
         from app.domains.wardrobe.schema import WardrobeItemSchema
         from app.domains.generation.service import generation_service
         from app.domains.generation.schema import OutfitGenerationRequest
 
-        # Load all user items for matching
+        # Items referenced by the response (full attribute dicts)
         items = []
         full_schemas = {}  # Map ID to full schema for generation
 
@@ -71,40 +169,17 @@ async def recommend_todays_pick_v2(
             from app.domains.wardrobe.service import wardrobe_manager
 
             # 1. Check DB for existing pick in the recent 24h window
-            recent_window_start = datetime.now() - timedelta(hours=24)
-            existing_pick = (
-                db.query(TodaysPick)
-                .filter(
-                    TodaysPick.user_id == user_id,
-                    TodaysPick.created_at >= recent_window_start,
-                )
-                .order_by(desc(TodaysPick.created_at))
-                .first()
-            )
+            recent_window_start = reuse_since or datetime.now() - timedelta(hours=24)
 
-            # Load Wardrobe Items
-            res = wardrobe_manager.get_user_wardrobe_items(
-                db=db,
-                user_id=user_id,
-                skip=0,
-                limit=200,
-                resolve_image_urls=generate_image,
+            # Only the items referenced by an existing pick need full schemas;
+            # a new pick is scored from compact feature vectors further below.
+            existing_pick, full_schemas = await run_db(
+                db, _load_recent_pick, user_id, recent_window_start
             )
-            items_list = res.get("items", [])
-            for item in items_list:
-                full_schemas[str(item.id)] = item
-                items.append(
-                    {
-                        "id": item.id,
-                        "filename": item.filename,
-                        "image_url": item.image_url,
-                        "attributes": (
-                            item.attributes.model_dump()
-                            if hasattr(item.attributes, "model_dump")
-                            else item.attributes
-                        ),
-                    }
-                )
+            if existing_pick:
+                if generate_image:
+                    await _sign_schema_images(full_schemas)
+                items = [_schema_to_item(schema) for schema in full_schemas.values()]
         else:
             # Fallback to Memory Store
             existing = get_todays_pick(user_id)
@@ -145,13 +220,15 @@ async def recommend_todays_pick_v2(
                 (i for i in items if str(i["id"]) == str(existing_pick.bottom_id)), None
             )
 
-            def _resolve_item_image(item: dict[str, Any] | None) -> dict[str, Any] | None:
+            async def _resolve_item_image(
+                item: dict[str, Any] | None,
+            ) -> dict[str, Any] | None:
                 if not item:
                     return item
                 resolved = dict(item)
                 image_url = resolved.get("image_url")
                 if image_url and isinstance(image_url, str) and not image_url.startswith("http"):
-                    resolved["image_url"] = wardrobe_manager.get_signed_url(image_url)
+                    resolved["image_url"] = await wardrobe_manager.aget_signed_url(image_url)
                 return resolved
 
             clean_reasoning = existing_pick.reasoning
@@ -170,7 +247,7 @@ async def recommend_todays_pick_v2(
 
             if top_item and bottom_item:
                 existing_image_url = (
-                    wardrobe_manager.get_signed_url(existing_pick.image_url)
+                    await wardrobe_manager.aget_signed_url(existing_pick.image_url)
                     if existing_pick.image_url
                     and not existing_pick.image_url.startswith("http")
                     else existing_pick.image_url
@@ -187,20 +264,16 @@ async def recommend_todays_pick_v2(
                             user_body_shape = None
                             user_face_url = None
 
-                            user_obj = db.query(User).filter(User.id == user_id).first()
+                            user_obj = await run_db(db, principal_cache.load, user_id)
                             if user_obj:
-                                user_height = (
-                                    float(user_obj.height) if user_obj.height else None
-                                )
-                                user_weight = (
-                                    float(user_obj.weight) if user_obj.weight else None
-                                )
+                                user_height = user_obj.height
+                                user_weight = user_obj.weight
                                 user_gender = (
                                     user_obj.gender if user_obj.gender else "unisex"
                                 )
                                 user_body_shape = user_obj.body_shape
                                 if user_obj.face_image_path:
-                                    user_face_url = user_manager.get_signed_url(
+                                    user_face_url = await user_manager.aget_signed_url(
                                         user_obj.face_image_path
                                     )
 
@@ -220,11 +293,11 @@ async def recommend_todays_pick_v2(
                                 )
                             )
                             if generated_image_url:
-                                existing_pick.image_url = generated_image_url
-                                db.commit()
-                                db.refresh(existing_pick)
+                                await run_db(
+                                    db, _set_pick_image, existing_pick, generated_image_url
+                                )
                                 existing_image_url = (
-                                    user_manager.get_signed_url(generated_image_url)
+                                    await user_manager.aget_signed_url(generated_image_url)
                                     if not generated_image_url.startswith("http")
                                     else generated_image_url
                                 )
@@ -233,8 +306,8 @@ async def recommend_todays_pick_v2(
                             f"Failed to backfill existing Today's Pick image: {gen_err}"
                         )
 
-                top_item_resolved = _resolve_item_image(top_item)
-                bottom_item_resolved = _resolve_item_image(bottom_item)
+                top_item_resolved = await _resolve_item_image(top_item)
+                bottom_item_resolved = await _resolve_item_image(bottom_item)
                 return {
                     "success": True,
                     "pick_id": existing_pick.id,
@@ -299,10 +372,16 @@ async def recommend_todays_pick_v2(
                         },
                     }
 
-        if not items:
-            raise ValueError("No wardrobe items found for user")
-
-        picked = _pick_items(items)
+        if db:
+            picked = await run_db(
+                db, _pick_from_feature_vectors, user_id, full_schemas, False
+            )
+            if generate_image:
+                await _sign_schema_images(full_schemas)
+        else:
+            if not items:
+                raise ValueError("No wardrobe items found for user")
+            picked = _pick_items(items, user_id=user_id)
 
         # 1. Get reasoning from Gemini
         prompt = (
@@ -315,7 +394,7 @@ async def recommend_todays_pick_v2(
             '응답 형식: {"reasoning": "...", "style_description": "..."}'
         )
 
-        response_text = gemini_client.generate_content(
+        response_text = await gemini_client.generate_content_async(
             prompt, temperature=0.7, max_output_tokens=1000
         )
         parsed, _ = parse_dict_from_text(response_text)
@@ -358,18 +437,14 @@ async def recommend_todays_pick_v2(
                     user_face_url = None
 
                     if db:
-                        user_obj = db.query(User).filter(User.id == user_id).first()
+                        user_obj = await run_db(db, principal_cache.load, user_id)
                         if user_obj:
-                            user_height = (
-                                float(user_obj.height) if user_obj.height else None
-                            )
-                            user_weight = (
-                                float(user_obj.weight) if user_obj.weight else None
-                            )
+                            user_height = user_obj.height
+                            user_weight = user_obj.weight
                             user_gender = user_obj.gender if user_obj.gender else "unisex"
                             user_body_shape = user_obj.body_shape
                             if user_obj.face_image_path:
-                                user_face_url = user_manager.get_signed_url(
+                                user_face_url = await user_manager.aget_signed_url(
                                     user_obj.face_image_path
                                 )
 
@@ -413,9 +488,13 @@ async def recommend_todays_pick_v2(
             top_img = top_for_response.get("image_url")
             bottom_img = bottom_for_response.get("image_url")
             if isinstance(top_img, str) and top_img and not top_img.startswith("http"):
-                top_for_response["image_url"] = wardrobe_manager.get_signed_url(top_img)
+                top_for_response["image_url"] = await wardrobe_manager.aget_signed_url(
+                    top_img
+                )
             if isinstance(bottom_img, str) and bottom_img and not bottom_img.startswith("http"):
-                bottom_for_response["image_url"] = wardrobe_manager.get_signed_url(bottom_img)
+                bottom_for_response["image_url"] = await wardrobe_manager.aget_signed_url(
+                    bottom_img
+                )
 
         pick_id = None
         if db:
@@ -427,10 +506,9 @@ async def recommend_todays_pick_v2(
                 score=round(float(picked["score"]), 3),
                 weather=weather,
                 image_url=generated_image_url,
+                source=source,
             )
-            db.add(new_pick)
-            db.commit()
-            db.refresh(new_pick)
+            await run_db(db, _save_pick, new_pick)
             pick_id = new_pick.id
         else:
             # Fallback to memory
@@ -445,6 +523,12 @@ async def recommend_todays_pick_v2(
             )
             pick_id = saved.id
 
+        response_image_url = (
+            await user_manager.aget_signed_url(generated_image_url)
+            if generated_image_url and not generated_image_url.startswith("http")
+            else generated_image_url
+        )
+
         result_message = "새로운 오늘의 추천을 생성했습니다."
         if generate_image and generated_image_url:
             result_message = "새로운 오늘의 추천과 AI 실착 이미지를 생성했습니다."
@@ -454,11 +538,7 @@ async def recommend_todays_pick_v2(
             "pick_id": pick_id,
             "top_id": str(picked["top"]["id"]),
             "bottom_id": str(picked["bottom"]["id"]),
-            "image_url": (
-                user_manager.get_signed_url(generated_image_url)
-                if generated_image_url and not generated_image_url.startswith("http")
-                else generated_image_url
-            ),
+            "image_url": response_image_url,
             "reasoning": reasoning,
             "score": round(float(picked["score"]), 3),
             "weather": weather,
@@ -191,10 +191,45 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Startup migration failed: {e}")
 
+    # 2. Load rembg sessions once (first upload would otherwise pay the model load)
+    from app.domains.image_processing.worker_pool import (
+        image_worker_pool,
+        process_mode_enabled,
+    )
+
+    if process_mode_enabled():
+        # 워커 프로세스가 각자 세션을 한 번씩 로드
+        try:
+            import asyncio
+
+            await asyncio.to_thread(image_worker_pool.start)
+        except Exception as e:
+            logger.error(f"Image worker pool start failed (will start lazily): {e}")
+    elif Config.REMBG_PRELOAD:
+        try:
+            import asyncio
+
+            from app.domains.image_processing.session_pool import rembg_session_pool
+
+            await asyncio.to_thread(rembg_session_pool.load, warmup=Config.REMBG_WARMUP)
+        except Exception as e:
+            logger.error(f"rembg session preload failed (will load lazily): {e}")
+
     yield
 
     # Shutdown logic (if any)
     logger.info("Shutting down application...")
+    image_worker_pool.shutdown()
+
+    from app.core.signed_urls import signed_url_service
+    from app.core.storage import storage
+    from app.database import dispose_engines
+    from app.domains.weather.service import weather_service
+
+    signed_url_service.shutdown()
+    await storage.aclose()
+    await weather_service.client.aclose()
+    await dispose_engines()
 
 
 def create_app() -> FastAPI:
@@ -0,0 +1,130 @@
+"""
+Image normalization before Gemini Vision calls.
+
+Phone photos arrive as multi-megabyte JPEG/PNG/WebP files, often rotated
+through EXIF metadata only. Before an image is sent to the model it is:
+
+1. rotated according to its EXIF orientation (the model ignores EXIF),
+2. downscaled so the longest edge is at most ``VISION_IMAGE_MAX_EDGE``,
+3. re-encoded as JPEG at ``VISION_IMAGE_JPEG_QUALITY``.
+
+The original bytes are kept when the image is already small, upright and
+re-encoding would not shrink it, or when it cannot be decoded.
+"""
+
+import io
+import logging
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, ImageOps
+
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+_EXIF_ORIENTATION = 0x0112
+
+
+def detect_mime_type(data: bytes, default: str = "image/jpeg") -> str:
+    """MIME type from the file signature (magic bytes)."""
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if data[4:8] == b"ftyp" and data[8:12] in (b"heic", b"heix", b"mif1", b"msf1"):
+        return "image/heic"
+    return default
+
+
+@dataclass
+class PreparedImage:
+    data: bytes
+    mime_type: str
+    original_bytes: int
+    width: Optional[int] = None
+    height: Optional[int] = None
+    resized: bool = False
+
+
+def prepare_image_for_vision(
+    data: bytes,
+    max_edge: Optional[int] = None,
+    quality: Optional[int] = None,
+) -> PreparedImage:
+    """
+    Normalize one image for a vision call.
+
+    Args:
+        data: uploaded image bytes
+        max_edge: longest edge in pixels (default: Config.VISION_IMAGE_MAX_EDGE, 0 = no limit)
+        quality: JPEG quality (default: Config.VISION_IMAGE_JPEG_QUALITY)
+
+    Returns:
+        PreparedImage with the bytes to send and their real MIME type
+    """
+    max_edge = Config.VISION_IMAGE_MAX_EDGE if max_edge is None else max_edge
+    quality = quality or Config.VISION_IMAGE_JPEG_QUALITY
+    mime_type = detect_mime_type(data)
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            rotated = img.getexif().get(_EXIF_ORIENTATION, 1) not in (0, 1)
+            scale = max_edge / max(img.size) if max_edge else 1.0
+            if scale < 1 and img.format == "JPEG":
+                # JPEG은 DCT 단계에서 1/2~1/8로 줄여 디코딩 (목표 크기 이상 유지)
+                img.draft(
+                    "RGB",
+                    (math.ceil(img.width * scale), math.ceil(img.height * scale)),
+                )
+            image = ImageOps.exif_transpose(img)
+            resized = bool(max_edge) and max(image.size) > max_edge
+            if resized:
+                image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+            if image.mode in ("RGBA", "LA") or (
+                image.mode == "P" and "transparency" in image.info
+            ):
+                # 투명 배경은 흰색으로 합성 (JPEG는 알파 채널 미지원)
+                rgba = image.convert("RGBA")
+                flattened = Image.new("RGB", rgba.size, (255, 255, 255))
+                flattened.paste(rgba, mask=rgba.getchannel("A"))
+                image = flattened
+            elif image.mode != "RGB":
+                image = image.convert("RGB")
+
+            buffered = io.BytesIO()
+            image.save(buffered, format="JPEG", quality=quality, optimize=True)
+            encoded = buffered.getvalue()
+            width, height = image.size
+    except Exception as e:
+        logger.warning(f"Image preprocessing skipped (undecodable image): {e}")
+        return PreparedImage(data=data, mime_type=mime_type, original_bytes=len(data))
+
+    if not resized and not rotated and len(encoded) >= len(data) and mime_type in (
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+    ):
+        # 이미 작은 정방향 이미지는 원본 유지
+        return PreparedImage(
+            data=data,
+            mime_type=mime_type,
+            original_bytes=len(data),
+            width=width,
+            height=height,
+        )
+
+    return PreparedImage(
+        data=encoded,
+        mime_type="image/jpeg",
+        original_bytes=len(data),
+        width=width,
+        height=height,
+        resized=resized,
+    )
@@ -1,28 +1,15 @@
 import os
 import logging
 from typing import Optional
-from app.core.config import Config
+from app.core.storage import storage
 
 logger = logging.getLogger(__name__)
 
 
 class MannequinManager:
     def __init__(self):
-        # Supabase를 사용하도록 변경
-        self.supabase_url = Config.SUPABASE_URL
-        self.supabase_key = Config.SUPABASE_SERVICE_KEY or Config.SUPABASE_ANON_KEY
-        self.bucket_name = Config.SUPABASE_STORAGE_BUCKET
-        self.supabase = None
-
-        if self.supabase_url and self.supabase_key:
-            try:
-                from supabase import create_client
-
-                self.supabase = create_client(self.supabase_url, self.supabase_key)
-            except ImportError:
-                logger.error("supabase package not installed")
-            except Exception as e:
-                logger.error(f"Failed to initialize Supabase for MannequinManager: {e}")
+        self.storage = storage
+        self.bucket_name = storage.bucket_name
 
     def get_mannequin_bytes(self, gender: str, body_shape: str) -> Optional[bytes]:
         """
@@ -89,7 +76,7 @@ class MannequinManager:
         file_path = f"static/mannequins/{gender_folder}/{filename}"
 
         try:
-            if not self.supabase:
+            if not self.storage.available:
                 return None
 
             # 존재 여부 확인 로직 (Supabase Storage에서는 list_objects 등으로 확인 가능)
@@ -97,18 +84,14 @@ class MannequinManager:
             try:
                 with open(local_path, "rb") as f:
                     # upsert=True 옵션으로 덮어쓰기 허용
-                    self.supabase.storage.from_(self.bucket_name).upload(
-                        path=file_path,
-                        file=f.read(),
-                        file_options={"content-type": "image/png", "x-upsert": "true"},
-                    )
+                    self.storage.upload(file_path, f.read(), "image/png", upsert=True)
             except Exception:
                 # 이미 존재할 경우 에러 무시
                 pass
 
-            from app.domains.wardrobe.service import wardrobe_manager
+            from app.core.signed_urls import signed_url_service
 
-            return wardrobe_manager.get_signed_url(file_path)
+            return signed_url_service.get(file_path)
 
         except Exception as e:
             logger.error(f"Error handling mannequin supabase storage: {e}")
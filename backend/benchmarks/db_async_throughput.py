@@ -0,0 +1,142 @@
+"""
+Benchmark: DB round trips from async handlers under concurrency.
+
+Runs ``--requests`` small queries (``SELECT pg_sleep(:delay)`` by default, to
+stand in for network latency to a remote Postgres) from ``--concurrency``
+coroutines, the way ``async def`` handlers issue them, through:
+
+* blocking   - a sync ``Session`` called directly on the event loop (what a
+  sync ORM call inside an ``async def`` handler does)
+* threaded   - ``ThreadedSession`` (``get_async_db`` with DB_ASYNC_ENABLED off)
+* asyncpg    - ``AsyncSession`` on ``create_async_engine`` (DB_ASYNC_ENABLED on;
+  skipped when asyncpg is not installed)
+
+All modes share the pool settings from ``_pool_options`` so the comparison is
+about the driver model, not pool size.
+
+Usage (from backend/):
+    python -m benchmarks.db_async_throughput --database-url postgresql://localhost/myclo_bench
+    python -m benchmarks.db_async_throughput --concurrency 50 --requests 1000 --delay 0.005
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import ThreadedSession, _pool_options, async_database_url
+
+QUERY = text("SELECT pg_sleep(:delay)")
+
+
+async def _drive(
+    one_request: Callable[[], Awaitable[None]], concurrency: int, requests: int
+) -> List[float]:
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            start = time.perf_counter()
+            await one_request()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def run_blocking(url: str, delay: float, concurrency: int, requests: int) -> List[float]:
+    engine = create_engine(url, **_pool_options(url))
+    factory = sessionmaker(bind=engine)
+
+    async def one_request():
+        with factory() as db:
+            db.execute(QUERY, {"delay": delay})
+
+    try:
+        return await _drive(one_request, concurrency, requests)
+    finally:
+        engine.dispose()
+
+
+async def run_threaded(url: str, delay: float, concurrency: int, requests: int) -> List[float]:
+    engine = create_engine(url, **_pool_options(url))
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def one_request():
+        db = ThreadedSession(factory())
+        try:
+            await db.execute(QUERY, {"delay": delay})
+        finally:
+            await db.close()
+
+    try:
+        return await _drive(one_request, concurrency, requests)
+    finally:
+        engine.dispose()
+
+
+async def run_asyncpg(
+    url: str, delay: float, concurrency: int, requests: int
+) -> Optional[List[float]]:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_url, connect_args = async_database_url(url)
+    try:
+        engine = create_async_engine(async_url, connect_args=connect_args, **_pool_options(url))
+    except ImportError as e:
+        print(f"asyncpg    skipped ({e})")
+        return None
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def one_request():
+        async with factory() as db:
+            await db.execute(QUERY, {"delay": delay})
+
+    try:
+        return await _drive(one_request, concurrency, requests)
+    finally:
+        await engine.dispose()
+
+
+def _report(name: str, latencies: List[float], elapsed: float) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{name:<10} {len(latencies) / elapsed:>9.1f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:>7.2f} ms  p95 {p95 * 1000:>7.2f} ms"
+    )
+
+
+async def main_async(args) -> None:
+    modes = {"blocking": run_blocking, "threaded": run_threaded, "asyncpg": run_asyncpg}
+    print(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"query delay {args.delay * 1000:.1f} ms"
+    )
+    for name in args.modes:
+        start = time.perf_counter()
+        latencies = await modes[name](args.database_url, args.delay, args.concurrency, args.requests)
+        if latencies:
+            _report(name, latencies, time.perf_counter() - start)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True, help="postgresql://... (sync URL)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--delay", type=float, default=0.002, help="seconds per query")
+    parser.add_argument(
+        "--modes", nargs="+", default=["blocking", "threaded", "asyncpg"],
+        choices=["blocking", "threaded", "asyncpg"],
+    )
+    asyncio.run(main_async(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
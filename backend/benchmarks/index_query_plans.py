@@ -0,0 +1,240 @@
+"""
+Benchmark: hot-path query plans with and without the composite indexes.
+
+Seeds a throwaway schema in a local Postgres with realistic volumes (users,
+closet items, today's picks, chat sessions and messages), then runs each hot
+query under ``EXPLAIN (ANALYZE, FORMAT JSON)`` twice: with only primary keys,
+and after creating the composite indexes from the models / Alembic
+(revisions e5b2c9d4a6f1, a4c8e2f6b1d3, d4f9b3c7a2e8). Reports the median
+execution time and the plan's access path for each.
+
+The schema is dropped afterwards unless ``--keep`` is given. Never point this
+at a production database.
+
+Usage (from backend/):
+    python -m benchmarks.index_query_plans --database-url postgresql://localhost/myclo_bench
+    python -m benchmarks.index_query_plans --users 5000 --repeat 20 --keep
+"""
+
+import argparse
+import json
+import statistics
+from typing import Dict, List, Tuple
+
+from sqlalchemy import create_engine, text
+
+from app.database import Base
+
+# 모든 모델을 메타데이터에 등록
+from app.domains.user.model import User  # noqa: F401
+from app.domains.wardrobe.model import ClosetItem  # noqa: F401
+from app.domains.recommendation.model import TodaysPick  # noqa: F401
+from app.domains.weather.model import DailyWeather  # noqa: F401
+from app.domains.chat.model import ChatSession, ChatMessage  # noqa: F401
+from app.domains.outfit.model import OutfitLog  # noqa: F401
+
+SCHEMA = "index_bench"
+
+HOT_PATH_INDEXES: Dict[str, Tuple[str, str]] = {
+    "ix_closet_items_user_id_category": ("closet_items", "user_id, category"),
+    "ix_todays_picks_user_id_created_at": ("todays_picks", "user_id, created_at"),
+    "ix_chat_sessions_user_id_created_at": ("chat_sessions", "user_id, created_at"),
+    "ix_chat_messages_session_id_created_at": ("chat_messages", "session_id, created_at"),
+}
+
+# 다른 인덱스가 같은 조회를 대신 처리하지 않도록 "before" 측정에서 함께 제거
+SHADOWING_INDEXES = [
+    "ix_closet_items_user_id_created_at_id",
+    "ix_closet_items_user_id_image_sha256",
+]
+
+HOT_QUERIES: Dict[str, str] = {
+    "wardrobe by category": """
+        SELECT * FROM closet_items
+        WHERE user_id = :user_id AND category = 'TOP'
+        LIMIT 50
+    """,
+    "recommendation candidates": """
+        SELECT id, category, feature_vector FROM closet_items
+        WHERE user_id = :user_id AND category IN ('TOP', 'BOTTOM', 'OUTER')
+    """,
+    "latest today's pick": """
+        SELECT * FROM todays_picks
+        WHERE user_id = :user_id AND created_at >= now() - interval '1 day'
+        ORDER BY created_at DESC LIMIT 1
+    """,
+    "chat session list": """
+        SELECT * FROM chat_sessions
+        WHERE user_id = :user_id
+        ORDER BY created_at DESC LIMIT 20
+    """,
+    "latest chat message": """
+        SELECT content, created_at FROM chat_messages
+        WHERE session_id = :session_id
+        ORDER BY created_at DESC LIMIT 1
+    """,
+}
+
+CATEGORIES = "ARRAY['TOP','BOTTOM','OUTER','SHOES','ACCESSORY','DRESS']"
+
+
+def seed(conn, users: int, items: int, picks: int, sessions: int, messages: int) -> None:
+    """Bulk-insert synthetic rows with generate_series (per-user counts)."""
+    conn.execute(
+        text(
+            "INSERT INTO users (id, user_name, password, created_at) "
+            "SELECT gen_random_uuid(), 'bench-' || g, 'x', now() - random() * interval '365 days' "
+            "FROM generate_series(1, :n) g"
+        ),
+        {"n": users},
+    )
+    conn.execute(
+        text(
+            "INSERT INTO closet_items (id, user_id, image_path, category, sub_category, "
+            "features, feature_vector, created_at) "
+            f"SELECT gen_random_uuid(), u.id, u.id || '/' || g || '.png', "
+            f"({CATEGORIES})[1 + floor(random() * 6)::int], 'UNKNOWN', "
+            "'{}'::jsonb, ARRAY[random(), random(), random(), random()], "
+            "now() - random() * interval '365 days' "
+            "FROM users u, generate_series(1, :n) g"
+        ),
+        {"n": items},
+    )
+    conn.execute(
+        text(
+            "INSERT INTO todays_picks (id, user_id, reasoning, created_at) "
+            "SELECT gen_random_uuid(), u.id, 'bench', now() - g * interval '1 day' "
+            "FROM users u, generate_series(1, :n) g"
+        ),
+        {"n": picks},
+    )
+    conn.execute(
+        text(
+            "INSERT INTO chat_sessions (id, user_id, created_at) "
+            "SELECT gen_random_uuid(), u.id, now() - random() * interval '90 days' "
+            "FROM users u, generate_series(1, :n) g"
+        ),
+        {"n": sessions},
+    )
+    conn.execute(
+        text(
+            "INSERT INTO chat_messages (id, session_id, sender, content, created_at) "
+            "SELECT gen_random_uuid(), s.id, CASE WHEN g % 2 = 0 THEN 'AGENT' ELSE 'USER' END, "
+            "repeat('message ', 8), s.created_at + g * interval '1 minute' "
+            "FROM chat_sessions s, generate_series(1, :n) g"
+        ),
+        {"n": messages},
+    )
+    for table in ("users", "closet_items", "todays_picks", "chat_sessions", "chat_messages"):
+        conn.execute(text(f"ANALYZE {table}"))
+
+
+def _plan_node(plan: dict) -> str:
+    """First scan node in the plan, e.g. 'Index Scan using ix_...'."""
+    node = plan
+    while node:
+        node_type = node.get("Node Type", "")
+        if "Scan" in node_type:
+            index = node.get("Index Name")
+            return f"{node_type} using {index}" if index else node_type
+        node = (node.get("Plans") or [None])[0]
+    return plan.get("Node Type", "?")
+
+
+def explain(conn, sql: str, params: List[dict]) -> Tuple[float, str]:
+    timings, access = [], ""
+    for p in params:
+        row = conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), p).scalar()
+        result = row[0] if isinstance(row, list) else json.loads(row)[0]
+        timings.append(result["Execution Time"])
+        access = _plan_node(result["Plan"])
+    return statistics.median(timings), access
+
+
+def measure(conn, params: Dict[str, List[dict]]) -> Dict[str, Tuple[float, str]]:
+    results = {}
+    for name, sql in HOT_QUERIES.items():
+        key = "session" if ":session_id" in sql else "user"
+        results[name] = explain(conn, sql, params[key])
+    return results
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True, help="local Postgres (not production)")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--items-per-user", type=int, default=80)
+    parser.add_argument("--picks-per-user", type=int, default=60)
+    parser.add_argument("--sessions-per-user", type=int, default=12)
+    parser.add_argument("--messages-per-session", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=10, help="samples per query")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded schema")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    with engine.connect() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        conn.commit()
+
+    bench = engine.execution_options(schema_translate_map={None: SCHEMA})
+    try:
+        with bench.connect() as conn:
+            conn.execute(text(f"SET search_path TO {SCHEMA}"))
+            Base.metadata.create_all(conn)
+            for index in list(HOT_PATH_INDEXES) + SHADOWING_INDEXES + ["ix_chat_sessions_user_id"]:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+
+            print(
+                f"seeding {args.users} users x {args.items_per_user} items, "
+                f"{args.picks_per_user} picks, {args.sessions_per_user} sessions x "
+                f"{args.messages_per_session} messages ..."
+            )
+            seed(
+                conn,
+                args.users,
+                args.items_per_user,
+                args.picks_per_user,
+                args.sessions_per_user,
+                args.messages_per_session,
+            )
+            conn.commit()
+
+            params = {
+                "user": [
+                    {"user_id": r[0]}
+                    for r in conn.execute(
+                        text("SELECT id FROM users ORDER BY random() LIMIT :n"),
+                        {"n": args.repeat},
+                    )
+                ],
+                "session": [
+                    {"session_id": r[0]}
+                    for r in conn.execute(
+                        text("SELECT id FROM chat_sessions ORDER BY random() LIMIT :n"),
+                        {"n": args.repeat},
+                    )
+                ],
+            }
+
+            before = measure(conn, params)
+            for index, (table, columns) in HOT_PATH_INDEXES.items():
+                conn.execute(text(f"CREATE INDEX {index} ON {table} ({columns})"))
+                conn.execute(text(f"ANALYZE {table}"))
+            conn.commit()
+            after = measure(conn, params)
+
+        print(f"\n{'query':<28}{'before ms':>11}{'after ms':>11}{'speedup':>9}  plan after")
+        for name in HOT_QUERIES:
+            (b_ms, b_plan), (a_ms, a_plan) = before[name], after[name]
+            print(f"{name:<28}{b_ms:>11.3f}{a_ms:>11.3f}{b_ms / max(a_ms, 1e-3):>8.1f}x  {a_plan}")
+            print(f"{'':<28}{'':>31}  (before: {b_plan})")
+    finally:
+        if not args.keep:
+            with engine.connect() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+                conn.commit()
+
+
+if __name__ == "__main__":
+    main()
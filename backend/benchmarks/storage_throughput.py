@@ -0,0 +1,101 @@
+"""
+Benchmark: object storage upload / download throughput.
+
+Uploads and downloads N objects through the storage adapter
+(``app.core.storage``) sequentially with the sync API and concurrently with the
+async API. The default local backend writes to a temporary directory, so the
+numbers measure adapter overhead and concurrency without a network.
+``--backend supabase`` runs the same workload against the configured bucket
+under ``benchmarks/storage-throughput/`` and removes the objects afterwards.
+
+Usage (from backend/):
+    python -m benchmarks.storage_throughput                    # local, 64 x 256 KB
+    python -m benchmarks.storage_throughput --count 200 --size-kb 1024
+    python -m benchmarks.storage_throughput --backend supabase --concurrency 16
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from typing import List
+
+from app.core.storage import LocalStorage, StorageBackend, create_storage
+
+
+def _report(label: str, count: int, size: int, seconds: float) -> None:
+    mb = count * size / (1024 * 1024)
+    print(
+        f"{label:<22}{seconds * 1000:>10.0f} ms{count / seconds:>10.1f} obj/s"
+        f"{mb / seconds:>10.1f} MB/s"
+    )
+
+
+def run_sync(backend: StorageBackend, paths: List[str], payload: bytes) -> None:
+    start = time.perf_counter()
+    for path in paths:
+        backend.upload(path, payload, "image/png", upsert=True)
+    _report("sync upload", len(paths), len(payload), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for path in paths:
+        backend.download(path)
+    _report("sync download", len(paths), len(payload), time.perf_counter() - start)
+
+
+async def run_async(
+    backend: StorageBackend, paths: List[str], payload: bytes, concurrency: int
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(bounded(backend.aupload(p, payload, "image/png", upsert=True)) for p in paths)
+    )
+    _report(f"async upload x{concurrency}", len(paths), len(payload), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded(backend.adownload(p)) for p in paths))
+    _report(
+        f"async download x{concurrency}", len(paths), len(payload), time.perf_counter() - start
+    )
+    await backend.aclose()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", choices=["local", "supabase"], default="local")
+    parser.add_argument("--count", type=int, default=64, help="objects per run")
+    parser.add_argument("--size-kb", type=int, default=256, help="object size in KB")
+    parser.add_argument("--concurrency", type=int, default=8, help="async in-flight requests")
+    args = parser.parse_args(argv)
+
+    payload = os.urandom(args.size_kb * 1024)
+    prefix = f"benchmarks/storage-throughput/{uuid.uuid4().hex[:8]}"
+    paths = [f"{prefix}/{i}.png" for i in range(args.count)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.backend == "local":
+            backend: StorageBackend = LocalStorage(tmp, "wardrobe-images")
+        else:
+            backend = create_storage()
+            if not backend.available:
+                raise SystemExit("Supabase storage is not configured (SUPABASE_URL / key)")
+
+        print(f"{args.backend}: {args.count} objects x {args.size_kb} KB")
+        try:
+            run_sync(backend, paths, payload)
+            asyncio.run(run_async(backend, paths, payload, args.concurrency))
+        finally:
+            backend.remove(paths)
+            backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: image normalization before Gemini Vision calls.
+
+Reports upload size and preprocessing time for raw vs. prepared images.
+With ``--gemini`` it also sends both variants to the vision model (response
+cache disabled) and compares latency and the extracted category/color.
+
+Usage (from backend/):
+    python -m benchmarks.vision_preprocess                 # synthetic 12MP photos
+    python -m benchmarks.vision_preprocess photo1.jpg ...  # your own images
+    python -m benchmarks.vision_preprocess --gemini photo1.jpg
+"""
+
+import argparse
+import io
+import statistics
+import time
+from typing import List, Tuple
+
+import numpy as np
+from PIL import Image
+
+from app.utils.image_preprocess import prepare_image_for_vision
+
+
+def synthetic_photo(seed: int, size: Tuple[int, int] = (4032, 3024)) -> bytes:
+    """Camera-like JPEG: smooth shapes plus sensor noise, rotated via EXIF."""
+    rng = np.random.default_rng(seed)
+    w, h = size
+    y, x = np.mgrid[0:h, 0:w].astype(np.float32)
+    base = np.stack(
+        [
+            128 + 90 * np.sin(x / (150 + 40 * c) + seed) * np.cos(y / (210 + 30 * c))
+            for c in range(3)
+        ],
+        axis=-1,
+    )
+    noisy = np.clip(base + rng.normal(0, 6, base.shape), 0, 255).astype(np.uint8)
+    exif = Image.Exif()
+    exif[0x0112] = 6  # 90도 회전 촬영
+    buf = io.BytesIO()
+    Image.fromarray(noisy).save(buf, format="JPEG", quality=95, exif=exif)
+    return buf.getvalue()
+
+
+def _timed(func, *args, repeat: int = 1):
+    durations, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        durations.append(time.perf_counter() - start)
+    return result, statistics.median(durations)
+
+
+def _vision_call(image_bytes: bytes) -> str:
+    from app.ai.clients.gemini_client import gemini_client
+    from app.ai.prompts.extraction_prompts import USER_PROMPT
+
+    return gemini_client.generate_with_vision(
+        USER_PROMPT, image_bytes, temperature=0.3, max_output_tokens=2000, cache=False
+    )
+
+
+def _summary(raw_response: str) -> str:
+    from app.utils.json_parser import parse_dict_from_text
+
+    parsed, _ = parse_dict_from_text(raw_response or "")
+    if not isinstance(parsed, dict):
+        return "unparsed"
+    category = (parsed.get("category") or {}).get("main")
+    color = (parsed.get("color") or {}).get("primary")
+    return f"{category}/{color}"
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("images", nargs="*", help="image files (default: synthetic photos)")
+    parser.add_argument("--count", type=int, default=3, help="synthetic photo count")
+    parser.add_argument("--gemini", action="store_true", help="also time real Gemini calls")
+    args = parser.parse_args(argv)
+
+    if args.images:
+        samples = [(path, open(path, "rb").read()) for path in args.images]
+    else:
+        samples = [(f"synthetic-{i}", synthetic_photo(i)) for i in range(args.count)]
+
+    print(f"{'image':<24}{'raw KB':>10}{'prepared KB':>13}{'saved':>8}{'prep ms':>10}")
+    total_raw = total_prepared = 0
+    for name, data in samples:
+        prepared, seconds = _timed(prepare_image_for_vision, data, repeat=3)
+        total_raw += len(data)
+        total_prepared += len(prepared.data)
+        saved = 1 - len(prepared.data) / len(data)
+        print(
+            f"{name[:23]:<24}{len(data) / 1024:>10.0f}{len(prepared.data) / 1024:>13.0f}"
+            f"{saved:>8.0%}{seconds * 1000:>10.1f}"
+        )
+        if args.gemini:
+            raw_response, raw_s = _timed(_vision_call, data)
+            prep_response, prep_s = _timed(_vision_call, prepared.data)
+            print(
+                f"    gemini raw {raw_s:.2f}s ({_summary(raw_response)})"
+                f"  prepared {prep_s:.2f}s ({_summary(prep_response)})"
+            )
+
+    print(
+        f"total: {total_raw / 1024:.0f} KB -> {total_prepared / 1024:.0f} KB "
+        f"({1 - total_prepared / max(1, total_raw):.0%} less upload)"
+    )
+
+
+if __name__ == "__main__":
+    main()
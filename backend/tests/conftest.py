@@ -17,7 +17,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, ThreadedSession, get_async_db, get_db
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -128,7 +128,11 @@ def client(test_db):
         finally:
             pass
 
+    async def override_get_async_db():
+        yield ThreadedSession(test_db)
+
     test_app.dependency_overrides[get_db] = override_get_db
+    test_app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(test_app) as test_client:
         yield test_client
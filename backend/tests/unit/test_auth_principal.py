@@ -0,0 +1,63 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from app.core import auth
+from app.core.principal import AuthPrincipal, PrincipalCache
+from app.core.security import ALGORITHM, SECRET_KEY
+
+
+def _user(user_id):
+    return SimpleNamespace(
+        id=user_id,
+        user_name="kim@example.com",
+        gender="FEMALE",
+        body_shape="HOURGLASS",
+        height=165.5,
+        weight=None,
+        age=29,
+        face_image_path="u/face.png",
+    )
+
+
+def _credentials(user_id) -> HTTPAuthorizationCredentials:
+    token = jwt.encode(
+        {"sub": "kim@example.com", "user_id": str(user_id)}, SECRET_KEY, algorithm=ALGORITHM
+    )
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.mark.unit
+def test_principal_is_loaded_once_then_served_from_cache():
+    user_id = uuid.uuid4()
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = _user(user_id)
+
+    with patch.object(auth, "principal_cache", PrincipalCache(ttl_seconds=60)):
+        first = auth.get_current_principal(_credentials(user_id), db)
+        second = auth.get_current_principal(_credentials(user_id), db)
+        assert auth.principal_cache.lookup(user_name="kim@example.com") == first
+
+    assert first == second
+    assert first.id == user_id and first.height == 165.5 and first.weight is None
+    assert db.query.call_count == 1
+
+
+@pytest.mark.unit
+def test_invalidate_and_ttl_expiry_force_a_reload():
+    user_id = uuid.uuid4()
+    cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+    cache.put(AuthPrincipal.from_user(_user(user_id)))
+
+    cache.invalidate(user_id)
+    assert cache.lookup(user_id=user_id) is None
+    assert cache.lookup(user_name="kim@example.com") is None
+
+    cache.put(AuthPrincipal.from_user(_user(user_id)))
+    with patch("app.core.principal.time.monotonic", return_value=10**9):
+        assert cache.lookup(user_id=user_id) is None
+    assert cache.stats()["size"] == 1  # 이름 키는 조회 시점에 정리
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domains.chat import service as chat_service
+from app.domains.chat.service import ChatHistoryCompactor
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_compaction_folds_everything_but_the_tail():
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    messages = [
+        SimpleNamespace(
+            sender="USER" if i % 2 == 0 else "AGENT",
+            content=f"message {i}",
+            created_at=start + timedelta(minutes=i),
+        )
+        for i in range(7)
+    ]
+    compactor = ChatHistoryCompactor(tail_messages=2, trigger_messages=4)
+    save = MagicMock(return_value=True)
+    generate = AsyncMock(return_value="Likes navy; wedding on Saturday.")
+
+    with patch.object(compactor, "_load", return_value=(None, None, messages)), patch.object(
+        compactor, "_save", new=save
+    ), patch.object(chat_service.gemini_client, "generate_content_async", new=generate):
+        summary = await compactor.compact(uuid4())
+
+    assert summary == "Likes navy; wedding on Saturday."
+    prompt = generate.await_args.args[0]
+    assert "message 4" in prompt and "message 5" not in prompt
+    # 요약 시점은 접힌 마지막 메시지(4번)의 시각
+    assert save.call_args.args[1:] == (None, summary, messages[4].created_at)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_short_history_is_not_compacted():
+    compactor = ChatHistoryCompactor(tail_messages=2, trigger_messages=4)
+    generate = AsyncMock()
+    with patch.object(compactor, "_load", return_value=(None, None, [object()] * 4)), patch.object(
+        chat_service.gemini_client, "generate_content_async", new=generate
+    ):
+        assert await compactor.compact(uuid4()) is None
+    generate.assert_not_awaited()
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_prompt_keeps_every_message_between_tail_and_trigger():
+    import app.main  # noqa: F401  모든 모델 매퍼 등록
+    from app.ai.nodes.chat_nodes import build_chat_response_prompt
+    from app.database import ThreadedSession
+    from app.domains.chat import router as chat_router_module
+    from app.domains.chat.model import ChatMessage, ChatSession
+    from app.domains.chat.schema import ChatRequest
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    ChatSession.metadata.create_all(
+        engine, tables=[ChatSession.__table__, ChatMessage.__table__]
+    )
+    db = ThreadedSession(sessionmaker(bind=engine, expire_on_commit=False)())
+    principal = SimpleNamespace(id=uuid4())
+    compactor = ChatHistoryCompactor(tail_messages=2, trigger_messages=6)
+
+    with patch.object(chat_router_module, "chat_history_compactor", compactor), patch.object(
+        chat_router_module.user_manager, "touch_last_active"
+    ):
+        session_id, flags = None, []
+        for i in range(7):
+            session, state, needs_compaction = await chat_router_module._prepare_chat(
+                ChatRequest(query=f"turn {i}", session_id=session_id), principal, db
+            )
+            session_id = session.id
+            flags.append(needs_compaction)
+            if i == 5:
+                # 6개: tail(2)보다 많고 trigger(6) 이하 -> 아무것도 빠지면 안 됨
+                prompt_turns = {m["content"] for m in state["messages"]}
+                prompt = build_chat_response_prompt(state)
+    await db.close()
+    engine.dispose()
+
+    assert prompt_turns == {f"turn {i}" for i in range(6)}
+    # 실제 LLM 프롬프트에도 가장 오래된 미요약 메시지가 들어감
+    assert all(f"User: turn {i}" in prompt for i in range(5))
+    assert flags == [False] * 6 + [True]
+
+
+@pytest.mark.unit
+def test_chat_prompt_includes_every_unsummarized_turn():
+    from app.ai.nodes.chat_nodes import build_chat_response_prompt
+
+    messages = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"turn {i}"}
+        for i in range(15)
+    ]
+    state = {
+        "messages": messages,
+        "user_query": "turn 15",
+        "context": {"session_summary": "Likes navy."},
+    }
+
+    prompt = build_chat_response_prompt(state)
+
+    assert "Likes navy." in prompt
+    assert "User: turn 0\n" in prompt
+    assert all(f"turn {i}" in prompt for i in range(15))
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def session_factory():
+    import app.main  # noqa: F401  모든 모델 매퍼 등록
+    from app.domains.chat.model import ChatMessage, ChatSession
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    ChatSession.metadata.create_all(
+        engine, tables=[ChatSession.__table__, ChatMessage.__table__]
+    )
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+def _seed(db, user_id):
+    """Sessions whose activity order differs from their creation order."""
+    from app.domains.chat.model import ChatMessage, ChatSession
+
+    start = datetime(2026, 1, 1)
+    # (session 생성 시각 분, 메시지 시각 분 목록)
+    plan = [(0, [50]), (10, []), (20, [30, 40]), (30, []), (40, [45]), (45, [])]
+    sessions = []
+    for created, messages in plan:
+        session = ChatSession(
+            id=uuid4(), user_id=user_id, created_at=start + timedelta(minutes=created)
+        )
+        db.add(session)
+        for i, minute in enumerate(messages):
+            db.add(
+                ChatMessage(
+                    session_id=session.id,
+                    sender="USER",
+                    content=f"{created}-{i}",
+                    created_at=start + timedelta(minutes=minute),
+                )
+            )
+        sessions.append(session)
+    # 다른 사용자의 세션은 목록에 나오면 안 됨
+    db.add(
+        ChatSession(id=uuid4(), user_id=uuid4(), created_at=start + timedelta(minutes=99))
+    )
+    db.commit()
+    return sessions
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sessions_page_by_last_activity_with_cursor(session_factory):
+    from app.database import ThreadedSession
+    from app.domains.chat.router import list_chat_sessions
+
+    principal = SimpleNamespace(id=uuid4())
+    with session_factory() as seed_db:
+        sessions = _seed(seed_db, principal.id)
+    # 마지막 활동: 0->50, 40->45, 45->45(동률, id 내림차순), 20->40, 30->30, 10->10
+    tied = sorted([sessions[4].id, sessions[5].id], reverse=True)
+    expected = [sessions[0].id, *tied, sessions[2].id, sessions[3].id, sessions[1].id]
+
+    db = ThreadedSession(session_factory())
+    pages, cursor = [], None
+    while True:
+        page = await list_chat_sessions(limit=2, cursor=cursor, current_user=principal, db=db)
+        pages.append(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    await db.close()
+
+    assert [len(items) for items in pages] == [2, 2, 2]
+    listed = [UUID(item["session_id"]) for items in pages for item in items]
+    assert listed == expected
+
+    first = pages[0][0]
+    assert first["message_count"] == 1
+    assert first["title"] == "0-0"
+    assert first["updated_at"].startswith("2026-01-01T00:50")
+    third = pages[1][1]
+    assert (third["title"], third["message_count"]) == ("20-1", 2)
+    assert pages[2][1]["title"] == "New chat"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", "MjAyNnx4eXo="])
+async def test_malformed_session_cursor_is_rejected(cursor):
+    from app.domains.chat.router import list_chat_sessions
+
+    db = MagicMock()
+    with pytest.raises(HTTPException) as exc:
+        await list_chat_sessions(
+            limit=2, cursor=cursor, current_user=SimpleNamespace(id=uuid4()), db=db
+        )
+    db.execute.assert_not_called()
+    assert exc.value.status_code == 400
@@ -0,0 +1,33 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.ai.workflows import chat_workflow
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_chat_emits_intent_before_streamed_tokens():
+    async def fake_stream(prompt, **kwargs):
+        for text in ("Hel", "lo"):
+            yield text
+
+    state = {
+        "messages": [],
+        "user_query": "hi",
+        "context": {"user_id": "user-1", "is_pick_updated": False},
+        "response": None,
+        "recommendations": None,
+        "todays_pick": None,
+    }
+    with patch.object(
+        chat_workflow.gemini_client,
+        "generate_content_async",
+        new=AsyncMock(return_value='{"intent": "GENERAL"}'),
+    ), patch.object(chat_workflow.gemini_client, "stream_content_async", new=fake_stream):
+        events = [event async for event in chat_workflow.stream_chat(state)]
+
+    assert [name for name, _ in events] == ["status", "intent", "status", "token", "token"]
+    assert events[1][1]["intent"] == "GENERAL"
+    assert [data["text"] for name, data in events if name == "token"] == ["Hel", "lo"]
+    assert state["response"] == "Hello"
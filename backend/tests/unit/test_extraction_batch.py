@@ -0,0 +1,103 @@
+import copy
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.ai.clients.response_cache import ResponseCache
+from app.ai.prompts.extraction_prompts import DEFAULT_OBJ
+from app.ai.workflows import extraction_workflow
+
+
+def _valid_object(sub: str) -> dict:
+    obj = copy.deepcopy(DEFAULT_OBJ)
+    obj.pop("details")
+    obj["category"].update({"main": "top", "sub": sub, "confidence": 0.9})
+    return obj
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_batch_extraction_maps_indices_and_retries_only_failures():
+    broken = _valid_object("shirt")
+    broken["category"]["confidence"] = "high"
+    first = [
+        {"index": 2, **_valid_object("hoodie")},
+        {"index": 0, **_valid_object("tshirt")},
+        {"index": 1, **broken},
+    ]
+    retry = [{"index": 0, **_valid_object("shirt")}]
+    generate = AsyncMock(side_effect=[json.dumps(first), json.dumps(retry)])
+
+    with patch.object(
+        extraction_workflow.gemini_client, "generate_content_async", new=generate
+    ), patch.object(extraction_workflow, "prepare_images", side_effect=lambda imgs: imgs):
+        results = await extraction_workflow.extract_attributes_batch_async(
+            [b"a", b"b", b"c"], batch_size=4
+        )
+
+    assert [r["category"]["sub"] for r in results] == ["tshirt", "shirt", "hoodie"]
+    assert generate.await_count == 2
+    assert generate.await_args_list[0].kwargs["images"] == [b"a", b"b", b"c"]
+    assert generate.await_args_list[1].kwargs["images"] == [b"b"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "responses",
+    [
+        [json.dumps(_valid_object("tshirt"))],
+        [json.dumps({"category": "broken"}), json.dumps(_valid_object("shirt"))],
+        [""],
+    ],
+    ids=["first-attempt", "schema-retry", "empty-response"],
+)
+def test_sync_and_async_single_extraction_follow_the_same_rules(responses):
+    import asyncio
+    from unittest.mock import MagicMock
+
+    sync_generate = MagicMock(side_effect=list(responses))
+    async_generate = AsyncMock(side_effect=list(responses))
+
+    with patch.object(
+        extraction_workflow.gemini_client, "generate_content", new=sync_generate
+    ), patch.object(
+        extraction_workflow.gemini_client, "generate_content_async", new=async_generate
+    ), patch.object(extraction_workflow, "prepare_images", side_effect=lambda imgs: imgs):
+        sync_result = extraction_workflow.extract_attributes([b"a"])
+        async_result = asyncio.run(extraction_workflow.extract_attributes_async([b"a"]))
+
+    assert sync_result == async_result
+    assert [c.kwargs for c in sync_generate.call_args_list] == [
+        c.kwargs for c in async_generate.await_args_list
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_schema_invalid_responses_are_not_cached():
+    broken = _valid_object("shirt")
+    broken["category"]["confidence"] = "high"
+    answers = [json.dumps(broken), json.dumps(broken), json.dumps(_valid_object("tshirt"))]
+    calls = 0
+
+    async def fake_generate_content(**kwargs):
+        nonlocal calls
+        calls += 1
+        return SimpleNamespace(text=answers.pop(0), candidates=[])
+
+    client = extraction_workflow.gemini_client
+    with patch(
+        "app.ai.clients.gemini_client.response_cache",
+        ResponseCache(max_entries=8, ttl_seconds=60),
+    ), patch.object(
+        client.client.aio.models, "generate_content", new=fake_generate_content
+    ), patch.object(extraction_workflow, "prepare_images", side_effect=lambda imgs: imgs):
+        await extraction_workflow.extract_attributes_async([b"photo"])
+        # 오답은 캐시되지 않았으므로 같은 사진을 다시 올리면 새로 호출
+        second = await extraction_workflow.extract_attributes_async([b"photo"])
+        third = await extraction_workflow.extract_attributes_async([b"photo"])
+
+    assert calls == 3
+    assert second["category"]["sub"] == third["category"]["sub"] == "tshirt"
@@ -0,0 +1,48 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.domains.extraction.dedup import hamming_distance, image_dhash, image_sha256
+
+
+def _encode(img: Image.Image, fmt: str, **kwargs) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format=fmt, **kwargs)
+    return buf.getvalue()
+
+
+def _gradient_image(size=(256, 256)) -> Image.Image:
+    x = np.linspace(0, 255, size[0], dtype=np.float64)
+    y = np.linspace(0, 255, size[1], dtype=np.float64)
+    pixels = (np.sin(x[None, :] / 20) * 60 + y[:, None] * 0.5 + 60).clip(0, 255)
+    return Image.fromarray(pixels.astype(np.uint8)).convert("RGB")
+
+
+@pytest.mark.unit
+def test_reencoded_photo_is_near_duplicate():
+    img = _gradient_image()
+    png = _encode(img, "PNG")
+    jpeg = _encode(img.resize((200, 200)), "JPEG", quality=70)
+
+    assert image_sha256(png) != image_sha256(jpeg)
+    assert hamming_distance(image_dhash(png), image_dhash(jpeg)) <= 4
+
+
+@pytest.mark.unit
+def test_different_photo_is_not_near_duplicate():
+    img = _gradient_image()
+    flipped = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+
+    distance = hamming_distance(
+        image_dhash(_encode(img, "PNG")), image_dhash(_encode(flipped, "PNG"))
+    )
+    assert distance > 4
+
+
+@pytest.mark.unit
+def test_dhash_fits_signed_bigint_and_handles_garbage():
+    value = image_dhash(_encode(_gradient_image(), "PNG"))
+    assert -(1 << 63) <= value < (1 << 63)
+    assert image_dhash(b"not an image") is None
@@ -0,0 +1,137 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.database import ThreadedSession
+from app.domains.extraction import router as extraction_router_module
+
+
+class _Upload:
+    def __init__(self, filename: str, data: bytes):
+        self.filename = filename
+        self.content_type = "image/png"
+        self._data = data
+
+    async def read(self) -> bytes:
+        return self._data
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_overlaps_images_and_isolates_failures():
+    active = 0
+    peak = 0
+
+    batches = []
+
+    async def fake_extract_batch(images):
+        batches.append(list(images))
+        return [{"category": {"main": "top", "sub": "tshirt"}} for _ in images]
+
+    async def fake_remove_background(contents):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if contents == b"bad":
+            raise ValueError("unreadable garment")
+        return contents
+
+    manager = MagicMock()
+    manager.upload_image_async = AsyncMock(
+        side_effect=lambda data, name, user_id: f"u/{name}"
+    )
+    manager.insert_item.side_effect = lambda db, user_id, path, attrs, **kw: {
+        "item_id": path,
+        "image_url": path,
+        "blob_name": path,
+    }
+    manager.aget_signed_url = AsyncMock(side_effect=lambda path: path)
+    uploads = [_Upload(f"{i}.png", b"bad" if i == 1 else bytes([i])) for i in range(4)]
+
+    with patch.object(extraction_router_module.extractor, "extract_batch_async", new=fake_extract_batch), patch.object(
+        extraction_router_module.image_processing_service,
+        "remove_background_bytes",
+        new=fake_remove_background,
+    ), patch.object(
+        extraction_router_module.extraction_dedup_index, "lookup", return_value=None
+    ), patch.object(
+        extraction_router_module, "validate_uploaded_file"
+    ), patch(
+        "app.domains.wardrobe.service.wardrobe_manager", manager
+    ):
+        response = await extraction_router_module.extract(
+            images=uploads,
+            current_user=SimpleNamespace(id="user-1"),
+            db=ThreadedSession(MagicMock()),
+        )
+
+    assert peak > 1
+    # 배치 안의 순서는 검사가 끝난 순서 (결과는 각 자리로 돌아감)
+    assert [sorted(batch) for batch in batches] == [
+        sorted([bytes([0]), b"bad", bytes([2]), bytes([3])])
+    ]
+    assert [item.item_id for item in response.items] == ["u/0.png", "u/2.png", "u/3.png"]
+    assert response.total_processed == 3
+    assert [(f.index, f.filename) for f in response.failed] == [(1, "1.png")]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_saves_each_batch_without_waiting_for_the_others():
+    events = []
+    batches = []
+    slow_batch_done = asyncio.Event()
+
+    async def fake_extract_batch(images):
+        batches.append(list(images))
+        if len(batches) == 2:
+            await asyncio.sleep(0.2)
+            events.append("slow batch extracted")
+            slow_batch_done.set()
+        return [{"category": {"main": "top", "sub": "tshirt"}} for _ in images]
+
+    async def fake_remove_background(contents):
+        return contents
+
+    def fake_insert(db, user_id, path, attrs, **kw):
+        events.append(f"insert {path}")
+        return {"item_id": path, "image_url": path, "blob_name": path}
+
+    manager = MagicMock()
+    manager.upload_image_async = AsyncMock(
+        side_effect=lambda data, name, user_id: f"u/{name}"
+    )
+    manager.insert_item.side_effect = fake_insert
+    manager.aget_signed_url = AsyncMock(side_effect=lambda path: path)
+    uploads = [_Upload(f"{i}.png", bytes([i])) for i in range(4)]
+
+    with patch.object(extraction_router_module.extractor, "extract_batch_async", new=fake_extract_batch), patch.object(
+        extraction_router_module.image_processing_service,
+        "remove_background_bytes",
+        new=fake_remove_background,
+    ), patch.object(
+        extraction_router_module.extraction_dedup_index, "lookup", return_value=None
+    ), patch.object(
+        extraction_router_module, "validate_uploaded_file"
+    ), patch.object(
+        extraction_router_module.Config, "EXTRACT_BATCH_SIZE", 2
+    ), patch(
+        "app.domains.wardrobe.service.wardrobe_manager", manager
+    ):
+        response = await extraction_router_module.extract(
+            images=uploads,
+            current_user=SimpleNamespace(id="user-1"),
+            db=ThreadedSession(MagicMock()),
+        )
+
+    assert slow_batch_done.is_set()
+    # 첫 배치의 저장은 느린 두 번째 배치를 기다리지 않음
+    first, second = [{f"insert u/{image[0]}.png" for image in batch} for batch in batches]
+    slow = events.index("slow batch extracted")
+    assert first <= set(events[:slow])
+    assert second <= set(events[slow:])
+    assert response.total_processed == 4
@@ -0,0 +1,90 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.ai.clients.gemini_client import gemini_client
+from app.ai.clients.response_cache import ResponseCache
+from app.core.config import Config
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_content_async_limits_concurrency():
+    active = 0
+    peak = 0
+
+    async def fake_generate_content(**kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return SimpleNamespace(text="ok", candidates=[])
+
+    with patch.object(Config, "GEMINI_MAX_CONCURRENCY", 2), patch.object(
+        gemini_client.client.aio.models, "generate_content", new=fake_generate_content
+    ):
+        results = await asyncio.gather(
+            *(gemini_client.generate_content_async("hi") for _ in range(6))
+        )
+
+    assert results == ["ok"] * 6
+    assert peak == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_content_async_times_out():
+    async def slow_generate_content(**kwargs):
+        await asyncio.sleep(1)
+
+    with patch.object(
+        gemini_client.client.aio.models, "generate_content", new=slow_generate_content
+    ):
+        with pytest.raises(asyncio.TimeoutError):
+            await gemini_client.generate_content_async("hi", timeout=0.01, cache=False)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_content_async_reuses_cached_response():
+    calls = 0
+
+    async def fake_generate_content(**kwargs):
+        nonlocal calls
+        calls += 1
+        return SimpleNamespace(text=f"answer {calls}", candidates=[])
+
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    with patch("app.ai.clients.gemini_client.response_cache", cache), patch.object(
+        gemini_client.client.aio.models, "generate_content", new=fake_generate_content
+    ):
+        first = await gemini_client.generate_content_async("pick", temperature=0.7)
+        second = await gemini_client.generate_content_async("pick", temperature=0.7)
+        other_config = await gemini_client.generate_content_async("pick", temperature=0.2)
+        bypassed = await gemini_client.generate_content_async(
+            "pick", temperature=0.7, cache=False
+        )
+
+    assert first == second == "answer 1"
+    assert other_config == "answer 2"
+    assert bypassed == "answer 3"
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.unit
+def test_response_cache_expires_and_evicts():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")  # b는 가장 오래 사용되지 않아 제거
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.evictions == 1
+
+    with patch("app.ai.clients.response_cache.time.monotonic", return_value=1e12):
+        assert cache.get("a") is None
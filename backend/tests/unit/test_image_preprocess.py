@@ -0,0 +1,51 @@
+import io
+
+import pytest
+from PIL import Image
+
+from app.utils.image_preprocess import detect_mime_type, prepare_image_for_vision
+
+
+def _encode(img: Image.Image, fmt: str, **kwargs) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format=fmt, **kwargs)
+    return buf.getvalue()
+
+
+@pytest.mark.unit
+def test_detect_mime_type_from_signature():
+    img = Image.new("RGB", (8, 8), "red")
+    assert detect_mime_type(_encode(img, "PNG")) == "image/png"
+    assert detect_mime_type(_encode(img, "JPEG")) == "image/jpeg"
+    assert detect_mime_type(_encode(img, "WEBP")) == "image/webp"
+    assert detect_mime_type(b"unknown") == "image/jpeg"
+
+
+@pytest.mark.unit
+def test_large_rotated_photo_is_uprighted_and_downscaled():
+    exif = Image.Exif()
+    exif[0x0112] = 6  # 시계 방향 90도 회전 필요
+    raw = _encode(Image.new("RGB", (4000, 3000), "navy"), "JPEG", quality=95, exif=exif)
+
+    prepared = prepare_image_for_vision(raw, max_edge=1024, quality=85)
+
+    assert prepared.mime_type == "image/jpeg"
+    assert prepared.resized
+    assert (prepared.width, prepared.height) == (768, 1024)
+    assert len(prepared.data) < len(raw)
+    with Image.open(io.BytesIO(prepared.data)) as out:
+        assert out.size == (768, 1024)
+
+
+@pytest.mark.unit
+def test_small_png_is_kept_and_transparency_flattened_when_resized():
+    small = _encode(Image.new("RGB", (64, 64), "white"), "PNG")
+    kept = prepare_image_for_vision(small, max_edge=1024)
+    assert kept.data == small
+    assert kept.mime_type == "image/png"
+
+    transparent = _encode(Image.new("RGBA", (2048, 1024), (0, 0, 0, 0)), "PNG")
+    prepared = prepare_image_for_vision(transparent, max_edge=512)
+    with Image.open(io.BytesIO(prepared.data)) as out:
+        assert out.mode == "RGB"
+        assert out.getpixel((10, 10)) == (255, 255, 255)
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock
 from app.domains.image_processing.service import ImageProcessingService
@@ -36,3 +37,78 @@ async def test_remove_background_local_failure():
 
         # Should return original URL on failure
         assert result == "http://example.com/bad.jpg"
+
+
+def test_rembg_session_pool_reuses_sessions():
+    from app.domains.image_processing.session_pool import RembgSessionPool
+
+    pool = RembgSessionPool(model_name="u2netp", pool_size=2)
+    with patch.object(pool, "_create_session", side_effect=lambda: object()) as create:
+        with pool.session() as first:
+            with pool.session() as second:
+                assert first is not second
+        for _ in range(5):
+            with pool.session() as session:
+                assert session in (first, second)
+
+    assert create.call_count == 2
+    assert pool.loaded == 2
+
+
+@pytest.mark.asyncio
+async def test_image_worker_pool_matches_in_process_effect():
+    import io
+
+    from PIL import Image
+
+    from app.domains.image_processing import effects
+    from app.domains.image_processing.worker_pool import ImageWorkerPool
+
+    buf = io.BytesIO()
+    Image.new("RGB", (32, 24), (120, 60, 30)).save(buf, format="PNG")
+    image_bytes = buf.getvalue()
+
+    pool = ImageWorkerPool(processes=2, preload=False, warmup=False)
+    pool.start()
+    try:
+        results = await asyncio.gather(
+            *(pool.run("enhance", image_bytes) for _ in range(3))
+        )
+    finally:
+        pool.shutdown()
+
+    assert results == [effects.enhance(image_bytes)] * 3
+
+
+def test_effects_decode_memoryview_in_place():
+    import io
+
+    from PIL import Image
+
+    from app.domains.image_processing import effects
+
+    buf = io.BytesIO()
+    Image.new("RGB", (32, 24), (120, 60, 30)).save(buf, format="PNG")
+    image_bytes = buf.getvalue()
+
+    view = memoryview(bytearray(image_bytes))
+    assert effects.apply("enhance", view) == effects.enhance(image_bytes)
+    view.release()  # 디코딩 후 버퍼를 붙잡고 있지 않음
+
+
+def test_output_block_is_unlinked_when_request_was_cancelled():
+    from concurrent.futures import Future
+    from multiprocessing.shared_memory import SharedMemory
+
+    from app.domains.image_processing.worker_pool import _collect_output, _write_block
+
+    block = _write_block(b"processed")
+    block.close()
+    job, output = Future(), Future()
+    output.cancel()
+    job.set_result((block.name, len(b"processed")))
+
+    _collect_output(job, output)
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=block.name)
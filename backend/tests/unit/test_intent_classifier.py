@@ -0,0 +1,74 @@
+import pytest
+
+from app.ai.classifiers.intent_classifier import (
+    GENERAL,
+    RECOMMEND,
+    LocalIntentClassifier,
+    NgramIntentModel,
+    classify_by_rules,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "text, intent",
+    [
+        ("내일 출근할 때 뭐 입을까?", RECOMMEND),
+        ("데이트룩 추천해줘", RECOMMEND),
+        ("What should I wear to a wedding?", RECOMMEND),
+        ("안녕! 고마워", GENERAL),
+        ("How do I wash a wool sweater?", GENERAL),
+    ],
+)
+def test_rules_decide_clear_messages_without_llm(text, intent):
+    prediction = classify_by_rules(text)
+    assert prediction.intent == intent
+    assert prediction.confidence >= 0.85
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "text, tpo, confidence",
+    [
+        ("what should i wear for candidate day", None, 0.9),
+        ("what should i wear after the update?", None, 0.9),
+        ("what should i wear to do homework", None, 0.9),
+        ("what should i wear on a date?", "date", 0.95),
+        ("what should i wear to work tomorrow", "work", 0.95),
+        ("결혼식에 뭐 입을까?", "결혼식 하객", 0.95),
+    ],
+)
+def test_rules_extract_tpo_on_whole_words(text, tpo, confidence):
+    prediction = classify_by_rules(text)
+    assert prediction.intent == RECOMMEND
+    assert prediction.tpo == tpo
+    assert prediction.confidence == confidence
+
+
+@pytest.mark.unit
+def test_ambiguous_message_falls_back_below_threshold():
+    classifier = LocalIntentClassifier(threshold=0.85)
+    prediction = classifier.classify("음 그럼 좀 더 따뜻하게?")
+    assert not classifier.is_confident(prediction)
+
+    classifier.record_agreement(prediction, RECOMMEND)
+    stats = classifier.stats()
+    assert stats["llm_calls"] == 1
+    assert stats["agreement_by_confidence"]["0.5"] == {"compared": 1, "agreement": 0.0}
+
+
+@pytest.mark.unit
+def test_ngram_model_round_trip(tmp_path):
+    samples = [
+        ("따뜻한 옷 골라봐", RECOMMEND),
+        ("비 오는 날 입을 옷", RECOMMEND),
+        ("오늘 기분 어때", GENERAL),
+        ("너 이름이 뭐야", GENERAL),
+    ] * 10
+    model = NgramIntentModel.fit(samples, epochs=30)
+    path = tmp_path / "intent.json"
+    model.save(str(path))
+
+    loaded = NgramIntentModel.load(str(path))
+    assert loaded.predict("비 오는 날 입을 옷").intent == RECOMMEND
+    assert loaded.predict("너 이름이 뭐야").intent == GENERAL
@@ -0,0 +1,268 @@
+import random
+
+import numpy as np
+import pytest
+
+from app.domains.recommendation.outfit_search import (
+    ThreePieceSearch,
+    outfit_temperature,
+    select_top_outfits,
+)
+from app.domains.recommendation.score_cache import OutfitScoreCache
+from app.domains.recommendation.scoring import (
+    build_feature_matrices,
+    pair_reasons,
+    score_feature_matrices,
+)
+from app.domains.recommendation.selection import (
+    TopKSelector,
+    rank_score_matrix,
+    select_top_candidates,
+)
+from app.domains.wardrobe.features import encode_feature_vector
+from app.domains.recommendation.service import recommender
+
+SEASONS = ["spring", "summer", "fall", "winter", "all-season"]
+
+
+def _random_item(rng: random.Random, idx: int) -> dict:
+    """Random item covering missing scores, None formality and non-list seasons."""
+    roll = rng.random()
+    if roll < 0.1:
+        attributes = {}
+    elif roll < 0.2:
+        attributes = {"scores": None}
+    else:
+        scores = {"formality": rng.choice([None, round(rng.random(), 2), 0.5, 1])}
+        season_roll = rng.random()
+        if season_roll < 0.15:
+            scores["season"] = "summer"
+        elif season_roll < 0.3:
+            scores["season"] = []
+        else:
+            scores["season"] = rng.sample(SEASONS, rng.randint(1, 3))
+        attributes = {"scores": scores}
+    return {"id": str(idx), "attributes": attributes}
+
+
+class FullScoreMatrix:
+    """Exhaustive reference: every pair scored, ranked by a stable sort."""
+
+    def __init__(self, tops, bottoms):
+        self.tops, self.bottoms = tops, bottoms
+        self.top_features, self.bottom_features = build_feature_matrices(tops, bottoms)
+        self.scores = score_feature_matrices(self.top_features, self.bottom_features)
+
+    def reasons(self, t, b):
+        return pair_reasons(
+            self.top_features.formality[t],
+            self.bottom_features.formality[b],
+            self.top_features.season_sets[t],
+            self.bottom_features.season_sets[b],
+        )
+
+    def ranked_pairs(self, limit):
+        flat = self.scores.ravel()
+        n_bottoms = self.scores.shape[1]
+        return [
+            (int(i) // n_bottoms, int(i) % n_bottoms, float(flat[i]))
+            for i in np.argsort(-flat, kind="stable")[:limit]
+        ]
+
+    def candidate(self, t, b):
+        return {
+            "top": self.tops[t],
+            "bottom": self.bottoms[b],
+            "score": float(self.scores[t, b]),
+            "reasons": self.reasons(t, b),
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_score_matrix_matches_scalar_scorer(seed):
+    rng = random.Random(seed)
+    tops = [_random_item(rng, i) for i in range(40)]
+    bottoms = [_random_item(rng, 100 + i) for i in range(30)]
+
+    matrix = FullScoreMatrix(tops, bottoms)
+
+    for t_idx, top in enumerate(tops):
+        for b_idx, bottom in enumerate(bottoms):
+            score, reasons = recommender.calculate_outfit_score(top, bottom)
+            assert matrix.scores[t_idx, b_idx] == score
+            assert matrix.reasons(t_idx, b_idx) == reasons
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+def test_best_pair_and_ranking_match_scalar_loop():
+    rng = random.Random(42)
+    tops = [_random_item(rng, i) for i in range(25)]
+    bottoms = [_random_item(rng, 100 + i) for i in range(25)]
+
+    scalar = []
+    for top in tops:
+        for bottom in bottoms:
+            score, _ = recommender.calculate_outfit_score(top, bottom)
+            scalar.append((top["id"], bottom["id"], score))
+    scalar.sort(key=lambda x: x[2], reverse=True)
+
+    matrix = FullScoreMatrix(tops, bottoms)
+    t_idx, b_idx, best = matrix.ranked_pairs(1)[0]
+    assert (tops[t_idx]["id"], bottoms[b_idx]["id"], best) == scalar[0]
+
+    ranked = [
+        (tops[t]["id"], bottoms[b]["id"], s) for t, b, s in matrix.ranked_pairs(10)
+    ]
+    assert ranked == scalar[:10]
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+@pytest.mark.parametrize("seed,k", [(0, 1), (1, 10), (2, 50), (3, 5000)])
+def test_top_k_selector_matches_full_ranking(seed, k):
+    rng = random.Random(seed)
+    tops = [_random_item(rng, i) for i in range(60)]
+    bottoms = [_random_item(rng, 100 + i) for i in range(45)]
+
+    matrix = FullScoreMatrix(tops, bottoms)
+    selector = TopKSelector(tops, bottoms)
+
+    assert selector.select(k) == matrix.ranked_pairs(k)
+    if k < 50:
+        assert selector.scored_pairs < len(tops) * len(bottoms)
+    for candidate, (t, b, _) in zip(
+        select_top_candidates(tops, bottoms, k), matrix.ranked_pairs(k)
+    ):
+        assert candidate == matrix.candidate(t, b)
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+def test_feature_vectors_score_like_attribute_trees():
+    rng = random.Random(7)
+    tops = [_random_item(rng, i) for i in range(30)]
+    bottoms = [_random_item(rng, 100 + i) for i in range(30)]
+
+    def _compact(item):
+        return {"id": item["id"], "feature_vector": encode_feature_vector(item["attributes"])}
+
+    full = FullScoreMatrix(tops, bottoms)
+    compact = FullScoreMatrix(
+        [_compact(i) for i in tops], [_compact(i) for i in bottoms]
+    )
+    assert (compact.scores == full.scores).all()
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+def test_score_cache_updates_only_changed_items():
+    rng = random.Random(11)
+    tops = [_random_item(rng, i) for i in range(20)]
+    bottoms = [_random_item(rng, 100 + i) for i in range(15)]
+    cache = OutfitScoreCache(max_users=2)
+
+    scores, _, _ = cache.score_matrix("u1", tops, bottoms)
+    assert (scores == FullScoreMatrix(tops, bottoms).scores).all()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cache.score_matrix("u1", tops, bottoms)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # 새 아이템은 저장 시점에 열만 추가되어 다음 조회는 캐시 적중
+    new_bottom = _random_item(rng, 999)
+    cache.add_item("u1", new_bottom, "BOTTOM")
+    bottoms = bottoms + [new_bottom]
+    scores, _, _ = cache.score_matrix("u1", tops, bottoms)
+    assert cache.hits == 2
+    assert (scores == FullScoreMatrix(tops, bottoms).scores).all()
+
+    # 속성이 바뀐 아이템은 해시가 달라져 해당 행만 다시 계산
+    tops[3] = {"id": tops[3]["id"], "attributes": {"scores": {"formality": 0.95}}}
+    scores, _, _ = cache.score_matrix("u1", tops, bottoms)
+    assert cache.misses == 2
+    assert (scores == FullScoreMatrix(tops, bottoms).scores).all()
+
+    cache.remove_item("u1", tops[0]["id"])
+    scores, _, _ = cache.score_matrix("u1", tops[1:], bottoms)
+    assert cache.hits == 3
+    assert (scores == FullScoreMatrix(tops[1:], bottoms).scores).all()
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+def test_score_cache_cold_fill_is_one_vectorized_pass():
+    from unittest.mock import patch
+
+    from app.domains.recommendation import score_cache
+
+    rng = random.Random(5)
+    tops = [_random_item(rng, i) for i in range(120)]
+    bottoms = [_random_item(rng, 1000 + i) for i in range(90)]
+    cache = OutfitScoreCache()
+
+    with patch.object(
+        score_cache, "pack_feature_matrices", wraps=score_cache.pack_feature_matrices
+    ) as pack:
+        scores, _, _ = cache.score_matrix("u1", tops, bottoms)
+    # 행 갱신 1회 + 열 갱신 1회 (아이템 수와 무관)
+    assert pack.call_count == 2
+    assert (scores == FullScoreMatrix(tops, bottoms).scores).all()
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+@pytest.mark.parametrize("k", [1, 10, 10_000])
+def test_rank_score_matrix_matches_stable_sort(k):
+    rng = random.Random(k)
+    tops = [_random_item(rng, i) for i in range(30)]
+    bottoms = [_random_item(rng, 100 + i) for i in range(30)]
+    matrix = FullScoreMatrix(tops, bottoms)
+    assert rank_score_matrix(matrix.scores, k) == matrix.ranked_pairs(k)
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+@pytest.mark.parametrize("temperature,k", [(3.0, 1), (10.0, 10), (-5.0, 200)])
+def test_three_piece_search_matches_exhaustive(temperature, k):
+    rng = random.Random(int(temperature) + k)
+    tops = [_random_item(rng, i) for i in range(15)]
+    bottoms = [_random_item(rng, 100 + i) for i in range(12)]
+    outers = [_random_item(rng, 200 + i) for i in range(10)]
+    for outer in outers:
+        if outer["attributes"].get("scores"):
+            outer["attributes"]["scores"]["warmth"] = round(rng.random(), 2)
+
+    search = ThreePieceSearch(tops, bottoms, outers, temperature)
+    exhaustive = []
+    for t in range(len(tops)):
+        for b in range(len(bottoms)):
+            scores = np.clip(
+                (search.pair_scores[t, b] + search.top_outer[t] + search.bottom_outer[b]) / 3
+                + search.outer_bonus,
+                0.0,
+                1.0,
+            )
+            exhaustive.extend((t, b, o, float(s)) for o, s in enumerate(scores))
+    exhaustive.sort(key=lambda x: x[3], reverse=True)
+
+    assert search.select(k) == exhaustive[:k]
+    if k < 50:
+        assert search.scored_outfits < len(exhaustive)
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+def test_outer_only_added_when_cold():
+    rng = random.Random(5)
+    tops = [_random_item(rng, i) for i in range(5)]
+    bottoms = [_random_item(rng, 100 + i) for i in range(5)]
+    outers = [_random_item(rng, 200 + i) for i in range(3)]
+
+    warm = select_top_outfits(tops, bottoms, outers, k=3, temperature=22.0)
+    cold = select_top_outfits(tops, bottoms, outers, k=3, temperature=4.0)
+    assert all("outer" not in c for c in warm)
+    assert all(c["outer"] in outers for c in cold)
+    assert outfit_temperature({"temp_min": 2, "temp_max": 10}) == 6.0
@@ -0,0 +1,111 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.domains.recommendation import router as recommendation_module
+
+
+def _item(item_id: str, main: str, formality: float, warmth: float = 0.5):
+    return SimpleNamespace(
+        id=item_id,
+        image_url=None,
+        attributes={
+            "category": {"main": main, "sub": main},
+            "scores": {"formality": formality, "warmth": warmth, "season": ["winter"]},
+        },
+    )
+
+
+ITEMS = [
+    _item("t1", "top", 0.5),
+    _item("t2", "top", 0.9),
+    _item("b1", "bottom", 0.5),
+    _item("o1", "outer", 0.5, warmth=0.9),
+    _item("o2", "outer", 0.5, warmth=0.1),
+]
+ITEMS_BY_ID = {
+    item.id: {"id": item.id, "filename": f"item_{item.id}", "attributes": item.attributes}
+    for item in ITEMS
+}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(recommendation_module.recommendation_router, prefix="/api")
+    with patch.object(recommendation_module, "list_all_items", return_value=ITEMS):
+        yield TestClient(app)
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+def test_cold_request_returns_top_bottom_and_outer(client):
+    response = client.get(
+        "/api/recommend/outfit", params={"temperature": 2, "use_llm": "false"}
+    )
+
+    assert response.status_code == 200
+    outfit = response.json()["outfits"][0]
+    assert (outfit["top"]["id"], outfit["bottom"]["id"]) == ("t1", "b1")
+    # 2°C: 따뜻한 아우터가 선택됨
+    assert outfit["outer"]["id"] == "o1"
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+def test_weather_lookup_feeds_the_llm_workflow(client):
+    async def cold_weather(db, lat, lon):
+        return {"temp_min": 0.0, "temp_max": 6.0}
+
+    def invoke(state):
+        # 워크플로우 상태에 조회한 날씨가 전달되어야 3피스 탐색이 동작
+        assert state["weather_info"] == {"temp_min": 0.0, "temp_max": 6.0}
+        outfit = {"score": 0.8, "reasons": []}
+        for role, item_id in (("top", "t1"), ("bottom", "b1"), ("outer", "o1")):
+            outfit[role] = ITEMS_BY_ID[item_id]
+        return {"final_outfits": [outfit]}
+
+    with patch(
+        "app.domains.weather.service.weather_service.get_weather_info",
+        side_effect=cold_weather,
+    ), patch.object(recommendation_module.recommender, "workflow") as workflow:
+        workflow.invoke.side_effect = invoke
+        response = client.get("/api/recommend/outfit")
+
+    assert response.json()["method"] == "gemini"
+    assert response.json()["outfits"][0]["outer"]["id"] == "o1"
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+def test_warm_request_stays_two_piece(client):
+    response = client.get(
+        "/api/recommend/outfit", params={"temperature": 24, "use_llm": "false"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["outfits"][0].get("outer") is None
+
+
+@pytest.mark.unit
+@pytest.mark.recommendation
+def test_failed_weather_lookup_does_not_force_outers(client):
+    from app.domains.recommendation.outfit_search import outfit_temperature
+    from app.domains.weather.service import weather_service
+
+    async def kma_down(*args, **kwargs):
+        raise TimeoutError("KMA timeout")
+
+    with patch.object(weather_service, "get_daily_weather_summary", side_effect=kma_down):
+        fallback = asyncio.run(weather_service.get_weather_info(None, 37.5665, 126.978))
+        response = client.get("/api/recommend/outfit", params={"use_llm": "false"})
+
+    # 자리값 0°C를 실제 기온으로 읽지 않음 (채팅/오늘의 추천 경로도 같은 함수 사용)
+    assert fallback["available"] is False
+    assert outfit_temperature(fallback) is None
+    assert response.status_code == 200
+    assert response.json()["outfits"][0].get("outer") is None
@@ -0,0 +1,96 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.signed_urls import SignedUrlService
+from app.core.storage import LocalStorage, StorageError
+
+
+def _backend() -> MagicMock:
+    backend = MagicMock()
+    backend.available = True
+    backend.public_url.side_effect = lambda path: f"https://public/{path}"
+    return backend
+
+
+@pytest.mark.unit
+def test_get_many_signs_misses_in_one_batch_and_caches():
+    backend = _backend()
+    backend.sign_many.side_effect = lambda paths, expires_in: {
+        p: f"https://signed/{p}" for p in paths
+    }
+    service = SignedUrlService(backend)
+
+    first = service.get_many(["u/a.png", "u/b.png", "https://cdn/c.png", ""])
+    second = service.get_many(["u/a.png", "u/b.png"])
+
+    assert first["u/a.png"] == "https://signed/u/a.png"
+    assert first["https://cdn/c.png"] == "https://cdn/c.png"
+    assert second == {"u/a.png": "https://signed/u/a.png", "u/b.png": "https://signed/u/b.png"}
+    backend.sign_many.assert_called_once()
+    backend.sign.assert_not_called()
+
+
+@pytest.mark.unit
+def test_lru_is_bounded_and_near_expiry_entries_refresh_in_background():
+    backend = _backend()
+    backend.sign.side_effect = lambda path, expires_in: f"s1/{path}"
+    backend.sign_many.side_effect = lambda paths, expires_in: {p: f"s2/{p}" for p in paths}
+    service = SignedUrlService(backend, max_entries=2, expires_in=600, refresh_ahead_seconds=300)
+
+    with patch("app.core.signed_urls.time.time", return_value=1000.0):
+        for path in ("a", "b", "c"):
+            service.get(path)
+    assert list(service._entries) == ["b", "c"]
+
+    # 만료 200초 전: 캐시된 URL을 바로 반환하고 재서명은 백그라운드에서
+    with patch("app.core.signed_urls.time.time", return_value=1400.0):
+        assert service.get("c") == "s1/c"
+    service._executor.shutdown(wait=True)
+    assert service._entries["c"][0] == "s2/c"
+    assert service.stats()["background_refreshes"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_local_storage_round_trip(tmp_path):
+    local = LocalStorage(str(tmp_path), "wardrobe-images", base_url="http://cdn")
+
+    await local.aupload("u/1.png", b"png-bytes", "image/png")
+    assert await local.adownload("wardrobe-images/u/1.png") == b"png-bytes"
+    assert local.sign_many(["u/1.png"], 60) == {"u/1.png": "http://cdn/wardrobe-images/u/1.png"}
+
+    with pytest.raises(StorageError):
+        local.upload("u/1.png", b"other")
+    with pytest.raises(StorageError):
+        local.upload("../escape.png", b"x", upsert=True)
+
+    await local.aremove(["u/1.png"])
+    assert not (tmp_path / "wardrobe-images" / "u" / "1.png").exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_api_signs_with_backend_coroutines_and_shares_the_cache():
+    backend = _backend()
+    backend.asign = AsyncMock(side_effect=lambda path, expires_in: f"https://signed/{path}")
+    backend.asign_many = AsyncMock(
+        side_effect=lambda paths, expires_in: {p: f"https://signed/{p}" for p in paths}
+    )
+    service = SignedUrlService(backend)
+
+    urls = await service.aget_many(["u/a.png", "u/b.png", ""])
+    assert urls == {"u/a.png": "https://signed/u/a.png", "u/b.png": "https://signed/u/b.png", "": ""}
+    assert await service.aget("u/c.png") == "https://signed/u/c.png"
+
+    # 동기 API도 같은 캐시를 봄
+    assert service.get_many(["u/a.png", "u/c.png"]) == {
+        "u/a.png": "https://signed/u/a.png",
+        "u/c.png": "https://signed/u/c.png",
+    }
+    backend.asign_many.assert_awaited_once()
+    backend.sign.assert_not_called()
+    backend.sign_many.assert_not_called()
+
+    backend.asign.side_effect = StorageError("down")
+    assert await service.aget("u/d.png") == "https://public/u/d.png"
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# 매퍼 구성을 위해 관계된 모델 모두 로드
+from app.domains.wardrobe.model import ClosetItem  # noqa: F401
+from app.domains.chat.model import ChatSession  # noqa: F401
+from app.domains.outfit.model import OutfitLog  # noqa: F401
+from app.batch.todays_pick import _active_user_ids
+
+
+@pytest.mark.unit
+def test_batch_created_picks_do_not_count_as_activity():
+    stmt = _active_user_ids(datetime(2026, 10, 10))
+    sql = str(
+        stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+    assert "users.last_active_at >= '2026-10-10 00:00:00'" in sql
+    assert "todays_picks.source != 'batch'" in sql
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.signed_urls import SignedUrlService
+from app.llm import todays_pick_service
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reused_pick_signs_urls_without_blocking_calls():
+    backend = MagicMock()
+    backend.available = True
+    backend.asign = AsyncMock(side_effect=lambda path, expires_in: f"https://signed/{path}")
+    service = SignedUrlService(backend)
+
+    top_id, bottom_id = uuid4(), uuid4()
+    schemas = {
+        str(item_id): SimpleNamespace(
+            id=str(item_id),
+            filename=f"item_{item_id}",
+            image_url=f"u/{item_id}.png",
+            attributes={"category": {"main": main}},
+        )
+        for item_id, main in ((top_id, "top"), (bottom_id, "bottom"))
+    }
+    pick = SimpleNamespace(
+        id=uuid4(),
+        top_id=top_id,
+        bottom_id=bottom_id,
+        image_url="picks/look.png",
+        reasoning="잘 어울림",
+        score=0.8,
+        weather={},
+    )
+
+    with patch("app.domains.wardrobe.service.signed_url_service", service), patch(
+        "app.domains.user.service.signed_url_service", service
+    ), patch.object(
+        todays_pick_service, "run_db", new=AsyncMock(return_value=(pick, schemas))
+    ):
+        result = await todays_pick_service.recommend_todays_pick_v2(
+            uuid4(), {"summary": "맑음"}, db=object()
+        )
+
+    assert result["image_url"] == "https://signed/picks/look.png"
+    assert result["outfit"]["top"]["image_url"] == f"https://signed/u/{top_id}.png"
+    assert result["outfit"]["bottom"]["image_url"] == f"https://signed/u/{bottom_id}.png"
+    assert backend.asign.await_count == 3
+    backend.sign.assert_not_called()
+    backend.sign_many.assert_not_called()
@@ -0,0 +1,115 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+# 매퍼 구성을 위해 관계된 모델 모두 로드
+from app.domains.user.model import User  # noqa: F401
+from app.domains.recommendation.model import TodaysPick  # noqa: F401
+from app.domains.chat.model import ChatSession  # noqa: F401
+from app.domains.outfit.model import OutfitLog  # noqa: F401
+from app.domains.wardrobe import service as wardrobe_service
+from app.domains.wardrobe.service import WardrobeManager
+
+
+def _rows(n: int):
+    base = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            created_at=base - timedelta(minutes=i),
+            image_path=f"u/{i}.png",
+            category="TOP",
+            sub_category="TSHIRT",
+            features={},
+        )
+        for i in range(n)
+    ]
+
+
+def _db(rows):
+    statements = []
+
+    def scalars(stmt):
+        statements.append(stmt)
+        limit = stmt._limit_clause.value
+        return SimpleNamespace(all=lambda: rows[:limit])
+
+    db = MagicMock()
+    db.scalars.side_effect = scalars
+    return db, statements
+
+
+@pytest.mark.unit
+def test_cursor_round_trip_and_invalid_cursor():
+    created_at = datetime(2026, 10, 1, 12, 30, tzinfo=timezone.utc)
+    item_id = uuid.uuid4()
+    cursor = wardrobe_service._encode_cursor(created_at, item_id)
+    assert wardrobe_service._decode_cursor(cursor) == (created_at, item_id)
+
+    with pytest.raises(HTTPException) as exc:
+        wardrobe_service._decode_cursor("not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.unit
+def test_page_uses_cached_total_and_returns_next_cursor():
+    rows = _rows(3)
+    db, statements = _db(rows)
+    manager = WardrobeManager()
+
+    with patch.object(manager, "count_user_items", return_value=42) as count:
+        page = manager.get_user_wardrobe_items(
+            db, uuid.uuid4(), category="outer", limit=2, resolve_image_urls=False
+        )
+
+    assert page["count"] == 2 and page["has_more"] is True
+    assert page["total_count"] == 42
+    assert count.call_args.args[2] == ["OUTER", "OUTERWEAR"]
+    assert wardrobe_service._decode_cursor(page["next_cursor"]) == (
+        rows[1].created_at,
+        rows[1].id,
+    )
+    assert statements[-1]._offset_clause is None
+
+    with patch.object(manager, "count_user_items", return_value=42):
+        last = manager.get_user_wardrobe_items(
+            db, uuid.uuid4(), cursor=page["next_cursor"], skip=5, resolve_image_urls=False
+        )
+    assert last["has_more"] is False and last["next_cursor"] is None
+    assert statements[-1]._offset_clause is None
+
+
+@pytest.mark.unit
+def test_category_count_upsert_never_goes_negative():
+    db = MagicMock()
+    WardrobeManager()._bump_category_count(db, uuid.uuid4(), "TOP", -1)
+
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (user_id, category) DO UPDATE" in sql
+    assert "greatest(closet_category_counts.item_count +" in sql
+
+
+@pytest.mark.unit
+def test_async_page_matches_sync_page():
+    import asyncio
+
+    from app.database import ThreadedSession
+
+    rows = _rows(3)
+    db, _ = _db(rows)
+    db.execute.return_value = SimpleNamespace(all=lambda: [("TOP", 40), ("OUTER", 2)])
+    manager = WardrobeManager()
+
+    page = asyncio.run(
+        manager.get_user_wardrobe_items_async(
+            ThreadedSession(db), uuid.uuid4(), limit=2, resolve_image_urls=False
+        )
+    )
+
+    assert page["count"] == 2 and page["has_more"] is True
+    assert page["total_count"] == 42
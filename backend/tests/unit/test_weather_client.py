@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.domains.weather.client import KMAWeatherClient
+
+
+def _run_with_server(statuses, scenario):
+    """``statuses`` 순서대로 응답하는 로컬 서버에 대해 ``scenario(client, calls)`` 실행"""
+    calls = []
+
+    async def handler(request):
+        calls.append(request.query["nx"])
+        status = statuses.pop(0) if statuses else 200
+        if status != 200:
+            return web.Response(status=status)
+        return web.json_response({"response": {"header": {"resultCode": "00"}}})
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/forecast", handler)
+        server = TestServer(app)
+        await server.start_server()
+        client = KMAWeatherClient(max_retries=2, backoff_seconds=0)
+        client.BASE_URL = str(server.make_url("/forecast"))
+        try:
+            return await scenario(client, calls)
+        finally:
+            await client.aclose()
+            await server.close()
+
+    return asyncio.run(main())
+
+
+@pytest.mark.unit
+def test_session_is_shared_across_calls_and_closed_by_aclose():
+    async def scenario(client, calls):
+        first = await client.fetch_forecast("20261017", "0200", 60, 127, 10)
+        session = client._session
+        results = await asyncio.gather(
+            *(client.fetch_forecast("20261017", "0200", nx, 127, 10) for nx in range(5))
+        )
+        assert client._session is session
+        assert first["response"]["header"]["resultCode"] == "00"
+        assert all(isinstance(r, dict) for r in results)
+        await client.aclose()
+        assert session.closed and client.stats()["session_open"] is False
+
+    _run_with_server([], scenario)
+
+
+@pytest.mark.unit
+def test_retries_transient_statuses_then_gives_up():
+    async def scenario(client, calls):
+        assert isinstance(await client.fetch_forecast("20261017", "0200", 1, 1, 10), dict)
+        assert len(calls) == 2
+
+        calls.clear()
+        assert await client.fetch_forecast("20261017", "0200", 2, 2, 10) is None
+        assert len(calls) == 3
+
+        calls.clear()
+        # 4xx(429 제외)는 재시도하지 않음
+        assert await client.fetch_forecast("20261017", "0200", 3, 3, 10) is None
+        assert len(calls) == 1
+        return client.stats()
+
+    stats = _run_with_server([503, 200, 503, 500, 502, 400], scenario)
+    assert stats["requests"] == 3
+    assert stats["retries"] == 3
+    assert stats["failures"] == 2
@@ -72,12 +72,13 @@ export async function uploadFaceImage(file: File) {
 }
 
 export async function fetchWardrobe(
-  params: { category?: string; skip?: number; limit?: number } = {}
+  params: { category?: string; skip?: number; limit?: number; cursor?: string } = {}
 ) {
   const search = new URLSearchParams()
   if (params.category) search.set("category", params.category)
   if (params.skip !== undefined) search.set("skip", String(params.skip))
   if (params.limit !== undefined) search.set("limit", String(params.limit))
+  if (params.cursor) search.set("cursor", params.cursor)
   const path = `${endpoints.wardrobeUsersMe}?${search.toString()}`
   return apiRequest<WardrobeResponse>(path, { auth: true })
 }
@@ -170,9 +171,14 @@ export async function createChatSession() {
   )
 }
 
-export async function fetchChatSessions(limit = 20) {
+export async function fetchChatSessions(limit = 20, cursor?: string | null) {
   const search = new URLSearchParams({ limit: String(limit) })
-  return apiRequest<{ success: boolean; items: ChatSessionSummary[] }>(
+  if (cursor) search.set("cursor", cursor)
+  return apiRequest<{
+    success: boolean
+    items: ChatSessionSummary[]
+    next_cursor?: string | null
+  }>(
     `${endpoints.chatSessions}?${search.toString()}`,
     { auth: true }
   )
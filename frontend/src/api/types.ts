@@ -57,6 +57,7 @@ export type WardrobeResponse = {
   count: number
   total_count?: number
   has_more?: boolean
+  next_cursor?: string | null
 }
 
 export type TodaysPick = {
@@ -127,8 +128,15 @@ export type ExtractionResponse = {
   storage_type?: string | null
 }
 
+export type ExtractionFailure = {
+  index: number
+  filename?: string | null
+  error: string
+}
+
 export type MultiExtractionResponse = {
   success: boolean
   items: ExtractionResponse[]
   total_processed: number
+  failed?: ExtractionFailure[]
 }